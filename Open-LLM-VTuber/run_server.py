@@ -3,6 +3,7 @@ import sys
 import atexit
 import asyncio
 import argparse
+import multiprocessing
 import subprocess
 from pathlib import Path
 # Use built-in tomllib (Python 3.11+) to avoid mypyc bundling issues with PyInstaller
@@ -149,11 +150,16 @@ def parse_args():
     parser.add_argument(
         "--hf_mirror", action="store_true", help="Use Hugging Face mirror"
     )
+    parser.add_argument(
+        "--skip_warm_up",
+        action="store_true",
+        help="Skip the warm-up inference of local ASR, TTS and VAD engines",
+    )
     return parser.parse_args()
 
 
 @logger.catch
-def run(console_log_level: str):
+def run(console_log_level: str, skip_warm_up: bool = False):
     init_logger(console_log_level)
     logger.info(f"Open-LLM-VTuber, version v{get_version()}")
 
@@ -175,6 +181,8 @@ def run(console_log_level: str):
     # Use absolute path so packaged builds don't depend on process working directory.
     config: Config = validate_config(read_yaml(str(BASE_DIR / "conf.yaml")))
     server_config = config.system_config
+    if skip_warm_up:
+        server_config.warm_up_engines = False
 
     if server_config.enable_proxy:
         logger.info("Proxy mode enabled - /proxy-ws endpoint will be available")
@@ -188,6 +196,7 @@ def run(console_log_level: str):
     try:
         asyncio.run(server.initialize())
         logger.info("Server context initialized successfully.")
+        logger.info(server.default_context_cache.startup_report.format())
     except Exception as e:
         logger.error(f"Failed to initialize server context: {e}")
         sys.exit(1)  # Exit if initialization fails
@@ -203,6 +212,8 @@ def run(console_log_level: str):
 
 
 if __name__ == "__main__":
+    # Engine worker processes are spawned from this script, also when frozen
+    multiprocessing.freeze_support()
     args = parse_args()
     console_log_level = "DEBUG" if args.verbose else "INFO"
     if args.verbose:
@@ -213,4 +224,4 @@ if __name__ == "__main__":
         )
     if args.hf_mirror:
         os.environ["HF_ENDPOINT"] = "https://hf-mirror.com"
-    run(console_log_level=console_log_level)
+    run(console_log_level=console_log_level, skip_warm_up=args.skip_warm_up)
@@ -0,0 +1,139 @@
+"""
+Micro-benchmark of the WebSocket JSON codec.
+
+Measures the encode and decode cost of typical WebSocket messages with every
+available codec (the standard library, and orjson if installed).
+
+Usage:
+    uv run python scripts/benchmark_json_codec.py [--seconds 5] [--repeat 5]
+"""
+
+import argparse
+import base64
+import os
+import random
+import sys
+import timeit
+
+# Add project root to path to enable imports
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, project_root)
+
+from src.open_llm_vtuber.utils.json_codec import JSONCodec, OrjsonCodec, orjson
+
+
+def make_audio_payload(seconds: float, forwarded: bool = False) -> dict:
+    """Audio payload as sent by the TTS manager (16 bit mono wav at 24 kHz)."""
+    wav_bytes = random.randbytes(int(seconds * 24000 * 2) + 44)
+    return {
+        "type": "audio",
+        "audio": base64.b64encode(wav_bytes).decode("utf-8"),
+        "volumes": [random.random() for _ in range(int(seconds * 50))],
+        "slice_length": 20,
+        "display_text": {
+            "text": "This is a sentence spoken by the character.",
+            "name": "Mao",
+            "avatar": "mao.png",
+        },
+        "actions": {"expressions": [3], "pictures": None, "sounds": None},
+        "forwarded": forwarded,
+    }
+
+
+def make_messages(audio_seconds: float) -> dict:
+    """Representative messages for each message type."""
+    return {
+        "control": {"type": "control", "text": "conversation-chain-start"},
+        "full-text": {"type": "full-text", "text": "Thinking..."},
+        "tool_call_status": {
+            "type": "tool_call_status",
+            "tool_id": "call_0123456789",
+            "tool_name": "get_weather",
+            "status": "completed",
+            "content": "Sunny, 24°C, light breeze from the west." * 5,
+            "timestamp": "2025-01-01T12:00:00Z",
+        },
+        "audio (silent)": {
+            **make_audio_payload(0),
+            "audio": None,
+            "volumes": [],
+            "forwarded": True,
+        },
+        f"audio ({audio_seconds:g}s)": make_audio_payload(audio_seconds),
+        "history-data": {
+            "type": "history-data",
+            "messages": [
+                {
+                    "role": "human" if i % 2 else "ai",
+                    "timestamp": "2025-01-01T12:00:00",
+                    "content": "Some message content in the chat history. " * 4,
+                    "name": "Mao",
+                    "avatar": "mao.png",
+                }
+                for i in range(200)
+            ],
+        },
+        "mic-audio-data": {
+            "type": "mic-audio-data",
+            "audio": [random.uniform(-1, 1) for _ in range(4096)],
+        },
+    }
+
+
+def measure(func, seconds: float, repeat: int) -> float:
+    """Best time per call in microseconds."""
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    number = max(1, int(number * seconds / max(elapsed, 1e-9) / repeat))
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--seconds", type=float, default=2.0, help="Time budget per measurement"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions")
+    parser.add_argument(
+        "--audio-seconds",
+        type=float,
+        default=5.0,
+        help="Length of the sentence in the audio payload",
+    )
+    args = parser.parse_args()
+
+    codecs = [JSONCodec()]
+    if orjson is not None:
+        codecs.append(OrjsonCodec())
+    else:
+        print("orjson is not installed, only measuring the standard library.\n")
+
+    messages = make_messages(args.audio_seconds)
+    header = f"{'message type':<20} {'size':>10}"
+    for codec in codecs:
+        header += f" {codec.name + ' enc':>12} {codec.name + ' dec':>12}"
+    print(header + "   (microseconds per message)")
+    print("-" * len(header))
+
+    for msg_type, message in messages.items():
+        encoded = codecs[0].dumps(message)
+        row = f"{msg_type:<20} {len(encoded) / 1024:>8.1f}KB"
+        for codec in codecs:
+            text = codec.dumps(message)
+            encode_us = measure(
+                lambda codec=codec, message=message: codec.dumps(message),
+                args.seconds,
+                args.repeat,
+            )
+            decode_us = measure(
+                lambda codec=codec, text=text: codec.loads(text),
+                args.seconds,
+                args.repeat,
+            )
+            row += f" {encode_us:>12.1f} {decode_us:>12.1f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -38,7 +38,9 @@ async def main():
 
         # Initialize and run the BiliBili Live platform
         platform = BiliBiliLivePlatform(
-            room_ids=bilibili_config.room_ids, sessdata=bilibili_config.sessdata
+            room_ids=bilibili_config.room_ids,
+            sessdata=bilibili_config.sessdata,
+            aggregation_config=config.live_config.danmaku_aggregation,
         )
 
         await platform.run()
@@ -5,6 +5,7 @@ from .agents.agent_interface import AgentInterface
 from .agents.basic_memory_agent import BasicMemoryAgent
 from .stateless_llm_factory import LLMFactory as StatelessLLMFactory
 
+from ..engine_registry import engine_registry
 from ..mcpp.tool_manager import ToolManager
 from ..mcpp.tool_executor import ToolExecutor
 from typing import Optional
@@ -53,9 +54,18 @@ class AgentFactory:
                     f"Configuration not found for LLM provider: {llm_provider}"
                 )
 
-            # Create the stateless LLM
-            llm = StatelessLLMFactory.create_llm(
-                llm_provider=llm_provider, system_prompt=system_prompt, **llm_config
+            # Create the stateless LLM, reusing the client of an identical config.
+            # Only the Claude client keeps the system prompt.
+            llm_cache_key = dict(llm_config)
+            if llm_provider == "claude_llm":
+                llm_cache_key["system_prompt"] = system_prompt
+            llm = engine_registry.get_or_create(
+                "llm",
+                llm_provider,
+                llm_cache_key,
+                lambda: StatelessLLMFactory.create_llm(
+                    llm_provider=llm_provider, system_prompt=system_prompt, **llm_config
+                ),
             )
 
             tool_prompts = kwargs.get("system_config", {}).get("tool_prompts", {})
@@ -75,6 +85,12 @@ class AgentFactory:
                     "faster_first_response", True
                 ),
                 segment_method=basic_memory_settings.get("segment_method", "pysbd"),
+                first_chunk_max_chars=basic_memory_settings.get(
+                    "first_chunk_max_chars", 60
+                ),
+                first_chunk_max_wait=basic_memory_settings.get(
+                    "first_chunk_max_wait", 1.0
+                ),
                 use_mcpp=basic_memory_settings.get("use_mcpp", False),
                 interrupt_method=interrupt_method,
                 tool_prompts=tool_prompts,
@@ -174,6 +190,9 @@ class AgentFactory:
                 ),
                 session_timeout=computer_use_config.get("session_timeout", 300.0),
                 log_screenshots=computer_use_config.get("log_screenshots", False),
+                log_screenshot_quality=computer_use_config.get(
+                    "log_screenshot_quality", 0
+                ),
                 dry_run=computer_use_config.get("dry_run", False),
             )
 
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import AsyncIterator
+from typing import Any, AsyncIterator
 from loguru import logger
 
 from ..output_types import BaseOutput
@@ -52,3 +52,40 @@ class AgentInterface(ABC):
             history_uid: str - History ID
         """
         pass
+
+    def create_session(self, tool_executor: Any = None) -> "AgentInterface":
+        """
+        Get an agent for one client session.
+
+        Agents that keep their conversation state in this process should
+        return a copy with its own memory that shares the heavyweight parts
+        (e.g. the LLM client), so sessions do not see each other's context.
+        By default the agent is shared by all sessions.
+
+        Args:
+            tool_executor: The session's tool executor, if it has its own
+
+        Returns:
+            AgentInterface - The agent to use for the session
+        """
+        return self
+
+    def get_memory_checkpoint(self) -> Any:
+        """
+        Mark the current end of the agent's working memory.
+
+        Returns:
+            Any - Checkpoint for `restore_memory_checkpoint`, or None if the
+            agent cannot roll its memory back
+        """
+        return None
+
+    def restore_memory_checkpoint(self, checkpoint: Any) -> None:
+        """
+        Forget everything added to the working memory after a checkpoint,
+        e.g. a response that was generated but never played to the user.
+
+        Args:
+            checkpoint: Any - Value returned by `get_memory_checkpoint`
+        """
+        pass
@@ -1,3 +1,4 @@
+import copy
 from typing import (
     AsyncIterator,
     List,
@@ -43,6 +44,8 @@ class BasicMemoryAgent(AgentInterface):
         tts_preprocessor_config: TTSPreprocessorConfig = None,
         faster_first_response: bool = True,
         segment_method: str = "pysbd",
+        first_chunk_max_chars: int = 60,
+        first_chunk_max_wait: float = 1.0,
         use_mcpp: bool = False,
         interrupt_method: Literal["system", "user"] = "user",
         tool_prompts: Dict[str, str] = None,
@@ -57,6 +60,8 @@ class BasicMemoryAgent(AgentInterface):
         self._tts_preprocessor_config = tts_preprocessor_config
         self._faster_first_response = faster_first_response
         self._segment_method = segment_method
+        self._first_chunk_max_chars = first_chunk_max_chars
+        self._first_chunk_max_wait = first_chunk_max_wait
         self._use_mcpp = use_mcpp
         self.interrupt_method = interrupt_method
         self._tool_prompts = tool_prompts or {}
@@ -111,6 +116,35 @@ class BasicMemoryAgent(AgentInterface):
 
         logger.info("BasicMemoryAgent initialized.")
 
+    def create_session(
+        self, tool_executor: Optional[ToolExecutor] = None
+    ) -> "BasicMemoryAgent":
+        """
+        Create a lightweight agent for one client session.
+
+        The session agent shares the LLM client, the formatted tool lists and
+        the Live2D model with this agent, but has its own memory, interrupt
+        state and chat pipeline (with its own sentence divider), so sessions
+        can chat in parallel without mixing up their context.
+
+        Args:
+            tool_executor: The session's tool executor, which reports tool
+                status to the session's client. Defaults to this agent's.
+
+        Returns:
+            BasicMemoryAgent: The session agent
+        """
+        session_agent = copy.copy(self)
+        session_agent._memory = []
+        session_agent._interrupt_handled = False
+        session_agent.prompt_mode_flag = False
+        session_agent._json_detector = StreamJSONDetector()
+        if tool_executor is not None:
+            session_agent._tool_executor = tool_executor
+        # The chat pipeline is bound to the agent it was built for
+        session_agent.chat = session_agent._chat_function_factory()
+        return session_agent
+
     def _set_llm(self, llm: StatelessLLMInterface):
         """Set the LLM for chat completion."""
         self._llm = llm
@@ -192,6 +226,15 @@ class BasicMemoryAgent(AgentInterface):
                 logger.warning(f"Skipping invalid message from history: {msg}")
         logger.info(f"Loaded {len(self._memory)} messages from history.")
 
+    def get_memory_checkpoint(self) -> int:
+        """Get the current length of the memory."""
+        return len(self._memory)
+
+    def restore_memory_checkpoint(self, checkpoint: Optional[int]) -> None:
+        """Drop the messages added to the memory after a checkpoint."""
+        if checkpoint is not None:
+            del self._memory[checkpoint:]
+
     def handle_interrupt(self, heard_response: str) -> None:
         """Handle user interruption."""
         if self._interrupt_handled:
@@ -590,6 +633,8 @@ class BasicMemoryAgent(AgentInterface):
             faster_first_response=self._faster_first_response,
             segment_method=self._segment_method,
             valid_tags=["think"],
+            first_chunk_max_chars=self._first_chunk_max_chars,
+            first_chunk_max_wait=self._first_chunk_max_wait,
         )
         async def chat_with_memory(
             input_data: BatchInput,
@@ -47,6 +47,7 @@ class ComputerUseAgent(AgentInterface):
         kill_switch_corner: str = "top_left",
         session_timeout: float = 300.0,
         log_screenshots: bool = False,
+        log_screenshot_quality: int = 0,
         dry_run: bool = False,
     ):
         """Initialize the ComputerUseAgent.
@@ -63,6 +64,8 @@ class ComputerUseAgent(AgentInterface):
             kill_switch_corner: Corner for kill switch.
             session_timeout: Session timeout in seconds.
             log_screenshots: Whether to log screenshots.
+            log_screenshot_quality: JPEG quality of logged screenshots
+                (0 to save them as captured).
             dry_run: If True, don't execute actions.
         """
         super().__init__()
@@ -91,7 +94,10 @@ class ComputerUseAgent(AgentInterface):
             rate_limit=action_rate_limit,
             session_timeout=session_timeout,
         )
-        self._action_logger = ActionLogger(log_screenshots=log_screenshots)
+        self._action_logger = ActionLogger(
+            log_screenshots=log_screenshots,
+            screenshot_quality=log_screenshot_quality or None,
+        )
 
         # Initialize execution loop
         self._execution_loop = ExecutionLoop(
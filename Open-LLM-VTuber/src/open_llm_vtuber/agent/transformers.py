@@ -13,6 +13,8 @@ def sentence_divider(
     faster_first_response: bool = True,
     segment_method: str = "pysbd",
     valid_tags: List[str] = None,
+    first_chunk_max_chars: int = 60,
+    first_chunk_max_wait: float = 1.0,
 ):
     """
     Decorator that transforms token stream into sentences with tags
@@ -21,6 +23,8 @@ def sentence_divider(
         faster_first_response: bool - Whether to enable faster first response
         segment_method: str - Method for sentence segmentation
         valid_tags: List[str] - List of valid tags to process
+        first_chunk_max_chars: int - Character budget for the first fragment
+        first_chunk_max_wait: float - Time budget in seconds for the first fragment
     """
 
     def decorator(
@@ -38,6 +42,8 @@ def sentence_divider(
                 faster_first_response=faster_first_response,
                 segment_method=segment_method,
                 valid_tags=valid_tags or [],
+                first_chunk_max_chars=first_chunk_max_chars,
+                first_chunk_max_wait=first_chunk_max_wait,
             )
             stream_from_func = func(*args, **kwargs)
 
@@ -58,6 +64,7 @@ def sentence_divider(
 def actions_extractor(live2d_model: Live2dModel):
     """
     Decorator that extracts actions from sentences, passing through dicts.
+    Emotion keywords are removed from the sentence text once extracted.
     """
 
     def decorator(
@@ -83,9 +90,16 @@ def actions_extractor(live2d_model: Live2dModel):
                         tag.state in [TagState.START, TagState.END]
                         for tag in sentence.tags
                     ):
-                        expressions = live2d_model.extract_emotion(sentence.text)
+                        # Extract the expressions and strip their keywords
+                        # from the text in a single pass
+                        expressions, text = live2d_model.extract_and_remove_emotion(
+                            sentence.text
+                        )
                         if expressions:
                             actions.expressions = expressions
+                            sentence = SentenceWithTags(
+                                text=text.strip(), tags=sentence.tags
+                            )
                     yield sentence, actions  # Yield the tuple
                 elif isinstance(item, dict):
                     # Pass through dictionaries
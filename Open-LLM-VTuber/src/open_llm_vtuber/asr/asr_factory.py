@@ -1,6 +1,11 @@
 from typing import Type
 from .asr_interface import ASRInterface
 
+# ASR systems running in this process, which benefit from a warm-up at startup
+LOCAL_ASR_SYSTEMS = frozenset(
+    {"faster_whisper", "whisper_cpp", "whisper", "fun_asr", "sherpa_onnx_asr"}
+)
+
 
 class ASRFactory:
     @staticmethod
@@ -24,6 +24,15 @@ class ASRInterface(metaclass=abc.ABCMeta):
             audio = audio.astype(np.float32)
         return await asyncio.to_thread(self.transcribe_np, audio)
 
+    def warm_up(self) -> None:
+        """Transcribe a short synthetic clip to load everything the engine
+        sets up lazily (graphs, CUDA kernels, tokenizers) before the first
+        real utterance.
+        """
+        rng = np.random.default_rng(0)
+        audio = (rng.standard_normal(self.SAMPLE_RATE) * 0.01).astype(np.float32)
+        self.transcribe_np(audio)
+
     @abc.abstractmethod
     def transcribe_np(self, audio: np.ndarray) -> str:
         """Transcribe speech audio in numpy array format and return the transcription.
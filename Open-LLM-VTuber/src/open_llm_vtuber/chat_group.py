@@ -1,9 +1,16 @@
-from typing import Dict, List, Optional, Set, Tuple, Callable, Any
+from typing import Dict, List, Optional, Set, Tuple, Callable, Any, Union
 from dataclasses import dataclass
 from fastapi import WebSocket
-import json
+import asyncio
 from loguru import logger
 
+from .client_outbox import (
+    ClientOutbox,
+    get_delivery_policy,
+    get_text_delivery_policy,
+)
+from .utils import json_codec
+
 
 @dataclass
 class Group:
@@ -186,7 +193,7 @@ async def handle_group_operation(
                     await send_group_update(client_connections[target_uid], target_uid)
                     # Notify the invited member
                     await client_connections[target_uid].send_text(
-                        json.dumps(
+                        json_codec.dumps(
                             {
                                 "type": "group-operation-result",
                                 "success": True,
@@ -204,7 +211,7 @@ async def handle_group_operation(
 
         # Send operation result to the initiator
         await client_connections[client_uid].send_text(
-            json.dumps(
+            json_codec.dumps(
                 {
                     "type": "group-operation-result",
                     "success": success,
@@ -219,7 +226,7 @@ async def handle_group_operation(
                 try:
                     await send_group_update(client_connections[target_uid], target_uid)
                     await client_connections[target_uid].send_text(
-                        json.dumps(
+                        json_codec.dumps(
                             {
                                 "type": "group-operation-result",
                                 "success": True,
@@ -243,7 +250,7 @@ async def handle_group_operation(
                         )
                         if member_uid != client_uid:
                             await client_connections[member_uid].send_text(
-                                json.dumps(
+                                json_codec.dumps(
                                     {
                                         "type": "group-operation-result",
                                         "success": True,
@@ -274,7 +281,7 @@ async def handle_client_disconnect(
         if member_uid != client_uid and member_uid in client_connections:
             await send_group_update(client_connections[member_uid], member_uid)
             await client_connections[member_uid].send_text(
-                json.dumps(
+                json_codec.dumps(
                     {
                         "type": "group-operation-result",
                         "success": True,
@@ -286,14 +293,56 @@ async def handle_client_disconnect(
 
 async def broadcast_to_group(
     group_members: List[str],
-    message: Dict[str, Any],
+    message: Union[Dict[str, Any], str, bytes],
     client_connections: Dict[str, WebSocket],
     exclude_uid: Optional[str] = None,
+    client_outboxes: Optional[Dict[str, ClientOutbox]] = None,
 ) -> None:
-    """Broadcasts a message to all members in a group except the sender"""
-    for member_uid in group_members:
-        if member_uid != exclude_uid and member_uid in client_connections:
-            try:
-                await client_connections[member_uid].send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Failed to broadcast to {member_uid}: {e}")
+    """
+    Broadcasts a message to all members in a group except the sender.
+
+    The message is encoded once for all members. Members with an outbox get
+    the message queued without waiting for delivery, so a slow member never
+    holds up the conversation; stale status messages are coalesced or dropped
+    for members that fall behind. Other members are sent to concurrently.
+
+    Args:
+        group_members: Members of the group
+        message: Message to send, either a dict or already encoded JSON
+        client_connections: Client uid to WebSocket mapping
+        exclude_uid: Member that should not receive the message
+        client_outboxes: Client uid to outbound queue mapping
+    """
+    recipients = [
+        member_uid
+        for member_uid in group_members
+        if member_uid != exclude_uid and member_uid in client_connections
+    ]
+    if not recipients:
+        return
+
+    if isinstance(message, dict):
+        text = json_codec.dumps(message)
+        policy = get_delivery_policy(message)
+    else:
+        text = json_codec.encode(message)
+        policy = get_text_delivery_policy(text)
+
+    direct_recipients = []
+    for member_uid in recipients:
+        outbox = client_outboxes.get(member_uid) if client_outboxes else None
+        if outbox:
+            outbox.put(text, *policy)
+        else:
+            direct_recipients.append(member_uid)
+
+    if not direct_recipients:
+        return
+
+    results = await asyncio.gather(
+        *(client_connections[uid].send_text(text) for uid in direct_recipients),
+        return_exceptions=True,
+    )
+    for member_uid, result in zip(direct_recipients, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to broadcast to {member_uid}: {result}")
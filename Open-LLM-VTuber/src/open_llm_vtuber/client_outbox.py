@@ -0,0 +1,467 @@
+"""Bounded per-client outbound message queues with backpressure."""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, NamedTuple, Optional
+
+from fastapi import WebSocket
+from loguru import logger
+
+from .config_manager.system import SendQueueConfig
+from .conversations.types import WebSocketSend
+from .utils import json_codec
+
+# Priority classes, lower is sent first
+PRIORITY_CONTROL = 0
+PRIORITY_STREAM = 1
+
+# Messages that do not depend on the order of the conversation stream and
+# should reach the client even if a lot of audio is queued before them
+CONTROL_MESSAGE_TYPES = {
+    "interrupt-signal",
+    "heartbeat-ack",
+    "group-update",
+    "group-operation-result",
+}
+CONTROL_SIGNALS = {"interrupt", "mic-audio-end", "start-mic"}
+
+# Output of a conversation turn that is stale once the turn is interrupted
+STREAM_MESSAGE_TYPES = {"audio", "full-text", "tool_call_status"}
+
+# Messages up to this size are parsed to classify them, larger ones are
+# conversation stream payloads such as audio or history
+CLASSIFY_MAX_CHARS = 2048
+
+# Producers waiting for room resume once the queue drains below this fraction
+# of the high-water marks
+LOW_WATER_RATIO = 0.5
+
+# Queues are never allowed to grow past this multiple of the high-water marks,
+# whatever the slow client policy is
+HARD_LIMIT_RATIO = 2
+
+
+class DeliveryPolicy(NamedTuple):
+    """How a message is queued and what may happen to it for slow clients."""
+
+    priority: int = PRIORITY_STREAM
+    coalesce_key: Optional[str] = None
+    droppable: bool = False
+    stream: bool = False
+
+
+def get_delivery_policy(message: Dict[str, Any]) -> DeliveryPolicy:
+    """
+    Decide how a message is queued and treated when its receiver falls behind.
+
+    Out-of-band control messages jump ahead of queued conversation output.
+    Status messages are superseded by newer ones of the same kind, so only the
+    latest queued one needs to be delivered. Everything else (conversation
+    signals, transcriptions, errors, audio) is essential and kept in order.
+    Audio, text and tool status of a turn are marked as stream output, which
+    is discarded when the turn is interrupted.
+
+    Args:
+        message: The message to classify
+
+    Returns:
+        DeliveryPolicy: Priority, coalesce key, whether the message may be
+        dropped when the queue is full and whether it is stream output
+    """
+    msg_type = message.get("type")
+    if msg_type in CONTROL_MESSAGE_TYPES or (
+        msg_type == "control" and message.get("text") in CONTROL_SIGNALS
+    ):
+        return DeliveryPolicy(priority=PRIORITY_CONTROL)
+    if msg_type == "full-text":
+        return DeliveryPolicy(coalesce_key="full-text", droppable=True, stream=True)
+    if msg_type == "tool_call_status":
+        return DeliveryPolicy(
+            coalesce_key=f"tool_call_status:{message.get('tool_id')}",
+            droppable=True,
+            stream=True,
+        )
+    if msg_type == "audio" and message.get("forwarded") and not message.get("audio"):
+        # Subtitles of another member's speech, only the latest one matters
+        return DeliveryPolicy(
+            coalesce_key="forwarded-display", droppable=True, stream=True
+        )
+    return DeliveryPolicy(stream=msg_type in STREAM_MESSAGE_TYPES)
+
+
+def get_text_delivery_policy(text: str) -> DeliveryPolicy:
+    """Classify an encoded message, parsing it only if it is small."""
+    if len(text) > CLASSIFY_MAX_CHARS:
+        # Audio payloads, whose type leads the message
+        msg_type = json_codec.peek_header(text).get("type")
+        return DeliveryPolicy(stream=msg_type in STREAM_MESSAGE_TYPES)
+    try:
+        message = json_codec.loads(text)
+    except ValueError:
+        return DeliveryPolicy()
+    if not isinstance(message, dict):
+        return DeliveryPolicy()
+    return get_delivery_policy(message)
+
+
+class _OutboundMessage:
+    __slots__ = ("text", "coalesce_key", "droppable", "stream", "queued_at")
+
+    def __init__(
+        self, text: str, coalesce_key: Optional[str], droppable: bool, stream: bool
+    ):
+        self.text = text
+        self.coalesce_key = coalesce_key
+        self.droppable = droppable
+        self.stream = stream
+        self.queued_at = time.monotonic()
+
+
+class ClientOutbox:
+    """
+    Outbound queue of a single client, drained by its own writer task.
+
+    Every message to the client goes through the outbox, so the writer task is
+    the only coroutine that touches the socket. Control messages are sent
+    before queued conversation output; within a priority class the order is
+    kept. When the queued messages or bytes reach a high-water mark, queued
+    status messages are replaced by newer ones and droppable messages are
+    evicted first, then the slow client policy applies:
+
+    - ``wait``: `send_text` waits until the queue drains below the low-water
+      mark, so the producing conversation slows down to the client's pace.
+      A client that does not drain within `slow_client_timeout` is dropped.
+    - ``drop``: producers never wait; only stale messages are shed.
+    - ``disconnect``: the client is disconnected.
+
+    `put` (used for group broadcasts) never waits, so one slow member cannot
+    hold up a group. Queues never grow past twice the high-water marks; a
+    client that gets there is disconnected whatever the policy.
+    """
+
+    def __init__(
+        self,
+        client_uid: str,
+        websocket_send: WebSocketSend,
+        config: Optional[SendQueueConfig] = None,
+        on_slow_client: Optional[Callable[[], Awaitable[None]]] = None,
+    ):
+        """
+        Initialize the outbox.
+
+        Args:
+            client_uid: Client the messages are sent to
+            websocket_send: Function that sends text to the client
+            config: High-water marks and slow client policy
+            on_slow_client: Called once when the client is disconnected for
+                falling behind, e.g. to close its WebSocket
+        """
+        config = config or SendQueueConfig()
+        self.client_uid = client_uid
+        self._websocket_send = websocket_send
+        self._on_slow_client = on_slow_client
+        self.max_messages = max(1, config.max_messages)
+        self.max_bytes = max(1, int(config.max_queued_mb * 1024 * 1024))
+        self.slow_client_policy = config.slow_client_policy
+        self.slow_client_timeout = config.slow_client_timeout
+
+        self._queues: Dict[int, Deque[_OutboundMessage]] = {
+            PRIORITY_CONTROL: deque(),
+            PRIORITY_STREAM: deque(),
+        }
+        self._queued_bytes = 0
+        self._has_messages = asyncio.Event()
+        self._has_room = asyncio.Event()
+        self._has_room.set()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._slow_client_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        # Metrics
+        self.sent_messages = 0
+        self.sent_bytes = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.discarded = 0
+        self.producer_waits = 0
+        self.peak_messages = 0
+        self.peak_bytes = 0
+        self.max_queue_delay = 0.0
+        self._total_queue_delay = 0.0
+        self.disconnect_reason: Optional[str] = None
+
+    def start(self) -> None:
+        """Start the writer task."""
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._run())
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def pending(self) -> int:
+        """Number of messages waiting to be sent."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    @property
+    def pending_bytes(self) -> int:
+        """Size of the messages waiting to be sent."""
+        return self._queued_bytes
+
+    def _above_high_water(self) -> bool:
+        return self.pending >= self.max_messages or self._queued_bytes >= self.max_bytes
+
+    def _below_low_water(self) -> bool:
+        return (
+            self.pending <= self.max_messages * LOW_WATER_RATIO
+            and self._queued_bytes <= self.max_bytes * LOW_WATER_RATIO
+        )
+
+    def _above_hard_limit(self) -> bool:
+        return (
+            self.pending >= self.max_messages * HARD_LIMIT_RATIO
+            or self._queued_bytes >= self.max_bytes * HARD_LIMIT_RATIO
+        )
+
+    async def send_text(self, text: str) -> None:
+        """
+        Queue an encoded message, waiting for room if the policy says so.
+
+        Drop-in replacement for `WebSocket.send_text` for producers.
+
+        Raises:
+            ConnectionError: If the outbox is closed
+        """
+        policy = get_text_delivery_policy(text)
+        if (
+            self.slow_client_policy == "wait"
+            and policy.priority != PRIORITY_CONTROL
+            and not self._closed
+            and not self._has_room.is_set()
+        ):
+            self.producer_waits += 1
+            try:
+                await asyncio.wait_for(
+                    self._has_room.wait(), timeout=self.slow_client_timeout
+                )
+            except asyncio.TimeoutError:
+                self._disconnect_slow_client(
+                    f"queue did not drain within {self.slow_client_timeout}s"
+                )
+
+        if not self.put(text, *policy) and self._closed:
+            raise ConnectionError(f"Connection to client {self.client_uid} is closed")
+
+    def put(
+        self,
+        text: str,
+        priority: int = PRIORITY_STREAM,
+        coalesce_key: Optional[str] = None,
+        droppable: bool = False,
+        stream: bool = False,
+    ) -> bool:
+        """
+        Queue an encoded message without waiting for it to be sent.
+
+        Args:
+            text: Encoded message
+            priority: Priority class of the message
+            coalesce_key: Queued messages with the same key are replaced
+            droppable: Whether the message may be dropped when the queue is full
+            stream: Whether the message is output of a conversation turn
+
+        Returns:
+            bool: Whether the message was queued
+        """
+        if self._closed:
+            return False
+
+        if coalesce_key is not None and self._remove_queued(coalesce_key):
+            self.coalesced += 1
+
+        while self._above_high_water() and self._evict_droppable():
+            pass
+
+        if self._above_high_water():
+            if droppable:
+                self.dropped += 1
+                logger.debug(f"Dropped stale message for slow client {self.client_uid}")
+                return False
+            if self.slow_client_policy == "disconnect" or self._above_hard_limit():
+                self._disconnect_slow_client(
+                    f"{self.pending} messages / {self._queued_bytes} bytes queued"
+                )
+                return False
+
+        message = _OutboundMessage(text, coalesce_key, droppable, stream)
+        self._queues[priority].append(message)
+        self._queued_bytes += len(text)
+        self.peak_messages = max(self.peak_messages, self.pending)
+        self.peak_bytes = max(self.peak_bytes, self._queued_bytes)
+        if self._above_high_water():
+            self._has_room.clear()
+        self._has_messages.set()
+        return True
+
+    def _remove(
+        self, queue: Deque[_OutboundMessage], message: _OutboundMessage
+    ) -> None:
+        queue.remove(message)
+        self._queued_bytes -= len(message.text)
+
+    def _remove_queued(self, coalesce_key: str) -> bool:
+        """Remove the queued message with the given coalesce key, if any."""
+        for queue in self._queues.values():
+            for queued in queue:
+                if queued.coalesce_key == coalesce_key:
+                    self._remove(queue, queued)
+                    return True
+        return False
+
+    def _evict_droppable(self) -> bool:
+        """Evict the oldest droppable message to make room."""
+        for queue in self._queues.values():
+            for queued in queue:
+                if queued.droppable:
+                    self._remove(queue, queued)
+                    self.dropped += 1
+                    return True
+        return False
+
+    def discard_stream(self) -> int:
+        """
+        Drop the queued output of interrupted conversation turns.
+
+        Audio and text of a turn that are still queued when it is interrupted
+        would otherwise be played after the interrupt. Control messages,
+        conversation signals and replies to requests are kept.
+
+        Returns:
+            int: Number of discarded messages
+        """
+        queue = self._queues[PRIORITY_STREAM]
+        kept = deque(message for message in queue if not message.stream)
+        discarded = len(queue) - len(kept)
+        if discarded:
+            self._queues[PRIORITY_STREAM] = kept
+            self._queued_bytes = sum(
+                len(message.text) for q in self._queues.values() for message in q
+            )
+            self.discarded += discarded
+            if not self._has_room.is_set() and self._below_low_water():
+                self._has_room.set()
+            logger.debug(
+                f"Discarded {discarded} queued stream messages for {self.client_uid}"
+            )
+        return discarded
+
+    def _pop_next(self) -> Optional[_OutboundMessage]:
+        """Take the next message to send, control messages first."""
+        for queue in self._queues.values():
+            if queue:
+                message = queue.popleft()
+                self._queued_bytes -= len(message.text)
+                if not self._has_room.is_set() and self._below_low_water():
+                    self._has_room.set()
+                return message
+        return None
+
+    async def _run(self) -> None:
+        """Send queued messages until closed or the connection fails."""
+        try:
+            while True:
+                await self._has_messages.wait()
+                while (message := self._pop_next()) is not None:
+                    delay = time.monotonic() - message.queued_at
+                    self.max_queue_delay = max(self.max_queue_delay, delay)
+                    self._total_queue_delay += delay
+                    await self._websocket_send(message.text)
+                    self.sent_messages += 1
+                    self.sent_bytes += len(message.text)
+                self._has_messages.clear()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to send to client {self.client_uid}: {e}")
+            self._close_queue()
+
+    def _close_queue(self) -> None:
+        """Discard unsent messages and release waiting producers."""
+        self._closed = True
+        for queue in self._queues.values():
+            queue.clear()
+        self._queued_bytes = 0
+        self._has_room.set()
+
+    def _disconnect_slow_client(self, reason: str) -> None:
+        """Give up on a client that cannot keep up."""
+        if self._closed:
+            return
+        self.disconnect_reason = reason
+        logger.warning(
+            f"Disconnecting slow client {self.client_uid}: {reason} "
+            f"(policy: {self.slow_client_policy})"
+        )
+        self._close_queue()
+        if self._writer_task and not self._writer_task.done():
+            # The writer is most likely stuck in a send to the client
+            self._writer_task.cancel()
+        if self._on_slow_client:
+            self._slow_client_task = asyncio.create_task(self._on_slow_client())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue metrics of the client."""
+        return {
+            "pending_messages": self.pending,
+            "pending_bytes": self._queued_bytes,
+            "peak_messages": self.peak_messages,
+            "peak_bytes": self.peak_bytes,
+            "sent_messages": self.sent_messages,
+            "sent_bytes": self.sent_bytes,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "discarded": self.discarded,
+            "producer_waits": self.producer_waits,
+            "avg_queue_delay_ms": (
+                self._total_queue_delay / self.sent_messages * 1000
+                if self.sent_messages
+                else 0.0
+            ),
+            "max_queue_delay_ms": self.max_queue_delay * 1000,
+            "disconnect_reason": self.disconnect_reason,
+        }
+
+    async def aclose(self) -> None:
+        """Stop the writer task and discard unsent messages."""
+        self._close_queue()
+        if self._writer_task and not self._writer_task.done():
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+        self._writer_task = None
+
+
+class QueuedWebSocket:
+    """
+    A client WebSocket whose sends go through the client's outbox.
+
+    Receiving and everything else is delegated to the wrapped WebSocket, so
+    it can be handed to code that expects a `WebSocket`.
+    """
+
+    def __init__(self, websocket: WebSocket, outbox: ClientOutbox):
+        self.websocket = websocket
+        self.outbox = outbox
+
+    async def send_text(self, data: str) -> None:
+        await self.outbox.send_text(data)
+
+    async def send_json(self, data: Any, mode: str = "text") -> None:
+        await self.outbox.send_text(json_codec.dumps(data))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.websocket, name)
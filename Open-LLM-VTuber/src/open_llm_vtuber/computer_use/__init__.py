@@ -24,6 +24,7 @@ from .types import (
     ComputerAction,
     ActionResult,
     ScreenCapture,
+    ScreenChange,
     KillSwitchCorner,
     LLMActionResponse,
     SessionState,
@@ -34,7 +35,7 @@ from .safety import SafetyManager
 from .logger import ActionLogger
 from .execution_loop import ExecutionLoop
 from .session import ComputerUseSession
-from .window_manager import WindowManager, WindowInfo
+from .window_manager import WindowManager, WindowInfo, WindowBackend, DesktopSnapshot
 
 __all__ = [
     # Types
@@ -50,6 +51,7 @@ __all__ = [
     "ComputerAction",
     "ActionResult",
     "ScreenCapture",
+    "ScreenChange",
     "KillSwitchCorner",
     "LLMActionResponse",
     "SessionState",
@@ -62,4 +64,6 @@ __all__ = [
     "ComputerUseSession",
     "WindowManager",
     "WindowInfo",
+    "WindowBackend",
+    "DesktopSnapshot",
 ]
@@ -148,7 +148,10 @@ class ExecutionLoop:
 
                 # Capture screen
                 yield {"type": "status", "message": "Capturing screen..."}
-                capture, llm_image = self.vision_engine.capture_for_analysis()
+                (
+                    capture,
+                    llm_image,
+                ) = await self.vision_engine.capture_for_analysis_async()
 
                 # Build messages for LLM
                 user_message = build_user_message(
@@ -237,7 +240,7 @@ class ExecutionLoop:
                 screenshot_after = None
                 if self.verify_after_action:
                     await asyncio.sleep(0.3)  # Brief pause for UI to update
-                    screenshot_after = self.vision_engine.capture_screen()
+                    screenshot_after = await self.vision_engine.capture_screen_async()
 
                 # Log the action
                 self.action_logger.log_action(
@@ -286,7 +289,7 @@ class ExecutionLoop:
         finally:
             # End session
             self.safety_manager.end_session()
-            self.action_logger.end_session(
+            await self.action_logger.aend_session(
                 success=not self._current_session.is_active,
                 reason="completed"
                 if not self._current_session.is_active
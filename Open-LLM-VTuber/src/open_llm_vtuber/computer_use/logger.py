@@ -2,9 +2,19 @@
 
 This module provides logging functionality for all computer use actions,
 enabling audit trails and user review of agent behavior.
+
+Disk writes happen on a background thread so logging never adds file I/O
+latency to the agent loop.
 """
 
+import asyncio
+import base64
+import io
 import json
+import queue
+import threading
+import time
+from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -12,6 +22,18 @@ from loguru import logger
 
 from .types import ActionResult, ScreenCapture
 
+# Log lines / files written per batch by the background writer
+WRITE_BATCH_SIZE = 64
+# Seconds the writer collects entries before writing a partial batch
+WRITE_FLUSH_INTERVAL = 0.5
+
+
+class _FlushRequest:
+    """Marker queued to wait until everything queued before it is written."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
 
 class ActionLogger:
     """Logs all computer use actions for audit and review.
@@ -23,6 +45,8 @@ class ActionLogger:
         log_dir: Directory for storing logs.
         log_screenshots: Whether to save screenshots.
         session_id: Current session identifier.
+        dropped_screenshots: Screenshots skipped because too many were pending.
+        dropped_entries: Log entries dropped because too many were pending.
     """
 
     def __init__(
@@ -30,6 +54,9 @@ class ActionLogger:
         log_dir: str | Path = "logs/computer_use",
         log_screenshots: bool = False,
         max_log_size_mb: int = 100,
+        screenshot_quality: int | None = None,
+        max_pending_entries: int = 1000,
+        max_pending_screenshot_mb: int = 50,
     ):
         """Initialize the ActionLogger.
 
@@ -37,11 +64,26 @@ class ActionLogger:
             log_dir: Directory to store log files.
             log_screenshots: Whether to save screenshots with logs.
             max_log_size_mb: Maximum size of log directory in MB.
+            screenshot_quality: Re-encode saved screenshots at this JPEG
+                quality to save disk space (None to save them as captured).
+            max_pending_entries: Maximum entries waiting for the writer. When
+                full, new log entries are dropped and counted.
+            max_pending_screenshot_mb: Maximum screenshot data waiting for
+                the writer. Screenshots over the limit are skipped.
         """
         self.log_dir = Path(log_dir)
         self.log_screenshots = log_screenshots
         self.max_log_size_mb = max_log_size_mb
+        self.screenshot_quality = screenshot_quality
+        self.max_pending_screenshot_bytes = max_pending_screenshot_mb * 1024 * 1024
         self.session_id: str | None = None
+        self.dropped_screenshots = 0
+        self.dropped_entries = 0
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending_entries)
+        self._writer_thread: threading.Thread | None = None
+        self._pending_screenshot_bytes = 0
+        self._pending_lock = threading.Lock()
 
         self._current_session_dir: Path | None = None
         self._action_log_file: Path | None = None
@@ -93,12 +135,38 @@ class ActionLogger:
     ) -> None:
         """End the current logging session.
 
+        Blocks until the session's log is written; use `aend_session` from
+        async code.
+
         Args:
             success: Whether the session achieved its goal.
             reason: Reason for ending (e.g., "completed", "timeout", "kill_switch").
         """
+        if self._finish_session(success, reason):
+            self.flush()
+
+    async def aend_session(
+        self,
+        success: bool = False,
+        reason: str | None = None,
+    ) -> None:
+        """End the current logging session without blocking the event loop.
+
+        Args:
+            success: Whether the session achieved its goal.
+            reason: Reason for ending (e.g., "completed", "timeout", "kill_switch").
+        """
+        if self._finish_session(success, reason):
+            await self.aflush()
+
+    def _finish_session(self, success: bool, reason: str | None) -> bool:
+        """Queue the session end entry and reset the session state.
+
+        Returns:
+            True if a session was active.
+        """
         if not self.session_id:
-            return
+            return False
 
         session_end = {
             "event": "session_end",
@@ -118,6 +186,7 @@ class ActionLogger:
         self.session_id = None
         self._current_session_dir = None
         self._action_log_file = None
+        return True
 
     def log_action(
         self,
@@ -266,7 +335,7 @@ class ActionLogger:
         logger.warning(f"Safety event ({event_type}): {details}")
 
     def _write_log_entry(self, entry: dict[str, Any]) -> None:
-        """Write a log entry to the JSONL file.
+        """Queue a log entry for the JSONL file.
 
         Args:
             entry: Dictionary to write as JSON.
@@ -274,43 +343,171 @@ class ActionLogger:
         if not self._action_log_file:
             return
 
+        # Serialize now, the entry may be changed after this call
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
         try:
-            with open(self._action_log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
-        except Exception as e:
-            logger.error(f"Failed to write log entry: {e}")
+            # Never block the caller (usually the event loop) on a slow disk,
+            # and never write the line from here, which could reorder or
+            # interleave it with the writer's lines
+            self._enqueue(("log", self._action_log_file, line))
+        except queue.Full:
+            self.dropped_entries += 1
+            logger.warning("Dropped computer use log entry: log queue full")
 
     def _save_screenshot(
         self,
         capture: ScreenCapture,
         filename_prefix: str,
     ) -> Path | None:
-        """Save a screenshot to the session directory.
+        """Queue a screenshot to be saved in the session directory.
 
         Args:
             capture: The screenshot to save.
             filename_prefix: Prefix for the filename.
 
         Returns:
-            Path to saved file, or None if failed.
+            Path the file will be saved to, or None if it was skipped.
         """
         if not self._current_session_dir:
             return None
 
+        size = len(capture.image_base64)
+        with self._pending_lock:
+            if (
+                self._pending_screenshot_bytes + size
+                > self.max_pending_screenshot_bytes
+            ):
+                self.dropped_screenshots += 1
+                logger.warning(
+                    f"Skipping screenshot {filename_prefix}: too many screenshots pending"
+                )
+                return None
+            self._pending_screenshot_bytes += size
+
+        filepath = self._current_session_dir / f"{filename_prefix}.jpg"
+        try:
+            self._enqueue(("screenshot", filepath, capture.image_base64))
+        except queue.Full:
+            with self._pending_lock:
+                self._pending_screenshot_bytes -= size
+            self.dropped_screenshots += 1
+            logger.warning(f"Skipping screenshot {filename_prefix}: log queue full")
+            return None
+        return filepath
+
+    def _enqueue(self, item: Any) -> None:
+        """Queue an item for the writer thread, starting it if needed.
+
+        Args:
+            item: Item to queue.
+
+        Raises:
+            queue.Full: If max_pending_entries items are still queued.
+        """
+        if self._writer_thread is None or not self._writer_thread.is_alive():
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, name="ActionLogWriter", daemon=True
+            )
+            self._writer_thread.start()
+        self._queue.put_nowait(item)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything queued so far has been written to disk.
+
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            True if everything was written in time.
+        """
+        if self._writer_thread is None or not self._writer_thread.is_alive():
+            return True
+        request = _FlushRequest()
         try:
-            import base64
+            self._queue.put(request, timeout=timeout)
+        except queue.Full:
+            logger.warning("Timed out flushing computer use logs")
+            return False
+        return request.done.wait(timeout)
 
-            filepath = self._current_session_dir / f"{filename_prefix}.jpg"
-            image_data = base64.b64decode(capture.image_base64)
+    async def aflush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything queued so far is written, without blocking.
 
-            with open(filepath, "wb") as f:
-                f.write(image_data)
+        Args:
+            timeout: Maximum seconds to wait.
 
-            return filepath
+        Returns:
+            True if everything was written in time.
+        """
+        return await asyncio.to_thread(self.flush, timeout)
+
+    def _writer_loop(self) -> None:
+        """Write queued entries in batches until the process exits."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + WRITE_FLUSH_INTERVAL
+            try:
+                while len(batch) < WRITE_BATCH_SIZE and not isinstance(
+                    batch[-1], _FlushRequest
+                ):
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                pass
+            self._write_batch(batch)
+
+    def _write_batch(self, batch: list[Any]) -> None:
+        """Write a batch of queued items, one append per log file."""
+        lines_by_file: dict[Path, list[str]] = defaultdict(list)
+        flush_requests = []
+
+        for item in batch:
+            if isinstance(item, _FlushRequest):
+                flush_requests.append(item)
+                continue
+            kind, path, data = item
+            if kind == "log":
+                lines_by_file[path].append(data)
+            else:
+                self._write_screenshot(path, data)
+                with self._pending_lock:
+                    self._pending_screenshot_bytes -= len(data)
+
+        for path, lines in lines_by_file.items():
+            self._write_lines(path, lines)
+
+        for request in flush_requests:
+            request.done.set()
+
+    def _write_lines(self, path: Path, lines: list[str]) -> None:
+        """Append lines to a log file."""
+        try:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+        except Exception as e:
+            logger.error(f"Failed to write log entry: {e}")
+
+    def _write_screenshot(self, path: Path, image_base64: str) -> None:
+        """Decode, optionally recompress, and write a screenshot."""
+        try:
+            image_data = base64.b64decode(image_base64)
+
+            if self.screenshot_quality:
+                from PIL import Image
+
+                output = io.BytesIO()
+                Image.open(io.BytesIO(image_data)).save(
+                    output, format="JPEG", quality=self.screenshot_quality
+                )
+                image_data = output.getvalue()
+
+            with open(path, "wb") as f:
+                f.write(image_data)
 
         except Exception as e:
             logger.error(f"Failed to save screenshot: {e}")
-            return None
 
     def get_session_log_path(self) -> Path | None:
         """Get the path to the current session log.
@@ -16,10 +16,14 @@ from .action_handler import ActionHandler
 from .vision_engine import VisionEngine
 from .safety import SafetyManager
 from .logger import ActionLogger
-from .types import KillSwitchCorner
+from .types import KillSwitchCorner, ScreenCapture, ScreenChange
 from .window_manager import WindowManager
 from ..config_manager.computer_use import ComputerUseConfig
 
+# Backoff while waiting for an unchanged screen to change
+UNCHANGED_SCREEN_BACKOFF_BASE = 0.5
+UNCHANGED_SCREEN_BACKOFF_MAX = 4.0
+
 
 class ComputerUseSession:
     """
@@ -50,7 +54,11 @@ class ComputerUseSession:
 
         # Initialize components
         self.action_handler = ActionHandler(dry_run=config.dry_run)
-        self.vision_engine = VisionEngine(scale_factor=config.screenshot_scale)
+        self.vision_engine = VisionEngine(
+            scale_factor=config.screenshot_scale,
+            image_token_budget=config.image_token_budget or None,
+            max_jpeg_bytes=config.screenshot_max_kb * 1024 or None,
+        )
 
         # Parse kill switch corner
         corner_map = {
@@ -70,10 +78,13 @@ class ComputerUseSession:
             on_kill_switch=self._on_kill_switch,
         )
         self._max_actions = config.max_actions_per_session
-        self.action_logger = ActionLogger(log_screenshots=config.log_screenshots)
+        self.action_logger = ActionLogger(
+            log_screenshots=config.log_screenshots,
+            screenshot_quality=config.log_screenshot_quality or None,
+        )
 
         # Initialize window manager for desktop layout detection
-        self.window_manager = WindowManager()
+        self.window_manager = WindowManager(snapshot_ttl=config.desktop_snapshot_ttl)
 
         # Session state
         self._running = False
@@ -82,6 +93,10 @@ class ComputerUseSession:
         self._consecutive_same_action = 0
         self._last_action_key = ""
         self._last_error: Optional[str] = None
+        # Screen change detection
+        self._last_analyzed_capture: Optional[ScreenCapture] = None
+        self._unchanged_skips = 0
+        self._skipped_llm_calls = 0
 
         logger.info("ComputerUseSession initialized (Advanced Autonomous Agent)")
 
@@ -159,6 +174,9 @@ class ComputerUseSession:
         self._consecutive_same_action = 0
         self._last_action_key = ""
         self._last_error = None
+        self._last_analyzed_capture = None
+        self._unchanged_skips = 0
+        self._skipped_llm_calls = 0
 
         # Start safety monitoring and logging
         self.safety_manager.start_session()
@@ -166,6 +184,9 @@ class ComputerUseSession:
 
         session_id = str(uuid.uuid4())[:8]
         self.action_logger.start_session(session_id, goal)
+        # Keep the desktop snapshot fresh in the background
+        self.window_manager.start()
+        await self.window_manager.wait_for_snapshot()
 
         logger.info(f"🚀 Starting autonomous session for: {goal}")
         logger.info(f"   OS: {self.os_type} | Max actions: {self._max_actions}")
@@ -180,6 +201,7 @@ class ComputerUseSession:
             }
         )
 
+        end_reason = "stopped"
         try:
             while self._running:
                 # Safety checks
@@ -192,6 +214,7 @@ class ComputerUseSession:
                             "message": "Session stopped by safety kill switch",
                         }
                     )
+                    end_reason = "kill_switch"
                     break
 
                 if self._action_count >= self._max_actions:
@@ -203,11 +226,12 @@ class ComputerUseSession:
                             "message": f"Reached maximum actions ({self._max_actions})",
                         }
                     )
+                    end_reason = "max_actions"
                     break
 
                 # 1. Capture screen
                 try:
-                    screen_capture = self.vision_engine.capture_screen()
+                    screen_capture = await self.vision_engine.capture_screen_async()
                     screenshot_b64 = screen_capture.image_base64
                     screen_size = (
                         screen_capture.original_width,
@@ -218,6 +242,25 @@ class ComputerUseSession:
                     await asyncio.sleep(1)
                     continue
 
+                # Don't ask the LLM again while nothing changed on screen
+                screen_change = self._detect_screen_change(screen_capture)
+                if screen_change and self._should_skip_unchanged(screen_change):
+                    self._unchanged_skips += 1
+                    self._skipped_llm_calls += 1
+                    backoff = min(
+                        UNCHANGED_SCREEN_BACKOFF_MAX,
+                        UNCHANGED_SCREEN_BACKOFF_BASE
+                        * 2 ** (self._unchanged_skips - 1),
+                    )
+                    logger.debug(
+                        f"Screen unchanged ({screen_change.changed_fraction:.2%}), "
+                        f"waiting {backoff}s before recapturing"
+                    )
+                    await asyncio.sleep(backoff)
+                    continue
+                self._unchanged_skips = 0
+                self._last_analyzed_capture = screen_capture
+
                 # 2. Send "thinking" status
                 await self._send_ws(
                     {
@@ -230,7 +273,7 @@ class ComputerUseSession:
 
                 # 3. Get action from AI
                 ai_response = await self._get_ai_action(
-                    goal, screenshot_b64, screen_size
+                    goal, screenshot_b64, screen_size, screen_change
                 )
 
                 # 4. Check if task is done
@@ -248,6 +291,7 @@ class ComputerUseSession:
                             "thought": ai_response.get("thinking", "Goal achieved"),
                         }
                     )
+                    end_reason = "completed"
                     break
 
                 # 5. Extract and validate action
@@ -279,6 +323,7 @@ class ComputerUseSession:
                             "message": "Task appears complete (action stabilized)",
                         }
                     )
+                    end_reason = "completed"
                     break
 
                 # 7. Rate limit check
@@ -331,6 +376,8 @@ class ComputerUseSession:
                 )
 
                 self.safety_manager.record_action()
+                # The action may have changed the windows; refresh during the pause
+                self.window_manager.request_refresh()
                 if result and hasattr(result, "action_type"):
                     self.action_logger.log_action(result)
 
@@ -352,6 +399,7 @@ class ComputerUseSession:
                 await asyncio.sleep(1.0 / self.config.action_rate_limit)
 
         except asyncio.CancelledError:
+            end_reason = "cancelled"
             logger.info("Session cancelled")
             await self._send_ws(
                 {
@@ -361,6 +409,7 @@ class ComputerUseSession:
                 }
             )
         except Exception as e:
+            end_reason = "error"
             logger.error(f"Session error: {e}", exc_info=True)
             await self._send_ws(
                 {"type": "computer_use_status", "status": "error", "error": str(e)}
@@ -368,7 +417,18 @@ class ComputerUseSession:
         finally:
             self._running = False
             self.safety_manager.end_session()
-            logger.info(f"Session ended. Total actions: {self._action_count}")
+            self.window_manager.stop()
+            # Also flushes the queued log writes of this session
+            await self.action_logger.aend_session(
+                success=end_reason == "completed", reason=end_reason
+            )
+            logger.info(
+                f"Session ended. Total actions: {self._action_count}, "
+                f"skipped LLM calls on unchanged screens: {self._skipped_llm_calls}"
+            )
+            logger.info(
+                f"Average screen capture timings (ms): {self.vision_engine.get_timing_stats()}"
+            )
             await self._send_ws(
                 {
                     "type": "computer_use_status",
@@ -378,6 +438,24 @@ class ComputerUseSession:
                 }
             )
 
+    def _detect_screen_change(self, capture: ScreenCapture) -> Optional[ScreenChange]:
+        """Compare a capture with the last one sent to the LLM."""
+        if not self.config.skip_unchanged_screens or not self._last_analyzed_capture:
+            return None
+        return self.vision_engine.compare_captures(self._last_analyzed_capture, capture)
+
+    def _should_skip_unchanged(self, screen_change: ScreenChange) -> bool:
+        """Whether to wait for the screen to change instead of calling the LLM.
+
+        A "wait" decision is simply kept while the screen stays the same. After
+        other actions the UI may still be settling, so the screen is rechecked
+        with backoff; after max_unchanged_skips the LLM is asked anyway.
+        """
+        return (
+            screen_change.changed_fraction < self.config.screen_change_threshold
+            and self._unchanged_skips < self.config.max_unchanged_skips
+        )
+
     def _get_fallback_action(self, goal: str) -> dict:
         """Get OS-specific fallback action for common tasks."""
         goal_lower = goal.lower()
@@ -472,7 +550,11 @@ class ComputerUseSession:
         return action
 
     async def _get_ai_action(
-        self, goal: str, screenshot_b64: str, screen_size: tuple
+        self,
+        goal: str,
+        screenshot_b64: str,
+        screen_size: tuple,
+        screen_change: Optional[ScreenChange] = None,
     ) -> dict:
         """Get the next action from the AI vision model."""
         from .prompts import (
@@ -542,6 +624,14 @@ class ComputerUseSession:
         user_message += desktop_layout
         user_message += target_app_info
 
+        # Tell the model what its last action changed
+        if screen_change and self._action_history:
+            if screen_change.changed_fraction < self.config.screen_change_threshold:
+                user_message += "\n\n⚠️ NOTE: The screen did NOT visibly change after your last action."
+            elif screen_change.region:
+                x, y, w, h = screen_change.region
+                user_message += f"\n\n🔎 Changed screen region since last step: ({x}, {y}) size {w}x{h}"
+
         # Add OS-specific hints
         os_hints = get_os_specific_hint(goal, self.os_type)
         if os_hints:
@@ -717,3 +807,4 @@ class ComputerUseSession:
         logger.info("Stop requested for computer use session")
         self._running = False
         self.safety_manager.end_session()
+        self.window_manager.stop()
@@ -181,6 +181,24 @@ class ScreenCapture(BaseModel):
     original_height: int | None = Field(
         default=None, description="Original height before scaling"
     )
+    fingerprint: bytes | None = Field(
+        default=None,
+        exclude=True,
+        repr=False,
+        description="Downsampled grayscale thumbnail used for change detection",
+    )
+
+
+class ScreenChange(BaseModel):
+    """Difference between two screen captures."""
+
+    changed_fraction: float = Field(
+        ..., ge=0.0, le=1.0, description="Fraction of the screen tiles that changed"
+    )
+    region: tuple[int, int, int, int] | None = Field(
+        default=None,
+        description="Bounding box (x, y, width, height) of the change in screen coordinates",
+    )
 
 
 class LLMActionResponse(BaseModel):
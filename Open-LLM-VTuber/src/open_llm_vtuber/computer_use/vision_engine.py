@@ -4,17 +4,63 @@ This module provides the VisionEngine class that captures screenshots
 using MSS and communicates with vision-capable LLMs for UI analysis.
 """
 
+import asyncio
 import base64
 import io
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from loguru import logger
 
-from .types import ScreenCapture
+from .types import ScreenCapture, ScreenChange
 
 # Lazy imports for optional dependencies
 _mss = None
 _PIL_Image = None
 
+# Size of the grayscale thumbnail used to detect screen changes, fine
+# enough that a typed character or a blinking caret still shows up
+FINGERPRINT_SIZE = (256, 144)
+# Per-pixel brightness difference (0-255) that counts as a change,
+# high enough to ignore subpixel rendering and resampling noise
+FINGERPRINT_PIXEL_THRESHOLD = 16
+# The change is measured in square tiles of this many thumbnail pixels, so
+# a small but real change (typing, a checkbox) changes a whole tile
+# instead of a handful of pixels (16 -> a 16x9 grid)
+FINGERPRINT_TILE_SIZE = 16
+
+# Box-reduce by an integer factor first, then bilinear for the remainder:
+# much faster than LANCZOS on full screens and keeps UI text legible
+RESIZE_REDUCING_GAP = 2.0
+# Bounds for adaptive JPEG quality
+MIN_JPEG_QUALITY = 40
+JPEG_QUALITY_STEP = 10
+# Smallest side an image is shrunk to when fitting a token budget
+MIN_IMAGE_SIDE = 256
+
+
+def estimate_image_tokens(width: int, height: int) -> int:
+    """Estimate the input tokens of an image sent with "high" detail.
+
+    Uses OpenAI's tiling rule (fit in 2048x2048, shortest side at most 768,
+    170 tokens per 512px tile plus 85), which also roughly matches other
+    providers at screenshot sizes.
+
+    Args:
+        width: Image width in pixels.
+        height: Image height in pixels.
+
+    Returns:
+        Estimated number of tokens.
+    """
+    scale = min(1.0, 2048 / max(width, height))
+    width, height = width * scale, height * scale
+    scale = min(1.0, 768 / min(width, height))
+    width, height = width * scale, height * scale
+    return 85 + 170 * math.ceil(width / 512) * math.ceil(height / 512)
+
 
 def _get_mss():
     """Lazily import mss for screen capture."""
@@ -57,6 +103,9 @@ class VisionEngine:
         target_width: Target width for scaled images.
         target_height: Target height for scaled images.
         jpeg_quality: JPEG compression quality (1-100).
+        image_token_budget: Maximum estimated tokens per image (None for no limit).
+        max_jpeg_bytes: Target JPEG size; quality adapts to stay below it.
+        last_timings: Milliseconds spent in each stage of the last capture.
     """
 
     def __init__(
@@ -65,6 +114,8 @@ class VisionEngine:
         target_width: int | None = 1280,
         target_height: int | None = 720,
         jpeg_quality: int = 85,
+        image_token_budget: int | None = None,
+        max_jpeg_bytes: int | None = None,
     ):
         """Initialize the VisionEngine.
 
@@ -73,16 +124,36 @@ class VisionEngine:
             target_width: Target width in pixels (None to use scale_factor).
             target_height: Target height in pixels (None to use scale_factor).
             jpeg_quality: JPEG compression quality (1-100).
+            image_token_budget: Shrink images until their estimated token
+                cost fits this budget (None for no limit).
+            max_jpeg_bytes: Lower the JPEG quality (down to MIN_JPEG_QUALITY)
+                while encoded images exceed this size (None for no limit).
         """
         self.scale_factor = max(0.1, min(1.0, scale_factor))
         self.target_width = target_width
         self.target_height = target_height
         self.jpeg_quality = max(1, min(100, jpeg_quality))
+        self.image_token_budget = image_token_budget
+        self.max_jpeg_bytes = max_jpeg_bytes
+        self._current_quality = self.jpeg_quality
 
         # Initialize MSS
         self._sct = None
         self._monitors: list[dict[str, int]] = []
 
+        # MSS handles are thread-bound, so async captures always run on one
+        # worker thread; the lock guards against mixing in sync callers
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="VisionEngine"
+        )
+        self._capture_lock = threading.Lock()
+        # Reused across captures to avoid reallocating the JPEG buffer
+        self._encode_buffer = io.BytesIO()
+
+        self.last_timings: dict[str, float] = {}
+        self._timing_totals: dict[str, float] = {}
+        self._capture_count = 0
+
         logger.info(
             f"VisionEngine initialized (scale={self.scale_factor}, "
             f"target={target_width}x{target_height}, quality={jpeg_quality})"
@@ -113,6 +184,39 @@ class VisionEngine:
         Returns:
             ScreenCapture with base64 encoded image and metadata.
         """
+        with self._capture_lock:
+            return self._capture_screen(monitor, region, scale)
+
+    async def capture_screen_async(
+        self,
+        monitor: int = 0,
+        region: tuple[int, int, int, int] | None = None,
+        scale: bool = True,
+    ) -> ScreenCapture:
+        """Capture the screen on the worker thread without blocking the event loop.
+
+        Args:
+            monitor: Monitor index (0=all monitors combined, 1+=specific monitor).
+            region: Optional (x, y, width, height) region to capture.
+            scale: Whether to scale the image.
+
+        Returns:
+            ScreenCapture with base64 encoded image and metadata.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self.capture_screen, monitor, region, scale
+        )
+
+    def _capture_screen(
+        self,
+        monitor: int,
+        region: tuple[int, int, int, int] | None,
+        scale: bool,
+    ) -> ScreenCapture:
+        """Capture, scale and encode the screen. Caller must hold the capture lock."""
+        timings: dict[str, float] = {}
+        stage_start = time.perf_counter()
         sct = self._get_sct()
         Image = _get_pil()
 
@@ -138,24 +242,32 @@ class VisionEngine:
         screenshot = sct.grab(capture_region)
         original_width = screenshot.width
         original_height = screenshot.height
+        stage_start = self._record_stage(timings, "grab", stage_start)
 
         # Convert to PIL Image
         img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
+        stage_start = self._record_stage(timings, "convert", stage_start)
 
         # Scale if requested
         if scale and (self.target_width or self.target_height):
             img, new_width, new_height = self._scale_image(img)
         elif scale:
-            new_width = int(original_width * self.scale_factor)
-            new_height = int(original_height * self.scale_factor)
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            new_width, new_height = self._fit_token_budget(
+                int(original_width * self.scale_factor),
+                int(original_height * self.scale_factor),
+            )
+            img = self._resize(img, new_width, new_height)
         else:
             new_width, new_height = original_width, original_height
+        stage_start = self._record_stage(timings, "resize", stage_start)
+
+        fingerprint = self._compute_fingerprint(img)
+        stage_start = self._record_stage(timings, "fingerprint", stage_start)
 
         # Encode to base64
-        buffer = io.BytesIO()
-        img.save(buffer, format="JPEG", quality=self.jpeg_quality)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
+        image_base64 = self._encode_jpeg(img)
+        self._record_stage(timings, "encode", stage_start)
+        self._record_timings(timings)
 
         return ScreenCapture(
             image_base64=image_base64,
@@ -165,8 +277,80 @@ class VisionEngine:
             scaled=scale,
             original_width=original_width,
             original_height=original_height,
+            fingerprint=fingerprint,
         )
 
+    def _compute_fingerprint(self, img) -> bytes:
+        """Downsample an image to a small grayscale thumbnail.
+
+        Args:
+            img: PIL Image to fingerprint.
+
+        Returns:
+            Raw thumbnail bytes of FINGERPRINT_SIZE.
+        """
+        Image = _get_pil()
+        thumbnail = img.convert("L").resize(FINGERPRINT_SIZE, Image.Resampling.BILINEAR)
+        return thumbnail.tobytes()
+
+    def compare_captures(
+        self, previous: ScreenCapture, current: ScreenCapture
+    ) -> ScreenChange:
+        """Estimate how much of the screen changed between two captures.
+
+        Compares the downsampled fingerprints, so the cost doesn't depend on
+        the screen resolution. The changed fraction counts the tiles of a
+        coarse grid that contain any changed pixel, so a single typed
+        character changes a whole tile.
+
+        Args:
+            previous: Earlier capture.
+            current: Later capture.
+
+        Returns:
+            ScreenChange with the changed fraction of tiles and the bounding
+            box of the changed pixels in screen coordinates. Captures that can't be compared count as
+            fully changed.
+        """
+        if (
+            not previous.fingerprint
+            or not current.fingerprint
+            or previous.monitor != current.monitor
+            or (previous.original_width, previous.original_height)
+            != (current.original_width, current.original_height)
+        ):
+            return ScreenChange(changed_fraction=1.0)
+
+        Image = _get_pil()
+        from PIL import ImageChops
+
+        before = Image.frombytes("L", FINGERPRINT_SIZE, previous.fingerprint)
+        after = Image.frombytes("L", FINGERPRINT_SIZE, current.fingerprint)
+        mask = ImageChops.difference(before, after).point(
+            lambda value: 255 if value > FINGERPRINT_PIXEL_THRESHOLD else 0
+        )
+
+        # Averaging 0/255 pixels per tile only leaves 0 for unchanged tiles
+        tiles = mask.reduce(FINGERPRINT_TILE_SIZE)
+        tile_count = tiles.width * tiles.height
+        changed_fraction = (tile_count - tiles.histogram()[0]) / tile_count
+
+        region = None
+        bbox = mask.getbbox()
+        if bbox:
+            # Map the thumbnail box back to screen coordinates
+            scale_x = (current.original_width or current.width) / FINGERPRINT_SIZE[0]
+            scale_y = (current.original_height or current.height) / FINGERPRINT_SIZE[1]
+            left, top, right, bottom = bbox
+            region = (
+                int(left * scale_x),
+                int(top * scale_y),
+                int((right - left) * scale_x),
+                int((bottom - top) * scale_y),
+            )
+
+        return ScreenChange(changed_fraction=changed_fraction, region=region)
+
     def _scale_image(self, img) -> tuple[Any, int, int]:
         """Scale image to target dimensions while maintaining aspect ratio.
 
@@ -176,7 +360,6 @@ class VisionEngine:
         Returns:
             Tuple of (scaled_image, new_width, new_height).
         """
-        Image = _get_pil()
         original_width, original_height = img.size
 
         if self.target_width and self.target_height:
@@ -191,12 +374,130 @@ class VisionEngine:
         else:
             ratio = self.scale_factor
 
-        new_width = int(original_width * ratio)
-        new_height = int(original_height * ratio)
+        new_width, new_height = self._fit_token_budget(
+            int(original_width * ratio), int(original_height * ratio)
+        )
 
-        scaled_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        scaled_img = self._resize(img, new_width, new_height)
         return scaled_img, new_width, new_height
 
+    def _resize(self, img, width: int, height: int) -> Any:
+        """Resize an image with the fast UI-friendly filter.
+
+        Args:
+            img: PIL Image to resize.
+            width: New width in pixels.
+            height: New height in pixels.
+
+        Returns:
+            The resized image (the same image if the size is unchanged).
+        """
+        if img.size == (width, height):
+            return img
+        Image = _get_pil()
+        return img.resize(
+            (width, height),
+            Image.Resampling.BILINEAR,
+            reducing_gap=RESIZE_REDUCING_GAP,
+        )
+
+    def _fit_token_budget(self, width: int, height: int) -> tuple[int, int]:
+        """Shrink image dimensions until they fit the image token budget.
+
+        Args:
+            width: Planned width in pixels.
+            height: Planned height in pixels.
+
+        Returns:
+            Tuple of (width, height) within the budget.
+        """
+        if not self.image_token_budget:
+            return width, height
+        while (
+            estimate_image_tokens(width, height) > self.image_token_budget
+            and min(width, height) * 0.9 >= MIN_IMAGE_SIDE
+        ):
+            width, height = int(width * 0.9), int(height * 0.9)
+        return width, height
+
+    def _encode_jpeg(self, img) -> str:
+        """JPEG- and base64-encode an image, adapting quality to max_jpeg_bytes.
+
+        The quality found for one frame is the starting point for the next,
+        so most frames are encoded only once.
+
+        Args:
+            img: PIL Image to encode.
+
+        Returns:
+            Base64 encoded JPEG.
+        """
+        quality = self._current_quality
+        size = self._save_jpeg(img, quality)
+
+        if self.max_jpeg_bytes:
+            while size > self.max_jpeg_bytes and quality > MIN_JPEG_QUALITY:
+                quality = max(MIN_JPEG_QUALITY, quality - JPEG_QUALITY_STEP)
+                size = self._save_jpeg(img, quality)
+            if size < self.max_jpeg_bytes // 2 and quality < self.jpeg_quality:
+                # Plenty of room, recover quality for the next frame
+                quality = min(self.jpeg_quality, quality + JPEG_QUALITY_STEP // 2)
+            self._current_quality = quality
+
+        with self._encode_buffer.getbuffer() as data:
+            return base64.b64encode(data).decode("utf-8")
+
+    def _save_jpeg(self, img, quality: int) -> int:
+        """Encode an image into the reusable buffer.
+
+        Returns:
+            Encoded size in bytes.
+        """
+        self._encode_buffer.seek(0)
+        self._encode_buffer.truncate()
+        img.save(self._encode_buffer, format="JPEG", quality=quality)
+        return self._encode_buffer.tell()
+
+    @staticmethod
+    def _record_stage(
+        timings: dict[str, float], stage: str, stage_start: float
+    ) -> float:
+        """Record the duration of a capture stage.
+
+        Returns:
+            Start time of the next stage.
+        """
+        now = time.perf_counter()
+        timings[stage] = (now - stage_start) * 1000
+        return now
+
+    def _record_timings(self, timings: dict[str, float]) -> None:
+        """Store the stage timings of a capture and add them to the totals."""
+        timings["total"] = sum(timings.values())
+        self.last_timings = timings
+        self._capture_count += 1
+        for stage, duration in timings.items():
+            self._timing_totals[stage] = self._timing_totals.get(stage, 0.0) + duration
+        logger.debug(
+            "Screen capture timings (ms): "
+            + ", ".join(
+                f"{stage}={duration:.1f}" for stage, duration in timings.items()
+            )
+        )
+
+    def get_timing_stats(self) -> dict[str, float]:
+        """Get the average milliseconds per capture stage.
+
+        Returns:
+            Dictionary of stage name to average duration in milliseconds.
+        """
+        if not self._capture_count:
+            return {}
+        return {
+            stage: total / self._capture_count
+            for stage, total in self._timing_totals.items()
+        }
+
     def get_image_for_llm(
         self,
         monitor: int = 0,
@@ -234,8 +535,26 @@ class VisionEngine:
             Tuple of (ScreenCapture, LLM-formatted image dict).
         """
         capture = self.capture_screen(monitor=monitor, scale=True)
+        return capture, self._to_llm_image(capture)
 
-        llm_image = {
+    async def capture_for_analysis_async(
+        self,
+        monitor: int = 0,
+    ) -> tuple[ScreenCapture, dict[str, Any]]:
+        """Capture screen off the event loop and return both raw data and LLM-formatted image.
+
+        Args:
+            monitor: Monitor index to capture.
+
+        Returns:
+            Tuple of (ScreenCapture, LLM-formatted image dict).
+        """
+        capture = await self.capture_screen_async(monitor=monitor, scale=True)
+        return capture, self._to_llm_image(capture)
+
+    def _to_llm_image(self, capture: ScreenCapture) -> dict[str, Any]:
+        """Format a capture for OpenAI-compatible vision LLMs."""
+        return {
             "type": "image_url",
             "image_url": {
                 "url": f"data:image/jpeg;base64,{capture.image_base64}",
@@ -243,8 +562,6 @@ class VisionEngine:
             },
         }
 
-        return capture, llm_image
-
     def get_monitors(self) -> list[dict[str, int]]:
         """Get list of available monitors.
 
@@ -298,6 +615,7 @@ class VisionEngine:
 
     def close(self) -> None:
         """Close the screen capture resources."""
+        self._executor.shutdown(wait=False)
         if self._sct:
             self._sct.close()
             self._sct = None
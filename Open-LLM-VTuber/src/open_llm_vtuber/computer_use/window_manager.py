@@ -3,12 +3,19 @@ Window Manager - Detects open windows and applications on macOS and Windows.
 
 This module provides cross-platform window detection to help the AI
 understand the desktop layout when multiple windows are open.
+
+Detection shells out to AppleScript / PowerShell and can take seconds, so
+the WindowManager keeps a cached desktop snapshot that is refreshed in a
+background thread and serves every query from it.
 """
 
+import asyncio
 import platform
 import subprocess
+import threading
+import time
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from loguru import logger
 
 
@@ -26,38 +33,57 @@ class WindowInfo:
     is_minimized: bool = False
 
 
-class WindowManager:
-    """Cross-platform window detection and management."""
+@dataclass
+class DesktopSnapshot:
+    """Open windows and running apps captured at one point in time."""
 
-    def __init__(self):
-        self.os_type = platform.system()
-        logger.info(f"WindowManager initialized for {self.os_type}")
+    windows: list[WindowInfo] = field(default_factory=list)
+    apps: list[str] = field(default_factory=list)
+    captured_at: float = 0.0
+
+
+class WindowBackend:
+    """Platform backend that captures the desktop state.
+
+    Subclass and override `get_open_windows` / `get_running_apps` (or
+    `capture`) to support another platform or to fake the desktop in tests.
+    """
 
     def get_open_windows(self) -> list[WindowInfo]:
         """Get list of all open windows with their positions."""
-        if self.os_type == "Darwin":
-            return self._get_macos_windows()
-        elif self.os_type == "Windows":
-            return self._get_windows_windows()
-        else:
-            return []
-
-    def get_active_window(self) -> Optional[WindowInfo]:
-        """Get the currently active/focused window."""
-        windows = self.get_open_windows()
-        for window in windows:
-            if window.is_active:
-                return window
-        return windows[0] if windows else None
+        return []
 
     def get_running_apps(self) -> list[str]:
         """Get list of running application names."""
-        if self.os_type == "Darwin":
-            return self._get_macos_apps()
-        elif self.os_type == "Windows":
-            return self._get_windows_apps()
         return []
 
+    def capture(self) -> DesktopSnapshot:
+        """Capture windows and apps. Blocking, called off the event loop."""
+        return DesktopSnapshot(
+            windows=self.get_open_windows(),
+            apps=self.get_running_apps(),
+            captured_at=time.monotonic(),
+        )
+
+
+class MacOSWindowBackend(WindowBackend):
+    """Window detection on macOS using AppleScript."""
+
+    def get_open_windows(self) -> list[WindowInfo]:
+        return self._get_macos_windows()
+
+    def get_running_apps(self) -> list[str]:
+        return self._get_macos_apps()
+
+    def capture(self) -> DesktopSnapshot:
+        # Derive apps from the same AppleScript call
+        windows = self._get_macos_windows()
+        return DesktopSnapshot(
+            windows=windows,
+            apps=list(set(w.app_name for w in windows)),
+            captured_at=time.monotonic(),
+        )
+
     def _get_macos_windows(self) -> list[WindowInfo]:
         """Get open windows on macOS using AppleScript."""
         windows = []
@@ -110,6 +136,16 @@ class WindowManager:
         windows = self._get_macos_windows()
         return list(set(w.app_name for w in windows))
 
+
+class WindowsWindowBackend(WindowBackend):
+    """Window detection on Windows using pygetwindow or PowerShell."""
+
+    def get_open_windows(self) -> list[WindowInfo]:
+        return self._get_windows_windows()
+
+    def get_running_apps(self) -> list[str]:
+        return self._get_windows_apps()
+
     def _get_windows_windows(self) -> list[WindowInfo]:
         """Get open windows on Windows using pygetwindow."""
         windows = []
@@ -219,10 +255,140 @@ class WindowManager:
 
         return apps
 
+
+def get_default_backend(os_type: str) -> WindowBackend:
+    """Get the window backend for an OS name as returned by platform.system()."""
+    if os_type == "Darwin":
+        return MacOSWindowBackend()
+    elif os_type == "Windows":
+        return WindowsWindowBackend()
+    return WindowBackend()
+
+
+class WindowManager:
+    """Cross-platform window detection served from a cached desktop snapshot.
+
+    Call `start()` to refresh the snapshot in a background thread every
+    `snapshot_ttl` seconds (or sooner after `request_refresh()`); queries then
+    never block. Without the background thread, a stale snapshot is refreshed
+    inline on the next query.
+    """
+
+    def __init__(
+        self, backend: Optional[WindowBackend] = None, snapshot_ttl: float = 2.0
+    ):
+        """
+        Initialize the window manager.
+
+        Args:
+            backend: Backend capturing the desktop state. Defaults to the
+                backend of the current OS.
+            snapshot_ttl: Seconds after which the snapshot is refreshed.
+        """
+        self.os_type = platform.system()
+        self.backend = backend or get_default_backend(self.os_type)
+        self.snapshot_ttl = snapshot_ttl
+
+        self._snapshot = DesktopSnapshot()
+        self._lock = threading.Lock()
+        self._snapshot_ready = threading.Event()
+        self._refresh_requested = threading.Event()
+        self._stop_requested: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
+        logger.info(
+            f"WindowManager initialized for {self.os_type} "
+            f"({type(self.backend).__name__})"
+        )
+
+    def start(self) -> None:
+        """Start refreshing the snapshot in a background thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        # A fresh stop event per thread, so a stopping thread can't be revived
+        self._stop_requested = threading.Event()
+        self._refresh_requested.set()  # Capture right away
+        self._thread = threading.Thread(
+            target=self._refresh_loop,
+            args=(self._stop_requested,),
+            name="WindowManagerRefresh",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background refresh thread."""
+        if not self._thread:
+            return
+        self._stop_requested.set()
+        self._refresh_requested.set()
+        self._thread = None
+
+    def request_refresh(self) -> None:
+        """Refresh the snapshot soon, e.g. after an action changed the desktop."""
+        if self._thread:
+            self._refresh_requested.set()
+        else:
+            with self._lock:
+                self._snapshot.captured_at = 0.0
+
+    async def wait_for_snapshot(self, timeout: float = 3.0) -> bool:
+        """Wait without blocking the event loop until a snapshot is available."""
+        if self._snapshot_ready.is_set():
+            return True
+        return await asyncio.to_thread(self._snapshot_ready.wait, timeout)
+
+    def _refresh_loop(self, stop_requested: threading.Event) -> None:
+        """Capture the desktop on every TTL tick or refresh request."""
+        while not stop_requested.is_set():
+            self._refresh_requested.wait(self.snapshot_ttl)
+            if stop_requested.is_set():
+                break
+            self._refresh_requested.clear()
+            self._refresh()
+
+    def _refresh(self) -> DesktopSnapshot:
+        """Capture a new snapshot (blocking) and publish it."""
+        try:
+            snapshot = self.backend.capture()
+        except Exception as e:
+            logger.error(f"Error capturing desktop snapshot: {e}")
+            snapshot = DesktopSnapshot(captured_at=time.monotonic())
+        with self._lock:
+            self._snapshot = snapshot
+        self._snapshot_ready.set()
+        return snapshot
+
+    def get_snapshot(self) -> DesktopSnapshot:
+        """Get the latest desktop snapshot."""
+        with self._lock:
+            snapshot = self._snapshot
+        if self._thread:
+            return snapshot
+        if time.monotonic() - snapshot.captured_at >= self.snapshot_ttl:
+            return self._refresh()
+        return snapshot
+
+    def get_open_windows(self) -> list[WindowInfo]:
+        """Get list of all open windows with their positions."""
+        return self.get_snapshot().windows
+
+    def get_active_window(self) -> Optional[WindowInfo]:
+        """Get the currently active/focused window."""
+        windows = self.get_open_windows()
+        for window in windows:
+            if window.is_active:
+                return window
+        return windows[0] if windows else None
+
+    def get_running_apps(self) -> list[str]:
+        """Get list of running application names."""
+        return self.get_snapshot().apps
+
     def get_desktop_layout_description(self) -> str:
         """Generate a human-readable description of the desktop layout."""
-        windows = self.get_open_windows()
-        apps = self.get_running_apps()
+        snapshot = self.get_snapshot()
+        windows = snapshot.windows
+        apps = snapshot.apps
 
         if not windows and not apps:
             return "Unable to detect open windows."
@@ -7,9 +7,14 @@ and utility functions for loading/saving configurations.
 
 # Import main configuration classes
 from .main import Config
-from .system import SystemConfig
+from .system import (
+    SystemConfig,
+    SendQueueConfig,
+    EngineCacheConfig,
+    ConversationSchedulerConfig,
+)
 from .character import CharacterConfig
-from .live import LiveConfig, BiliBiliLiveConfig
+from .live import LiveConfig, BiliBiliLiveConfig, DanmakuAggregationConfig
 from .stateless_llm import (
     OpenAICompatibleConfig,
     ClaudeConfig,
@@ -69,9 +74,13 @@ __all__ = [
     # Main configuration classes
     "Config",
     "SystemConfig",
+    "SendQueueConfig",
+    "EngineCacheConfig",
+    "ConversationSchedulerConfig",
     "CharacterConfig",
     "LiveConfig",
     "BiliBiliLiveConfig",
+    "DanmakuAggregationConfig",
     # LLM related classes
     "OpenAICompatibleConfig",
     "ClaudeConfig",
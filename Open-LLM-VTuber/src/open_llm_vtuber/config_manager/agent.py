@@ -31,6 +31,8 @@ class BasicMemoryAgentConfig(I18nMixin, BaseModel):
 
     faster_first_response: Optional[bool] = Field(True, alias="faster_first_response")
     segment_method: Literal["regex", "pysbd"] = Field("pysbd", alias="segment_method")
+    first_chunk_max_chars: int = Field(60, ge=0, alias="first_chunk_max_chars")
+    first_chunk_max_wait: float = Field(1.0, ge=0, alias="first_chunk_max_wait")
     use_mcpp: Optional[bool] = Field(False, alias="use_mcpp")
     mcp_enabled_servers: Optional[List[str]] = Field([], alias="mcp_enabled_servers")
 
@@ -47,6 +49,14 @@ class BasicMemoryAgentConfig(I18nMixin, BaseModel):
             en="Method for segmenting sentences: 'regex' or 'pysbd' (default: 'pysbd')",
             zh="分割句子的方法：'regex' 或 'pysbd'（默认：'pysbd'）",
         ),
+        "first_chunk_max_chars": Description(
+            en="With faster_first_response, emit the first fragment at a word boundary once this many characters arrive without punctuation. 0 disables (default: 60)",
+            zh="启用 faster_first_response 时，第一句在无标点的情况下累积到该字符数后按词边界提前输出。0 为禁用（默认：60）",
+        ),
+        "first_chunk_max_wait": Description(
+            en="With faster_first_response, emit the first fragment at a word boundary once text has been buffered for this many seconds. 0 disables (default: 1.0)",
+            zh="启用 faster_first_response 时，第一句文本缓冲超过该秒数后按词边界提前输出。0 为禁用（默认：1.0）",
+        ),
         "use_mcpp": Description(
             en="Whether to use MCP (Model Context Protocol) for the agent (default: True)",
             zh="是否使用为智能体启用 MCP (Model Context Protocol) Plus（默认：False）",
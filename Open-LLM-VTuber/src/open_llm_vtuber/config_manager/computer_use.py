@@ -21,7 +21,14 @@ class ComputerUseConfig(BaseModel):
         require_confirmation: Whether to require confirmation for actions.
         session_timeout: Seconds of inactivity before auto-stop.
         log_screenshots: Whether to save screenshots in logs.
+        log_screenshot_quality: JPEG quality of logged screenshots (0 to save them as captured).
         dry_run: If True, log actions without executing them.
+        desktop_snapshot_ttl: Seconds between background desktop layout refreshes.
+        image_token_budget: Maximum estimated tokens per screenshot (0 for no limit).
+        screenshot_max_kb: Target screenshot JPEG size in KB (0 for no limit).
+        skip_unchanged_screens: Whether to skip vision LLM calls while the screen is unchanged.
+        screen_change_threshold: Fraction of the screen's 16x9 tiles that must change to count as a new frame.
+        max_unchanged_skips: Consecutive unchanged frames to skip before calling the LLM anyway.
     """
 
     enabled: bool = Field(
@@ -91,11 +98,56 @@ class ComputerUseConfig(BaseModel):
         description="Whether to save screenshots with action logs (uses disk space)",
     )
 
+    log_screenshot_quality: int = Field(
+        default=0,
+        ge=0,
+        le=100,
+        description="Re-encode logged screenshots at this JPEG quality to save disk space (0 = save as captured)",
+    )
+
     dry_run: bool = Field(
         default=False,
         description="If True, log actions without actually executing them",
     )
 
+    desktop_snapshot_ttl: float = Field(
+        default=2.0,
+        ge=0.1,
+        le=60.0,
+        description="Seconds between background refreshes of open windows and apps",
+    )
+
+    image_token_budget: int = Field(
+        default=0,
+        ge=0,
+        description="Shrink screenshots until their estimated image tokens fit this budget (0 = no limit)",
+    )
+
+    screenshot_max_kb: int = Field(
+        default=0,
+        ge=0,
+        description="Lower JPEG quality while screenshots exceed this size in KB (0 = no limit)",
+    )
+
+    skip_unchanged_screens: bool = Field(
+        default=True,
+        description="Wait instead of calling the vision LLM while the screen is unchanged",
+    )
+
+    screen_change_threshold: float = Field(
+        default=0.005,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of the screen's 16x9 tiles that must change to count as a new frame",
+    )
+
+    max_unchanged_skips: int = Field(
+        default=3,
+        ge=0,
+        le=20,
+        description="Consecutive unchanged frames to skip before calling the LLM anyway",
+    )
+
     monitor_index: int = Field(
         default=1,
         ge=0,
@@ -1,5 +1,5 @@
 from pydantic import Field
-from typing import Dict, ClassVar, List
+from typing import Dict, ClassVar, List, Literal
 from .i18n import I18nMixin, Description
 
 
@@ -20,15 +20,59 @@ class BiliBiliLiveConfig(I18nMixin):
     }
 
 
+class DanmakuAggregationConfig(I18nMixin):
+    """Configuration for batching live chat messages into conversation turns."""
+
+    enabled: bool = Field(True, alias="enabled")
+    window_seconds: float = Field(3.0, alias="window_seconds")
+    max_items_per_turn: int = Field(5, alias="max_items_per_turn")
+    max_pending: int = Field(200, alias="max_pending")
+    drop_policy: Literal["oldest", "newest"] = Field("oldest", alias="drop_policy")
+    turn_timeout: float = Field(120.0, alias="turn_timeout")
+
+    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
+        "enabled": Description(
+            en="Batch danmaku into digest turns instead of one turn per message",
+            zh="将弹幕合并为摘要轮次，而不是每条弹幕一轮对话",
+        ),
+        "window_seconds": Description(
+            en="Seconds to collect danmaku before sending a digest",
+            zh="发送摘要前收集弹幕的秒数",
+        ),
+        "max_items_per_turn": Description(
+            en="Maximum number of distinct danmaku in one digest",
+            zh="每个摘要中不同弹幕的最大数量",
+        ),
+        "max_pending": Description(
+            en="Maximum number of distinct danmaku waiting for the next digest",
+            zh="等待下一个摘要的不同弹幕的最大数量",
+        ),
+        "drop_policy": Description(
+            en="Which danmaku to drop when the limit is reached: 'oldest' or 'newest'",
+            zh="达到上限时丢弃哪些弹幕：'oldest'（最早的）或 'newest'（最新的）",
+        ),
+        "turn_timeout": Description(
+            en="Seconds to wait for the VTuber to answer a digest before sending the next",
+            zh="等待 VTuber 回复摘要的秒数，超时后发送下一个摘要",
+        ),
+    }
+
+
 class LiveConfig(I18nMixin):
     """Configuration for live streaming platforms integration."""
 
     bilibili_live: BiliBiliLiveConfig = Field(
         BiliBiliLiveConfig(), alias="bilibili_live"
     )
+    danmaku_aggregation: DanmakuAggregationConfig = Field(
+        DanmakuAggregationConfig(), alias="danmaku_aggregation"
+    )
 
     DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
         "bilibili_live": Description(
             en="Configuration for BiliBili Live platform", zh="B站直播平台配置"
         ),
+        "danmaku_aggregation": Description(
+            en="Batching and load shedding of danmaku", zh="弹幕合并与限流配置"
+        ),
     }
@@ -1,9 +1,87 @@
 # config_manager/system.py
 from pydantic import Field, model_validator
-from typing import Dict, ClassVar
+from typing import Dict, ClassVar, Literal
 from .i18n import I18nMixin, Description
 
 
+class SendQueueConfig(I18nMixin):
+    """Configuration for the outbound message queue of each client connection."""
+
+    max_messages: int = Field(512, alias="max_messages")
+    max_queued_mb: float = Field(16.0, alias="max_queued_mb")
+    slow_client_policy: Literal["wait", "drop", "disconnect"] = Field(
+        "wait", alias="slow_client_policy"
+    )
+    slow_client_timeout: float = Field(10.0, alias="slow_client_timeout")
+
+    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
+        "max_messages": Description(
+            en="High-water mark for the number of queued messages per client",
+            zh="每个客户端排队消息数量的高水位",
+        ),
+        "max_queued_mb": Description(
+            en="High-water mark for the size of queued messages per client, in MB",
+            zh="每个客户端排队消息总大小的高水位（MB）",
+        ),
+        "slow_client_policy": Description(
+            en=(
+                "What to do when a client's queue reaches a high-water mark: "
+                "'wait' pauses the producer until the queue drains, 'drop' keeps "
+                "going and sheds stale messages, 'disconnect' closes the connection"
+            ),
+            zh=(
+                "客户端队列达到高水位时的处理方式：'wait' 暂停生产者直到队列排空，"
+                "'drop' 继续发送并丢弃过时消息，'disconnect' 断开连接"
+            ),
+        ),
+        "slow_client_timeout": Description(
+            en="Seconds to wait for a slow client before disconnecting it",
+            zh="等待慢速客户端的秒数，超时后断开连接",
+        ),
+    }
+
+
+class EngineCacheConfig(I18nMixin):
+    """Configuration for the cache of warm ASR, TTS, VAD and LLM engines."""
+
+    max_engines: int = Field(8, alias="max_engines")
+    memory_budget_mb: float = Field(4096.0, alias="memory_budget_mb")
+
+    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
+        "max_engines": Description(
+            en="Maximum number of engines kept loaded for config switches, 0 disables the cache",
+            zh="为切换配置而保持加载的引擎最大数量，0 表示禁用缓存",
+        ),
+        "memory_budget_mb": Description(
+            en="Estimated memory the cached engines may use, in MB (0 means no limit)",
+            zh="缓存引擎可使用的预估内存（MB），0 表示不限制",
+        ),
+    }
+
+
+class ConversationSchedulerConfig(I18nMixin):
+    """Configuration for admission control of concurrent conversation turns."""
+
+    max_concurrent_turns: int = Field(4, alias="max_concurrent_turns")
+    max_queue_wait: float = Field(30.0, alias="max_queue_wait")
+    expected_turn_seconds: float = Field(15.0, alias="expected_turn_seconds")
+
+    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
+        "max_concurrent_turns": Description(
+            en="Maximum number of conversation turns processed at once, 0 means no limit",
+            zh="同时处理的对话轮次最大数量，0 表示不限制",
+        ),
+        "max_queue_wait": Description(
+            en="Latency SLO in seconds: turns whose estimated queue wait exceeds it are rejected right away (0 never rejects)",
+            zh="延迟目标（秒）：预计排队等待时间超过该值的对话轮次会被立即拒绝（0 表示从不拒绝）",
+        ),
+        "expected_turn_seconds": Description(
+            en="Assumed duration of a turn until real turn durations have been measured",
+            zh="在测得实际对话轮次时长之前假定的轮次时长（秒）",
+        ),
+    }
+
+
 class SystemConfig(I18nMixin):
     """System configuration settings."""
 
@@ -13,6 +91,14 @@ class SystemConfig(I18nMixin):
     config_alts_dir: str = Field(..., alias="config_alts_dir")
     tool_prompts: Dict[str, str] = Field(..., alias="tool_prompts")
     enable_proxy: bool = Field(False, alias="enable_proxy")
+    concurrent_engine_init: bool = Field(True, alias="concurrent_engine_init")
+    warm_up_engines: bool = Field(True, alias="warm_up_engines")
+    engine_processes: Dict[str, int] = Field({}, alias="engine_processes")
+    send_queue: SendQueueConfig = Field(SendQueueConfig(), alias="send_queue")
+    engine_cache: EngineCacheConfig = Field(EngineCacheConfig(), alias="engine_cache")
+    conversation_scheduler: ConversationSchedulerConfig = Field(
+        ConversationSchedulerConfig(), alias="conversation_scheduler"
+    )
 
     DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
         "conf_version": Description(en="Configuration version", zh="配置文件版本"),
@@ -29,6 +115,30 @@ class SystemConfig(I18nMixin):
             en="Enable proxy mode for multiple clients",
             zh="启用代理模式以支持多个客户端使用一个 ws 连接",
         ),
+        "concurrent_engine_init": Description(
+            en="Initialize ASR, TTS, VAD and the agent concurrently at startup",
+            zh="启动时并发初始化 ASR、TTS、VAD 和 Agent",
+        ),
+        "warm_up_engines": Description(
+            en="Run a short synthetic utterance through newly loaded local ASR, TTS and VAD engines",
+            zh="对新加载的本地 ASR、TTS 和 VAD 引擎运行一段简短的合成语音进行预热",
+        ),
+        "engine_processes": Description(
+            en="Number of worker processes hosting each local ASR/TTS engine, by engine name (engines not listed run in the server process)",
+            zh="按引擎名称设置托管本地 ASR/TTS 引擎的工作进程数（未列出的引擎在服务器进程中运行）",
+        ),
+        "send_queue": Description(
+            en="Outbound message queue settings for client connections",
+            zh="客户端连接的发送队列设置",
+        ),
+        "engine_cache": Description(
+            en="Cache of loaded engines reused when switching configs",
+            zh="切换配置时复用的已加载引擎缓存",
+        ),
+        "conversation_scheduler": Description(
+            en="Limits on concurrent conversation turns and their queue",
+            zh="并发对话轮次及其等待队列的限制",
+        ),
     }
 
     @model_validator(mode="after")
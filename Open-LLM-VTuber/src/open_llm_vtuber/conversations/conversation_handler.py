@@ -1,6 +1,7 @@
 import asyncio
-import json
-from typing import Dict, Optional, Callable
+import weakref
+from functools import partial
+from typing import Dict, Iterable, Optional, Callable
 
 import numpy as np
 from fastapi import WebSocket
@@ -8,13 +9,20 @@ from loguru import logger
 
 from ..chat_group import ChatGroupManager
 from ..chat_history_manager import store_message
+from ..client_outbox import ClientOutbox
 from ..service_context import ServiceContext
 from .group_conversation import process_group_conversation
 from .single_conversation import process_single_conversation
 from .conversation_utils import EMOJI_LIST
+from .conversation_scheduler import ConversationScheduler
 from .types import GroupConversationState
+from ..utils import json_codec
 from prompts import prompt_loader
 
+# Conversation tasks whose turn has started, i.e. is no longer waiting in (or
+# was not rejected by) the conversation scheduler's queue
+_started_turns: "weakref.WeakSet[asyncio.Task]" = weakref.WeakSet()
+
 
 async def handle_conversation_trigger(
     msg_type: str,
@@ -28,8 +36,13 @@ async def handle_conversation_trigger(
     received_data_buffers: Dict[str, np.ndarray],
     current_conversation_tasks: Dict[str, Optional[asyncio.Task]],
     broadcast_to_group: Callable,
+    conversation_scheduler: Optional[ConversationScheduler] = None,
 ) -> None:
-    """Handle triggers that start a conversation"""
+    """Handle triggers that start a conversation
+
+    With a conversation scheduler, the turn waits for a free slot (or is
+    rejected) inside its task, so interrupts cancel waiting turns as well.
+    """
     metadata = None
 
     if msg_type == "ai-speak-signal":
@@ -55,7 +68,7 @@ async def handle_conversation_trigger(
         }
 
         await websocket.send_text(
-            json.dumps(
+            json_codec.dumps(
                 {
                     "type": "full-text",
                     "text": "AI wants to speak something...",
@@ -81,45 +94,85 @@ async def handle_conversation_trigger(
         ):
             logger.info(f"Starting new group conversation for {task_key}")
 
+            turn = partial(
+                process_group_conversation,
+                client_contexts=client_contexts,
+                client_connections=client_connections,
+                broadcast_func=broadcast_to_group,
+                group_members=group.members,
+                initiator_client_uid=client_uid,
+                user_input=user_input,
+                images=images,
+                session_emoji=session_emoji,
+                metadata=metadata,
+            )
             current_conversation_tasks[task_key] = asyncio.create_task(
-                process_group_conversation(
-                    client_contexts=client_contexts,
-                    client_connections=client_connections,
-                    broadcast_func=broadcast_to_group,
-                    group_members=group.members,
-                    initiator_client_uid=client_uid,
-                    user_input=user_input,
-                    images=images,
-                    session_emoji=session_emoji,
-                    metadata=metadata,
+                _schedule_turn(
+                    conversation_scheduler,
+                    task_key,
+                    turn,
+                    partial(broadcast_to_group, group.members),
                 )
             )
     else:
         # Use client_uid as task key for individual conversations
+        turn = partial(
+            process_single_conversation,
+            context=context,
+            websocket_send=websocket.send_text,
+            client_uid=client_uid,
+            user_input=user_input,
+            images=images,
+            session_emoji=session_emoji,
+            metadata=metadata,
+        )
         current_conversation_tasks[client_uid] = asyncio.create_task(
-            process_single_conversation(
-                context=context,
-                websocket_send=websocket.send_text,
-                client_uid=client_uid,
-                user_input=user_input,
-                images=images,
-                session_emoji=session_emoji,
-                metadata=metadata,
+            _schedule_turn(
+                conversation_scheduler,
+                client_uid,
+                turn,
+                lambda message: websocket.send_text(json_codec.dumps(message)),
             )
         )
 
 
+async def _schedule_turn(
+    conversation_scheduler: Optional[ConversationScheduler],
+    key: str,
+    turn: Callable,
+    notify: Callable,
+):
+    """Run a conversation turn, through the scheduler if there is one"""
+
+    async def start_turn():
+        _started_turns.add(asyncio.current_task())
+        return await turn()
+
+    if conversation_scheduler is None:
+        return await start_turn()
+    return await conversation_scheduler.run(key, start_turn, notify)
+
+
 async def handle_individual_interrupt(
     client_uid: str,
     current_conversation_tasks: Dict[str, Optional[asyncio.Task]],
     context: ServiceContext,
     heard_response: str,
+    client_outboxes: Optional[Dict[str, ClientOutbox]] = None,
 ):
     if client_uid in current_conversation_tasks:
         task = current_conversation_tasks[client_uid]
         if task and not task.done():
             task.cancel()
+            # Let the turn stop before dropping the output it has queued
+            await asyncio.wait([task])
             logger.info("🛑 Conversation task was successfully interrupted")
+        discard_queued_output([client_uid], client_outboxes)
+
+        if task and task not in _started_turns:
+            # The turn was still waiting for a slot, nothing was said yet
+            logger.info("Interrupted conversation turn had not started")
+            return
 
         try:
             context.agent_engine.handle_interrupt(heard_response)
@@ -150,6 +203,7 @@ async def handle_group_interrupt(
     chat_group_manager: ChatGroupManager,
     client_contexts: Dict[str, ServiceContext],
     broadcast_to_group: Callable,
+    client_outboxes: Optional[Dict[str, ClientOutbox]] = None,
 ) -> None:
     """Handles interruption for a group conversation"""
     task = current_conversation_tasks.get(group_id)
@@ -180,8 +234,9 @@ async def handle_group_interrupt(
     current_conversation_tasks.pop(group_id, None)
     GroupConversationState.remove_state(group_id)  # Clean up state after we've used it
 
-    # Store messages with speaker info
-    if context and group:
+    # Store messages with speaker info, unless the turn was still waiting
+    # for a slot and nothing was said yet
+    if context and group and task in _started_turns:
         for member_uid in group.members:
             if member_uid in client_contexts:
                 try:
@@ -204,6 +259,7 @@ async def handle_group_interrupt(
                 except Exception as e:
                     logger.error(f"Error handling interrupt for {member_uid}: {e}")
 
+    discard_queued_output(group.members, client_outboxes)
     await broadcast_to_group(
         list(group.members),
         {
@@ -211,3 +267,16 @@ async def handle_group_interrupt(
             "text": "conversation-interrupted",
         },
     )
+
+
+def discard_queued_output(
+    client_uids: Iterable[str],
+    client_outboxes: Optional[Dict[str, ClientOutbox]],
+) -> None:
+    """Drop the queued audio and text of an interrupted turn for its clients"""
+    if not client_outboxes:
+        return
+    for client_uid in client_uids:
+        outbox = client_outboxes.get(client_uid)
+        if outbox:
+            outbox.discard_stream()
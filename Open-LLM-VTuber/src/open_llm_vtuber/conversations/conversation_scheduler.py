@@ -0,0 +1,263 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from loguru import logger
+
+from ..config_manager.system import ConversationSchedulerConfig
+
+# Sends a message dict to the client(s) a turn belongs to
+NotifyFunc = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# Weight of the latest turn in the moving average of turn durations
+TURN_DURATION_SMOOTHING = 0.2
+
+
+class _Waiter:
+    """A turn waiting for a free slot."""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.admitted = False
+        self.queued_at = time.monotonic()
+        # Set when the waiter is admitted or its position may have changed
+        self.changed = asyncio.Event()
+
+
+class ConversationScheduler:
+    """
+    Admission control for the conversation turns of all clients.
+
+    At most `max_concurrent_turns` turns run at once. Further turns wait in a
+    queue where clients (or chat groups) take turns, so one busy client
+    cannot starve the others, and waiting clients are told their position.
+    A turn whose estimated wait exceeds the `max_queue_wait` latency SLO is
+    rejected right away instead of queueing, so clients get a fast answer
+    while the server is overloaded.
+
+    The wait is estimated from a moving average of recent turn durations:
+    a turn at position p (0-based) starts after about p // max_concurrent + 1
+    running turns have finished.
+    """
+
+    def __init__(self, config: Optional[ConversationSchedulerConfig] = None):
+        self.config = config or ConversationSchedulerConfig()
+        # key -> waiting turns of that client or group, keys in turn order
+        self._queues: OrderedDict[str, Deque[_Waiter]] = OrderedDict()
+        self._active = 0
+        self._avg_turn_seconds = self.config.expected_turn_seconds
+
+        # Metrics
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+        self.max_wait_seconds = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.max_concurrent_turns > 0
+
+    @property
+    def waiting(self) -> int:
+        """Number of turns waiting for a slot."""
+        return sum(len(waiters) for waiters in self._queues.values())
+
+    def _service_order(self) -> List[_Waiter]:
+        """Waiting turns in the order they will be admitted."""
+        order = []
+        queues = [list(waiters) for waiters in self._queues.values()]
+        for index in range(max((len(q) for q in queues), default=0)):
+            order.extend(q[index] for q in queues if index < len(q))
+        return order
+
+    def estimate_wait(self, position: int) -> float:
+        """
+        Estimate how long a turn waits for a slot.
+
+        Args:
+            position: 0-based position of the turn in the queue
+
+        Returns:
+            float: Estimated wait in seconds
+        """
+        waves = position // self.config.max_concurrent_turns + 1
+        return waves * self._avg_turn_seconds
+
+    async def run(
+        self, key: str, turn: Callable[[], Awaitable[Any]], notify: NotifyFunc
+    ) -> Optional[Any]:
+        """
+        Run a conversation turn once a slot is free.
+
+        Cancelling the returned coroutine while it waits removes the turn from
+        the queue, so interrupting or disconnecting clients give up their place.
+
+        Args:
+            key: Client uid, or group id for group conversations
+            turn: Creates the coroutine processing the turn
+            notify: Sends queue status messages to the turn's client(s)
+
+        Returns:
+            The turn's result, or None if the turn was rejected
+        """
+        if not await self._acquire(key, notify):
+            return None
+        start = time.monotonic()
+        try:
+            return await turn()
+        finally:
+            self._release(time.monotonic() - start)
+
+    async def _acquire(self, key: str, notify: NotifyFunc) -> bool:
+        """Wait for a slot. Returns False if the turn was rejected."""
+        if not self.enabled or (
+            self._active < self.config.max_concurrent_turns and not self._queues
+        ):
+            self._active += 1
+            self.admitted += 1
+            return True
+
+        waiter = _Waiter(key)
+        self._queues.setdefault(key, deque()).append(waiter)
+        position = self._service_order().index(waiter)
+        estimated_wait = self.estimate_wait(position)
+        slo = self.config.max_queue_wait
+        if slo > 0 and estimated_wait > slo:
+            self._remove(waiter)
+            self.rejected += 1
+            logger.warning(
+                f"Rejecting conversation turn of {key}: estimated queue wait "
+                f"{estimated_wait:.1f}s exceeds {slo:.1f}s "
+                f"({self._active} running, {self.waiting} waiting)"
+            )
+            await self._notify_rejected(notify, estimated_wait)
+            return False
+
+        self.queued += 1
+        logger.info(
+            f"Conversation turn of {key} queued at position {position + 1} "
+            f"(estimated wait {estimated_wait:.1f}s)"
+        )
+        try:
+            last_position = None
+            while not waiter.admitted:
+                position = self._service_order().index(waiter)
+                if position != last_position:
+                    last_position = position
+                    await self._notify_position(notify, position)
+                await waiter.changed.wait()
+                waiter.changed.clear()
+        except BaseException:
+            if waiter.admitted:
+                self._release(None)
+            else:
+                self._remove(waiter)
+                self._wake_waiters()
+            raise
+
+        wait_seconds = time.monotonic() - waiter.queued_at
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+        logger.info(
+            f"Conversation turn of {key} admitted after {wait_seconds:.1f}s in queue"
+        )
+        return True
+
+    def _release(self, turn_seconds: Optional[float]) -> None:
+        """Free a slot and admit the next waiting turns."""
+        if turn_seconds is not None:
+            self._avg_turn_seconds += TURN_DURATION_SMOOTHING * (
+                turn_seconds - self._avg_turn_seconds
+            )
+        self._active -= 1
+
+        admitted_any = False
+        while self._queues and self._active < self.config.max_concurrent_turns:
+            key, waiters = next(iter(self._queues.items()))
+            waiter = waiters.popleft()
+            # The client goes to the back of the line for its next turn
+            del self._queues[key]
+            if waiters:
+                self._queues[key] = waiters
+            waiter.admitted = True
+            waiter.changed.set()
+            self._active += 1
+            self.admitted += 1
+            admitted_any = True
+        if admitted_any:
+            self._wake_waiters()
+
+    def _remove(self, waiter: _Waiter) -> None:
+        waiters = self._queues.get(waiter.key)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            pass
+        if not waiters:
+            del self._queues[waiter.key]
+
+    def _wake_waiters(self) -> None:
+        """Let the waiting turns send their new positions."""
+        for waiters in self._queues.values():
+            for waiter in waiters:
+                waiter.changed.set()
+
+    async def _notify_position(self, notify: NotifyFunc, position: int) -> None:
+        estimated_wait = round(self.estimate_wait(position), 1)
+        await self._send(
+            notify,
+            {
+                "type": "conversation-queue",
+                "status": "queued",
+                "position": position + 1,
+                "estimated_wait": estimated_wait,
+            },
+            {
+                "type": "full-text",
+                "text": (
+                    f"Waiting in line... (position {position + 1}, "
+                    f"about {math.ceil(estimated_wait)}s)"
+                ),
+            },
+        )
+
+    async def _notify_rejected(self, notify: NotifyFunc, estimated_wait: float) -> None:
+        await self._send(
+            notify,
+            {
+                "type": "conversation-queue",
+                "status": "rejected",
+                "estimated_wait": round(estimated_wait, 1),
+            },
+            {
+                "type": "full-text",
+                "text": "The server is busy right now, please try again later.",
+            },
+            # Lets the client (and the proxy) know this turn is over
+            {"type": "control", "text": "conversation-chain-end"},
+        )
+
+    @staticmethod
+    async def _send(notify: NotifyFunc, *messages: Dict[str, Any]) -> None:
+        for message in messages:
+            try:
+                await notify(message)
+            except Exception as e:
+                # The client may be gone, its turn is cancelled on disconnect
+                logger.debug(f"Failed to send conversation queue status: {e}")
+                return
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler metrics."""
+        return {
+            "running": self._active,
+            "waiting": self.waiting,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "avg_turn_seconds": round(self._avg_turn_seconds, 2),
+            "max_wait_seconds": round(self.max_wait_seconds, 2),
+        }
@@ -1,6 +1,5 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 import asyncio
-import json
 from loguru import logger
 from fastapi import WebSocket
 import numpy as np
@@ -24,6 +23,59 @@ from .types import (
 from ..service_context import ServiceContext
 from ..chat_history_manager import store_message
 from .tts_manager import TTSTaskManager
+from ..utils import json_codec
+
+
+class DeferredTurnOutput:
+    """Holds the outgoing messages of a prepared turn until it may play.
+
+    A member's turn is generated while the previous speaker is still talking.
+    Everything the turn sends (text, audio payloads, tool status) is kept in
+    order and only delivered once `release()` is called, so the clients hear
+    the speakers one after another.
+    """
+
+    def __init__(
+        self, websocket_send: WebSocketSend, broadcast_func: BroadcastFunc
+    ) -> None:
+        self._websocket_send = websocket_send
+        self._broadcast_func = broadcast_func
+        self._pending: List[Callable[[], Awaitable[None]]] = []
+        self._released = False
+
+    async def send(self, message: str) -> None:
+        """Send a message to the speaker's client."""
+        await self._emit(lambda: self._websocket_send(message))
+
+    async def broadcast(
+        self,
+        group_members: List[str],
+        message: dict,
+        exclude_uid: Optional[str] = None,
+    ) -> None:
+        """Broadcast a message to the group."""
+        await self._emit(
+            lambda: self._broadcast_func(group_members, message, exclude_uid)
+        )
+
+    async def _emit(self, deliver: Callable[[], Awaitable[None]]) -> None:
+        if not self._released:
+            self._pending.append(deliver)
+            return
+        await deliver()
+
+    async def release(self) -> None:
+        """Deliver the held messages in order and pass later ones straight through."""
+        # Messages emitted while flushing are appended and picked up by this loop
+        while self._pending:
+            deliver = self._pending.pop(0)
+            await deliver()
+        self._released = True
+
+
+# A turn whose response is being generated:
+# (member uid, output, tts manager, task, agent memory checkpoint)
+PreparedTurn = Tuple[str, DeferredTurnOutput, TTSTaskManager, asyncio.Task, Any]
 
 
 async def process_group_conversation(
@@ -50,8 +102,9 @@ async def process_group_conversation(
         session_emoji: Emoji identifier for the conversation
         metadata: Optional metadata for special processing flags
     """
-    # Create TTSTaskManager for each member
-    tts_managers = {uid: TTSTaskManager() for uid in group_members}
+    # TTS managers of the turns in flight, cleaned up when the chain ends
+    tts_managers: List[TTSTaskManager] = []
+    prepared_turn: Optional[PreparedTurn] = None
 
     try:
         logger.info(f"Group Conversation Chain {session_emoji} started!")
@@ -106,33 +159,93 @@ async def process_group_conversation(
         state.conversation_history = [f"{human_name}: {input_text}"]
 
         is_first_responder = False
-        # Main conversation loop
-        while state.group_queue:
+
+        def prepare_turn(member_uid: str) -> PreparedTurn:
+            """Start generating a member's response in the background."""
+            nonlocal is_first_responder
+            # Only pass metadata to the first responder
+            current_metadata = None
+            if is_first_responder:
+                current_metadata = metadata
+                is_first_responder = False
+
+            output = DeferredTurnOutput(
+                client_connections[member_uid].send_text, broadcast_func
+            )
+            tts_manager = TTSTaskManager()
+            tts_managers.append(tts_manager)
+            # Lets an unplayed turn be taken back out of the member's memory
+            checkpoint = client_contexts[
+                member_uid
+            ].agent_engine.get_memory_checkpoint()
+            task = asyncio.create_task(
+                generate_group_member_turn(
+                    current_member_uid=member_uid,
+                    state=state,
+                    client_contexts=client_contexts,
+                    output=output,
+                    group_members=group_members,
+                    images=images,
+                    tts_manager=tts_manager,
+                    metadata=current_metadata,
+                )
+            )
+            return member_uid, output, tts_manager, task, checkpoint
+
+        # Main conversation loop: while one member plays its audio, the next
+        # member already generates its response; only playback is in order.
+        while state.group_queue or prepared_turn:
+            if prepared_turn is None:
+                prepared_turn = prepare_turn(state.group_queue.pop(0))
+            current_member_uid, output, tts_manager, generation, _ = prepared_turn
+            prepared_turn = None
+
+            # The previous speaker is done, let this member's output through
+            state.current_speaker_uid = current_member_uid
+            await output.release()
+
             try:
-                current_member_uid = state.group_queue.pop(0)
+                full_response = await generation
+            except Exception as e:
+                logger.error(f"Error in group member turn: {e}")
+                state.current_speaker_uid = None
+                await handle_member_error(
+                    broadcast_func, group_members, f"Error in conversation: {str(e)}"
+                )
+                continue
+
+            # The turn is playing, so the other members may now see it
+            record_member_response(
+                state=state,
+                current_member_uid=current_member_uid,
+                character_name=client_contexts[
+                    current_member_uid
+                ].character_config.character_name,
+                full_response=full_response,
+            )
 
-                # Only pass metadata to the first responder
-                current_metadata = None
-                if is_first_responder:
-                    current_metadata = metadata
-                    is_first_responder = False
+            # The next member can already see this response, start it right away
+            if state.group_queue:
+                prepared_turn = prepare_turn(state.group_queue.pop(0))
 
-                await handle_group_member_turn(
+            try:
+                await finish_group_member_turn(
                     current_member_uid=current_member_uid,
                     state=state,
                     client_contexts=client_contexts,
-                    client_connections=client_connections,
-                    broadcast_func=broadcast_func,
+                    output=output,
                     group_members=group_members,
-                    images=images,
-                    tts_manager=tts_managers[current_member_uid],
-                    metadata=current_metadata,
+                    tts_manager=tts_manager,
+                    full_response=full_response,
                 )
             except Exception as e:
                 logger.error(f"Error in group member turn: {e}")
                 await handle_member_error(
                     broadcast_func, group_members, f"Error in conversation: {str(e)}"
                 )
+            finally:
+                cleanup_conversation(tts_manager, session_emoji)
+                tts_managers.remove(tts_manager)
 
     except asyncio.CancelledError:
         logger.info(
@@ -146,8 +259,18 @@ async def process_group_conversation(
         )
         raise
     finally:
+        if prepared_turn:
+            # Nobody heard the prepared turn: stop it and take its response
+            # back out of the member's memory
+            member_uid, _, _, generation, checkpoint = prepared_turn
+            if not generation.done():
+                generation.cancel()
+            await asyncio.wait([generation])
+            client_contexts[member_uid].agent_engine.restore_memory_checkpoint(
+                checkpoint
+            )
         # Cleanup all TTS managers
-        for tts_manager in tts_managers.values():
+        for tts_manager in tts_managers:
             cleanup_conversation(tts_manager, session_emoji)
         # Clean up
         GroupConversationState.remove_state(state.group_id)
@@ -223,25 +346,28 @@ async def broadcast_transcription(
     )
 
 
-async def handle_group_member_turn(
+async def generate_group_member_turn(
     current_member_uid: str,
     state: GroupConversationState,
     client_contexts: Dict[str, ServiceContext],
-    client_connections: Dict[str, WebSocket],
-    broadcast_func: BroadcastFunc,
+    output: DeferredTurnOutput,
     group_members: List[str],
     images: Optional[List[Dict[str, Any]]],
     tts_manager: TTSTaskManager,
     metadata: Optional[Dict[str, Any]] = None,
-) -> None:
-    """Handle a single group member's conversation turn"""
-    # Update current speaker before processing
-    state.current_speaker_uid = current_member_uid
+) -> str:
+    """Generate a group member's response and start its TTS.
 
-    await broadcast_thinking_state(broadcast_func, group_members)
+    Messages go through `output`, which holds them while the previous member
+    is still speaking. The response only enters the group's conversation
+    history through `record_member_response` once the turn is playing.
+
+    Returns:
+        str: The member's full response
+    """
+    await broadcast_thinking_state(output.broadcast, group_members)
 
     context = client_contexts[current_member_uid]
-    current_ws_send = client_connections[current_member_uid].send_text
 
     new_messages = state.conversation_history[state.memory_index[current_member_uid] :]
     new_context = "\n".join(new_messages) if new_messages else ""
@@ -261,34 +387,62 @@ async def handle_group_member_turn(
     full_response = await process_member_response(
         context=context,
         batch_input=batch_input,
-        current_ws_send=current_ws_send,
+        current_ws_send=output.send,
         tts_manager=tts_manager,
-        broadcast_func=broadcast_func,
+        broadcast_func=output.broadcast,
         group_members=group_members,
     )
 
+    return full_response
+
+
+def record_member_response(
+    state: GroupConversationState,
+    current_member_uid: str,
+    character_name: str,
+    full_response: str,
+) -> None:
+    """Add a member's response to the group's conversation history and
+    queue the member for another turn"""
+    if full_response:
+        ai_message = f"{character_name}: {full_response}"
+        state.conversation_history.append(ai_message)
+        logger.info(f"Appended complete response: {ai_message}")
+
+    state.memory_index[current_member_uid] = len(state.conversation_history)
+    state.group_queue.append(current_member_uid)
+
+
+async def finish_group_member_turn(
+    current_member_uid: str,
+    state: GroupConversationState,
+    client_contexts: Dict[str, ServiceContext],
+    output: DeferredTurnOutput,
+    group_members: List[str],
+    tts_manager: TTSTaskManager,
+    full_response: str,
+) -> None:
+    """Wait until a generated turn finished playing and store its response"""
+    context = client_contexts[current_member_uid]
+
     if tts_manager.task_list:
         await asyncio.gather(*tts_manager.task_list)
-        await current_ws_send(json.dumps({"type": "backend-synth-complete"}))
+        await output.send(json_codec.dumps({"type": "backend-synth-complete"}))
 
         broadcast_ctx = BroadcastContext(
-            broadcast_func=broadcast_func,
+            broadcast_func=output.broadcast,
             group_members=group_members,
             current_client_uid=current_member_uid,
         )
 
         await finalize_conversation_turn(
             tts_manager=tts_manager,
-            websocket_send=current_ws_send,
+            websocket_send=output.send,
             client_uid=current_member_uid,
             broadcast_ctx=broadcast_ctx,
         )
 
     if full_response:
-        ai_message = f"{context.character_config.character_name}: {full_response}"
-        state.conversation_history.append(ai_message)
-        logger.info(f"Appended complete response: {ai_message}")
-
         for member_uid in group_members:
             member_context = client_contexts[member_uid]
             store_message(
@@ -302,9 +456,6 @@ async def handle_group_member_turn(
         else:
             logger.debug("Skipping storing AI response to history (proactive speak)")
 
-    state.memory_index[current_member_uid] = len(state.conversation_history)
-    state.group_queue.append(current_member_uid)
-
     # Clear speaker after turn completes
     state.current_speaker_uid = None
 
@@ -386,7 +537,7 @@ async def process_member_response(
     except Exception as e:
         logger.exception(f"Error processing group member response stream: {e}")
         await current_ws_send(
-            json.dumps(
+            json_codec.dumps(
                 {"type": "error", "message": f"Error processing response: {str(e)}"}
             )
         )
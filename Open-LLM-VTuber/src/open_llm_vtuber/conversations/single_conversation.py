@@ -1,6 +1,5 @@
 from typing import Union, List, Dict, Any, Optional
 import asyncio
-import json
 from loguru import logger
 import numpy as np
 
@@ -20,6 +19,7 @@ from ..service_context import ServiceContext
 
 # Import necessary types from agent outputs
 from ..agent.output_types import SentenceOutput, AudioOutput
+from ..utils import json_codec
 
 
 async def process_single_conversation(
@@ -98,7 +98,7 @@ async def process_single_conversation(
                     output_item["name"] = context.character_config.character_name
                     logger.debug(f"Sending tool status update: {output_item}")
 
-                    await websocket_send(json.dumps(output_item))
+                    await websocket_send(json_codec.dumps(output_item))
 
                 elif isinstance(output_item, (SentenceOutput, AudioOutput)):
                     # Handle SentenceOutput or AudioOutput
@@ -127,7 +127,7 @@ async def process_single_conversation(
                 f"Error processing agent response stream: {e}"
             )  # Log with stack trace
             await websocket_send(
-                json.dumps(
+                json_codec.dumps(
                     {
                         "type": "error",
                         "message": f"Error processing agent response: {str(e)}",
@@ -140,7 +140,7 @@ async def process_single_conversation(
         # Wait for any pending TTS tasks
         if tts_manager.task_list:
             await asyncio.gather(*tts_manager.task_list)
-            await websocket_send(json.dumps({"type": "backend-synth-complete"}))
+            await websocket_send(json_codec.dumps({"type": "backend-synth-complete"}))
 
         await finalize_conversation_turn(
             tts_manager=tts_manager,
@@ -167,7 +167,9 @@ async def process_single_conversation(
     except Exception as e:
         logger.error(f"Error in conversation chain: {e}")
         await websocket_send(
-            json.dumps({"type": "error", "message": f"Conversation error: {str(e)}"})
+            json_codec.dumps(
+                {"type": "error", "message": f"Conversation error: {str(e)}"}
+            )
         )
         raise
     finally:
@@ -1,9 +1,8 @@
 import asyncio
-import json
 import re
 import uuid
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from loguru import logger
 
 from ..agent.output_types import DisplayText, Actions
@@ -11,6 +10,7 @@ from ..live2d_model import Live2dModel
 from ..tts.tts_interface import TTSInterface
 from ..utils.stream_audio import prepare_audio_payload
 from .types import WebSocketSend
+from ..utils import json_codec
 
 
 class TTSTaskManager:
@@ -19,8 +19,8 @@ class TTSTaskManager:
     def __init__(self) -> None:
         self.task_list: List[asyncio.Task] = []
         self._lock = asyncio.Lock()
-        # Queue to store ordered payloads
-        self._payload_queue: asyncio.Queue[Dict] = asyncio.Queue()
+        # Queue to store ordered payloads, encoded as soon as they are ready
+        self._payload_queue: asyncio.Queue[Tuple[str, int]] = asyncio.Queue()
         # Task to handle sending payloads in order
         self._sender_task: Optional[asyncio.Task] = None
         # Counter for maintaining order
@@ -94,7 +94,7 @@ class TTSTaskManager:
         Process and send payloads in correct order.
         Runs continuously until all payloads are processed.
         """
-        buffered_payloads: Dict[int, Dict] = {}
+        buffered_payloads: Dict[int, str] = {}
 
         while True:
             try:
@@ -105,7 +105,7 @@ class TTSTaskManager:
                 # Send payloads in order
                 while self._next_sequence_to_send in buffered_payloads:
                     next_payload = buffered_payloads.pop(self._next_sequence_to_send)
-                    await websocket_send(json.dumps(next_payload))
+                    await websocket_send(json_codec.encode(next_payload))
                     self._next_sequence_to_send += 1
 
                 self._payload_queue.task_done()
@@ -125,7 +125,9 @@ class TTSTaskManager:
             display_text=display_text,
             actions=actions,
         )
-        await self._payload_queue.put((audio_payload, sequence_number))
+        await self._payload_queue.put(
+            (json_codec.dumps(audio_payload), sequence_number)
+        )
 
     async def _process_tts(
         self,
@@ -145,8 +147,8 @@ class TTSTaskManager:
                 display_text=display_text,
                 actions=actions,
             )
-            # Queue the payload with its sequence number
-            await self._payload_queue.put((payload, sequence_number))
+            # Queue the encoded payload with its sequence number
+            await self._payload_queue.put((json_codec.dumps(payload), sequence_number))
 
         except Exception as e:
             logger.error(f"Error preparing audio payload: {e}")
@@ -156,7 +158,7 @@ class TTSTaskManager:
                 display_text=display_text,
                 actions=actions,
             )
-            await self._payload_queue.put((payload, sequence_number))
+            await self._payload_queue.put((json_codec.dumps(payload), sequence_number))
 
         finally:
             if audio_file_path:
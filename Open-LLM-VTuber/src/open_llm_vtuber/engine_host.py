@@ -0,0 +1,373 @@
+"""
+Hosting of local ASR and TTS engines in worker processes.
+
+CPU-heavy engines run Python code that holds the GIL, which slows down the
+event loop serving every WebSocket even when they are called from a thread.
+An `EngineProcessPool` loads the engine in dedicated worker processes and
+calls it through a small RPC layer over pipes. NumPy arrays (e.g. the PCM
+audio to transcribe) are not pickled through the pipe but handed over in
+shared memory. `ProcessASR` and `ProcessTTS` wrap a pool in the regular
+engine interfaces, so the rest of the server does not know the difference.
+"""
+
+import multiprocessing
+import queue
+import threading
+import traceback
+import weakref
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from .asr.asr_interface import ASRInterface
+from .tts.tts_interface import TTSInterface
+
+# Seconds to wait for a worker to exit before it is terminated
+WORKER_SHUTDOWN_TIMEOUT = 5.0
+
+# Raised by the pipe of a worker process that died
+_WORKER_CRASH_ERRORS = (EOFError, BrokenPipeError, ConnectionResetError)
+
+# spawn works the same on every platform and is safe with CUDA
+_mp_context = multiprocessing.get_context("spawn")
+
+
+@dataclass
+class SharedArray:
+    """A NumPy array placed in a shared memory block."""
+
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+def _share_array(array: np.ndarray, blocks: List[shared_memory.SharedMemory]):
+    """Copy an array to a new shared memory block, kept in `blocks`."""
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    blocks.append(block)
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    return SharedArray(block.name, array.shape, array.dtype.str)
+
+
+def _load_array(ref: SharedArray) -> np.ndarray:
+    """Copy an array out of a shared memory block."""
+    block = shared_memory.SharedMemory(name=ref.name)
+    try:
+        return np.ndarray(ref.shape, dtype=ref.dtype, buffer=block.buf).copy()
+    finally:
+        block.close()
+
+
+def _encode(value: Any, blocks: List[shared_memory.SharedMemory]) -> Any:
+    """Move the arrays of an RPC payload to shared memory."""
+    if isinstance(value, np.ndarray):
+        return _share_array(value, blocks)
+    if isinstance(value, tuple):
+        return tuple(_encode(item, blocks) for item in value)
+    if isinstance(value, list):
+        return [_encode(item, blocks) for item in value]
+    if isinstance(value, dict):
+        return {key: _encode(item, blocks) for key, item in value.items()}
+    return value
+
+
+def _decode(value: Any) -> Any:
+    """Load the arrays of an RPC payload from shared memory."""
+    if isinstance(value, SharedArray):
+        return _load_array(value)
+    if isinstance(value, tuple):
+        return tuple(_decode(item) for item in value)
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _decode(item) for key, item in value.items()}
+    return value
+
+
+def _release(blocks: List[shared_memory.SharedMemory]) -> None:
+    for block in blocks:
+        block.close()
+        block.unlink()
+    blocks.clear()
+
+
+def _create_engine(kind: str, name: str, engine_kwargs: Dict[str, Any]):
+    if kind == "asr":
+        from .asr.asr_factory import ASRFactory
+
+        return ASRFactory.get_asr_system(name, **engine_kwargs)
+    if kind == "tts":
+        from .tts.tts_factory import TTSFactory
+
+        return TTSFactory.get_tts_engine(name, **engine_kwargs)
+    raise ValueError(f"Unknown engine kind: {kind}")
+
+
+def _worker_main(
+    kind: str, name: str, engine_kwargs: Dict[str, Any], conn: Connection
+) -> None:
+    """Load the engine, then serve calls until the pipe closes."""
+    try:
+        engine = _create_engine(kind, name, engine_kwargs)
+    except BaseException as e:
+        conn.send(("error", f"{type(e).__name__}: {e}", traceback.format_exc()))
+        return
+    conn.send(("ready", None, None))
+
+    blocks: List[shared_memory.SharedMemory] = []
+    try:
+        while True:
+            request = conn.recv()
+            if request is None:
+                break
+            # The caller has copied the arrays of the previous result
+            _release(blocks)
+            method, args, kwargs = request
+            try:
+                result = getattr(engine, method)(*_decode(args), **_decode(kwargs))
+                conn.send(("ok", _encode(result, blocks), None))
+            except Exception as e:
+                conn.send(("error", f"{type(e).__name__}: {e}", traceback.format_exc()))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        _release(blocks)
+
+
+class _Worker:
+    """A worker process and the parent's end of its pipe."""
+
+    def __init__(self, kind: str, name: str, engine_kwargs: Dict[str, Any]):
+        self.conn, child_conn = _mp_context.Pipe()
+        self.process = _mp_context.Process(
+            target=_worker_main,
+            args=(kind, name, engine_kwargs, child_conn),
+            name=f"{name}-worker",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+
+    def send(self, method: str, args: tuple, kwargs: dict, blocks) -> None:
+        self.conn.send((method, _encode(args, blocks), _encode(kwargs, blocks)))
+
+    def receive(self) -> Any:
+        status, value, details = self.conn.recv()
+        if status == "error":
+            logger.debug(f"Engine worker {self.process.name} error:\n{details}")
+            raise RuntimeError(f"Engine worker {self.process.name} failed: {value}")
+        return _decode(value)
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(WORKER_SHUTDOWN_TIMEOUT)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.conn.close()
+
+
+def _stop_workers(workers: List[_Worker]) -> None:
+    for worker in workers:
+        worker.stop()
+
+
+class EngineProcessPool:
+    """
+    Runs an engine in worker processes, each with its own engine instance.
+
+    Calls are thread-safe and go to the first idle worker, so up to
+    `processes` calls run in parallel on separate cores. A worker that
+    crashes is replaced and the call it was serving fails. If a worker
+    cannot be restarted the pool shrinks, and once no worker is left every
+    call fails right away.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        name: str,
+        engine_kwargs: Dict[str, Any],
+        processes: int = 1,
+    ):
+        """
+        Start the workers and wait until each one has loaded the engine.
+
+        Args:
+            kind: "asr" or "tts"
+            name: Engine name as used by the factory, e.g. "piper_tts"
+            engine_kwargs: Arguments of the engine factory
+            processes: Number of worker processes
+        """
+        self.kind = kind
+        self.name = name
+        self.engine_kwargs = engine_kwargs
+        self._workers: List[_Worker] = []
+        # Idle workers, or None once the pool has no workers left
+        self._idle: "queue.Queue[Optional[_Worker]]" = queue.Queue()
+        self._lock = threading.Lock()
+        # Stop the workers once the pool is garbage collected or at exit
+        self._finalizer = weakref.finalize(self, _stop_workers, self._workers)
+
+        logger.info(f"Starting {processes} worker process(es) for {name}")
+        try:
+            for _ in range(max(processes, 1)):
+                self._workers.append(_Worker(kind, name, engine_kwargs))
+            for worker in self._workers:
+                worker.receive()
+                self._idle.put(worker)
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def processes(self) -> int:
+        return len(self._workers)
+
+    def _replace(self, worker: _Worker) -> Optional[_Worker]:
+        """Replace a dead worker with a new one."""
+        logger.warning(f"Engine worker {worker.process.name} died, restarting it")
+        worker.stop()
+        try:
+            new_worker = _Worker(self.kind, self.name, self.engine_kwargs)
+            new_worker.receive()
+        except Exception as e:
+            logger.error(f"Failed to restart engine worker for {self.name}: {e}")
+            with self._lock:
+                self._workers.remove(worker)
+                if not self._workers:
+                    # Wake up the callers waiting for an idle worker
+                    self._idle.put(None)
+            return None
+        with self._lock:
+            self._workers[self._workers.index(worker)] = new_worker
+        return new_worker
+
+    def _take_worker(self) -> _Worker:
+        """Wait for an idle worker.
+
+        Raises:
+            RuntimeError: If the pool has no workers left
+        """
+        worker = self._idle.get() if self._workers else None
+        if worker is None:
+            # Pass the marker on to the next waiting caller
+            self._idle.put(None)
+            raise RuntimeError(f"No engine workers left for {self.name}")
+        return worker
+
+    def _call_worker(self, worker: _Worker, method: str, args, kwargs) -> Any:
+        blocks: List[shared_memory.SharedMemory] = []
+        try:
+            worker.send(method, args, kwargs, blocks)
+            return worker.receive()
+        finally:
+            _release(blocks)
+
+    def call(self, method: str, *args, **kwargs) -> Any:
+        """
+        Call an engine method in the first idle worker, blocking until done.
+
+        Args:
+            method: Name of the engine method, e.g. "generate_audio"
+            *args: Positional arguments, NumPy arrays go through shared memory
+            **kwargs: Keyword arguments
+
+        Returns:
+            The method's return value
+        """
+        worker = self._take_worker()
+        try:
+            return self._call_worker(worker, method, args, kwargs)
+        except _WORKER_CRASH_ERRORS:
+            worker = self._replace(worker)
+            raise RuntimeError(f"Engine worker for {self.name} crashed")
+        finally:
+            if worker is not None:
+                self._idle.put(worker)
+
+    def call_all(self, method: str, *args, **kwargs) -> None:
+        """Call an engine method in every worker at once, e.g. to warm up."""
+        workers: List[_Worker] = []
+        try:
+            # Take at least one, which fails if no worker is left
+            for _ in range(max(self.processes, 1)):
+                workers.append(self._take_worker())
+        except RuntimeError:
+            for worker in workers:
+                self._idle.put(worker)
+            raise
+
+        blocks: List[shared_memory.SharedMemory] = []
+        errors = []
+        crashed = []
+        try:
+            pending = []
+            for worker in workers:
+                try:
+                    worker.send(method, args, kwargs, blocks)
+                    pending.append(worker)
+                except _WORKER_CRASH_ERRORS:
+                    crashed.append(worker)
+            # Collect every answer so no worker is left with a pending one
+            for worker in pending:
+                try:
+                    worker.receive()
+                except RuntimeError as e:
+                    errors.append(e)
+                except _WORKER_CRASH_ERRORS:
+                    crashed.append(worker)
+        finally:
+            _release(blocks)
+            for worker in workers:
+                if worker in crashed:
+                    worker = self._replace(worker)
+                if worker is not None:
+                    self._idle.put(worker)
+        if crashed:
+            raise RuntimeError(
+                f"{len(crashed)} engine worker(s) for {self.name} crashed"
+            )
+        if errors:
+            raise errors[0]
+
+    def close(self) -> None:
+        """Stop all workers."""
+        self._finalizer()
+
+
+class ProcessASR(ASRInterface):
+    """ASR engine running in an `EngineProcessPool`."""
+
+    def __init__(self, name: str, engine_kwargs: Dict[str, Any], processes: int = 1):
+        self.pool = EngineProcessPool("asr", name, engine_kwargs, processes)
+
+    def transcribe_np(self, audio: np.ndarray) -> str:
+        return self.pool.call("transcribe_np", audio)
+
+    def warm_up(self) -> None:
+        self.pool.call_all("warm_up")
+
+
+class ProcessTTS(TTSInterface):
+    """
+    TTS engine running in an `EngineProcessPool`.
+
+    The workers write the audio files to the shared cache directory, so only
+    the file path comes back through the pipe.
+    """
+
+    def __init__(self, name: str, engine_kwargs: Dict[str, Any], processes: int = 1):
+        self.pool = EngineProcessPool("tts", name, engine_kwargs, processes)
+
+    def generate_audio(self, text: str, file_name_no_ext=None) -> str:
+        return self.pool.call("generate_audio", text, file_name_no_ext)
+
+    def warm_up(self) -> None:
+        self.pool.call_all("warm_up")
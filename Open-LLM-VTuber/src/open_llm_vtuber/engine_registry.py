@@ -0,0 +1,211 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from loguru import logger
+
+from .config_manager.system import EngineCacheConfig
+
+T = TypeVar("T")
+
+
+def get_engine_key(kind: str, name: str, engine_config: Dict[str, Any]) -> str:
+    """
+    Build the cache key of an engine.
+
+    Args:
+        kind: Engine kind, e.g. "asr"
+        name: Engine name, e.g. "sherpa_onnx_asr"
+        engine_config: Settings the engine is created with
+
+    Returns:
+        str: Hash of the kind, name and settings
+    """
+    payload = json.dumps(
+        [kind, name, engine_config], sort_keys=True, default=str, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_rss_bytes() -> Optional[int]:
+    """Resident memory of this process, or None if it cannot be read."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+@dataclass
+class _CachedEngine:
+    kind: str
+    name: str
+    engine: Any
+    size_bytes: int = 0
+    load_seconds: float = 0.0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class EngineRegistry:
+    """
+    Process-wide cache of loaded engines, keyed by a hash of their config.
+
+    Switching to a config whose engines were loaded before reuses the warm
+    instances instead of loading the models again. The least recently used
+    engines are evicted once there are more than `max_engines` of them or
+    their estimated memory exceeds the budget.
+
+    The memory of an engine is estimated from the growth of the process's
+    resident memory while it loads (Linux only, GPU memory is not counted).
+    Engines loading at the same time are each charged for the others'
+    growth, so the estimate errs on the high side. Engines still used by a
+    service context stay alive after eviction until that context lets go
+    of them.
+    """
+
+    def __init__(self, config: Optional[EngineCacheConfig] = None):
+        self.config = config or EngineCacheConfig()
+        self._engines: OrderedDict[str, _CachedEngine] = OrderedDict()
+        self._lock = threading.Lock()
+        # Per-key locks so an engine requested twice at once loads only once
+        self._loading: Dict[str, threading.Lock] = {}
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, config: EngineCacheConfig) -> None:
+        """Apply new cache limits, evicting engines that no longer fit."""
+        with self._lock:
+            self.config = config
+            self._evict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.max_engines > 0
+
+    def get_or_create(
+        self,
+        kind: str,
+        name: str,
+        engine_config: Dict[str, Any],
+        factory: Callable[[], T],
+    ) -> T:
+        """
+        Get a cached engine, or create and cache it.
+
+        Thread-safe, so engines can be loaded from worker threads.
+
+        Args:
+            kind: Engine kind, e.g. "asr"
+            name: Engine name, e.g. "sherpa_onnx_asr"
+            engine_config: Settings the engine is created with
+            factory: Creates the engine on a cache miss
+
+        Returns:
+            The cached or newly created engine
+        """
+        if not self.enabled:
+            return factory()
+
+        key = get_engine_key(kind, name, engine_config)
+        with self._lock:
+            key_lock = self._loading.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                cached = self._engines.get(key)
+                if cached is not None:
+                    self._engines.move_to_end(key)
+                    cached.last_used = time.monotonic()
+                    self.hits += 1
+                    logger.info(
+                        f"Reusing warm {kind.upper()} engine: {name} "
+                        f"(saved {cached.load_seconds:.2f}s of loading)"
+                    )
+                    return cached.engine
+
+            rss_before = get_rss_bytes()
+            start = time.perf_counter()
+            try:
+                engine = factory()
+            except BaseException:
+                with self._lock:
+                    self._loading.pop(key, None)
+                raise
+            load_seconds = time.perf_counter() - start
+            rss_after = get_rss_bytes()
+            size_bytes = (
+                max(rss_after - rss_before, 0)
+                if rss_before is not None and rss_after is not None
+                else 0
+            )
+
+            with self._lock:
+                self.misses += 1
+                self._engines[key] = _CachedEngine(
+                    kind, name, engine, size_bytes, load_seconds
+                )
+                # Only released once cached, so no one else loads it meanwhile
+                self._loading.pop(key, None)
+                self._evict(keep=key)
+            logger.debug(
+                f"Cached {kind.upper()} engine {name} "
+                f"(~{size_bytes / 1024 / 1024:.0f} MB, loaded in {load_seconds:.2f}s)"
+            )
+            return engine
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """Evict least recently used engines until the cache fits its limits."""
+        budget = self.config.memory_budget_mb * 1024 * 1024
+        while self._engines:
+            too_many = len(self._engines) > self.config.max_engines
+            too_big = budget > 0 and self.memory_bytes > budget
+            if not too_many and not too_big:
+                return
+            key = next(iter(self._engines))
+            if key == keep:
+                # Never evict the engine that was just requested
+                if len(self._engines) == 1:
+                    return
+                self._engines.move_to_end(key)
+                key = next(iter(self._engines))
+            cached = self._engines.pop(key)
+            self.evictions += 1
+            logger.info(
+                f"Evicted {cached.kind.upper()} engine {cached.name} from the "
+                f"engine cache (~{cached.size_bytes / 1024 / 1024:.0f} MB)"
+            )
+
+    @property
+    def memory_bytes(self) -> int:
+        """Estimated memory of the cached engines."""
+        return sum(cached.size_bytes for cached in self._engines.values())
+
+    def clear(self) -> None:
+        """Drop all cached engines."""
+        with self._lock:
+            self._engines.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache metrics."""
+        with self._lock:
+            return {
+                "engines": [
+                    f"{cached.kind}:{cached.name}" for cached in self._engines.values()
+                ],
+                "memory_mb": round(self.memory_bytes / 1024 / 1024, 1),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+# Shared by all service contexts of the process
+engine_registry = EngineRegistry()
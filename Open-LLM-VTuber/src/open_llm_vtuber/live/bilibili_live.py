@@ -2,15 +2,17 @@ import asyncio
 import http.cookies
 import random
 import traceback
-import json
-from typing import Callable, Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional
 from loguru import logger
 import aiohttp
 import websockets
 import sys
 import os
 
-from .live_interface import LivePlatformInterface
+from .live_interface import LivePlatformInterface, MessageHandler
+from .danmaku_aggregator import DanmakuAggregator
+from ..config_manager.live import DanmakuAggregationConfig
+from ..utils import json_codec
 
 # Import the blivedm library
 try:
@@ -36,13 +38,20 @@ class BiliBiliLivePlatform(LivePlatformInterface):
     Connects to a BiliBili live room and forwards danmaku messages to the VTuber.
     """
 
-    def __init__(self, room_ids: List[int], sessdata: str = ""):
+    def __init__(
+        self,
+        room_ids: List[int],
+        sessdata: str = "",
+        aggregation_config: Optional[DanmakuAggregationConfig] = None,
+    ):
         """
         Initialize the BiliBili Live platform client.
 
         Args:
             room_ids: List of room IDs to monitor
             sessdata: Optional SESSDATA cookie value for authentication
+            aggregation_config: Danmaku batching settings. Defaults to
+                batching with the default settings.
         """
         if not BLIVEDM_AVAILABLE:
             raise ImportError(
@@ -56,9 +65,15 @@ class BiliBiliLivePlatform(LivePlatformInterface):
         self._websocket: Optional[websockets.WebSocketClientProtocol] = None
         self._connected = False
         self._running = False
-        self._message_handlers: List[Callable[[Dict[str, Any]], None]] = []
         self._conversation_active = False
 
+        aggregation_config = aggregation_config or DanmakuAggregationConfig()
+        self._aggregator: Optional[DanmakuAggregator] = (
+            DanmakuAggregator(self._send_to_proxy, aggregation_config)
+            if aggregation_config.enabled
+            else None
+        )
+
     @property
     def is_connected(self) -> bool:
         """Check if connected to the proxy server."""
@@ -112,6 +127,11 @@ class BiliBiliLivePlatform(LivePlatformInterface):
         """
         self._running = False
 
+        if self._aggregator:
+            await self._aggregator.stop()
+
+        await self.dispatcher.aclose()
+
         # Stop BiliBili client if running
         if self._client:
             try:
@@ -156,16 +176,38 @@ class BiliBiliLivePlatform(LivePlatformInterface):
         return False
 
     async def register_message_handler(
-        self, handler: Callable[[Dict[str, Any]], None]
+        self,
+        handler: MessageHandler,
+        message_types: Optional[Iterable[str]] = None,
     ) -> None:
         """
         Register a callback for handling incoming messages.
 
         Args:
-            handler: Function to call when a message is received
+            handler: Sync or async function to call when a message is received
+            message_types: Message types the handler wants, or None for all
+        """
+        self.dispatcher.register(handler, message_types)
+        logger.debug(
+            f"Registered new message handler for {message_types or 'all messages'}"
+        )
+
+    def _on_danmaku_received(
+        self, danmaku_text: str, user: str = "", paid_weight: float = 0.0
+    ) -> None:
         """
-        self._message_handlers.append(handler)
-        logger.debug("Registered new message handler")
+        Hand a received danmaku to the aggregator, or forward it right away
+        if aggregation is disabled.
+
+        Args:
+            danmaku_text: The danmaku text received from BiliBili
+            user: Name of the viewer who sent it
+            paid_weight: Value paid with it, e.g. the super chat price in yuan
+        """
+        if self._aggregator:
+            self._aggregator.add_danmaku(danmaku_text, user, paid_weight)
+        else:
+            asyncio.create_task(self._handle_danmaku(danmaku_text))
 
     async def _handle_danmaku(self, danmaku_text: str):
         """
@@ -196,7 +238,7 @@ class BiliBiliLivePlatform(LivePlatformInterface):
 
         try:
             message = {"type": "text-input", "text": text}
-            await self._websocket.send(json.dumps(message))
+            await self._websocket.send(json_codec.dumps(message))
             logger.info(f"Sent danmaku to VTuber: {text}")
             return True
         except Exception as e:
@@ -218,17 +260,18 @@ class BiliBiliLivePlatform(LivePlatformInterface):
             while self._running and self.is_connected:
                 try:
                     message = await self._websocket.recv()
-                    data = json.loads(message)
-
-                    # Log received message (truncate audio data for readability)
-                    if "audio" in data:
-                        log_data = data.copy()
-                        log_data["audio"] = (
-                            f"[Audio data, length: {len(data['audio'])}]"
-                        )
-                        logger.debug(f"Received message from VTuber: {log_data}")
+                    header = json_codec.peek_header(message)
+
+                    # Only decode messages a handler wants, audio payloads
+                    # are usually skipped without being parsed
+                    if self.dispatcher.wants(header.get("type")):
+                        data = json_codec.loads(message)
                     else:
-                        logger.debug(f"Received message from VTuber: {data}")
+                        data = header
+                    logger.debug(
+                        f"Received '{header.get('type')}' message from VTuber "
+                        f"({len(message)} chars)"
+                    )
 
                     # Process the message
                     await self.handle_incoming_messages(data)
@@ -252,12 +295,16 @@ class BiliBiliLivePlatform(LivePlatformInterface):
         Args:
             message: The message received from the VTuber
         """
-        # Process the message with all registered handlers
-        for handler in self._message_handlers:
-            try:
-                await asyncio.to_thread(handler, message)
-            except Exception as e:
-                logger.error(f"Error in message handler: {e}")
+        if (
+            self._aggregator
+            and message.get("type") == "control"
+            and message.get("text") == "conversation-chain-end"
+        ):
+            # The VTuber is free for the next danmaku digest
+            self._aggregator.mark_turn_complete()
+
+        # Hand the message to the handlers without waiting for them
+        self.dispatcher.dispatch(message)
 
     class VtuberHandler(BaseHandler):
         """
@@ -279,7 +326,45 @@ class BiliBiliLivePlatform(LivePlatformInterface):
                 message: The danmaku message
             """
             logger.debug(f"[Room {client.room_id}] {message.uname}: {message.msg}")
-            asyncio.create_task(self.platform._handle_danmaku(message.msg))
+            self.platform._on_danmaku_received(message.msg, message.uname)
+
+        def _on_super_chat(
+            self, client: blivedm.BLiveClient, message: web_models.SuperChatMessage
+        ):
+            """
+            Handle super chat message from BiliBili Live.
+
+            Args:
+                client: The BiliBili Live client
+                message: The super chat message
+            """
+            logger.debug(
+                f"[Room {client.room_id}] Super chat ¥{message.price} "
+                f"{message.uname}: {message.message}"
+            )
+            self.platform._on_danmaku_received(
+                message.message, message.uname, paid_weight=message.price
+            )
+
+        def _on_gift(
+            self, client: blivedm.BLiveClient, message: web_models.GiftMessage
+        ):
+            """
+            Handle gift message from BiliBili Live.
+
+            Args:
+                client: The BiliBili Live client
+                message: The gift message
+            """
+            logger.debug(
+                f"[Room {client.room_id}] {message.uname} sent "
+                f"{message.gift_name} x{message.num}"
+            )
+            if self.platform._aggregator and message.coin_type == "gold":
+                # 1000 gold coins are worth one yuan
+                self.platform._aggregator.add_gift(
+                    message.uname, message.total_coin / 1000
+                )
 
         def _on_heartbeat(
             self, client: blivedm.BLiveClient, message: web_models.HeartbeatMessage
@@ -316,6 +401,9 @@ class BiliBiliLivePlatform(LivePlatformInterface):
             # Start background task for receiving messages from the proxy
             receive_task = asyncio.create_task(self.start_receiving())
 
+            if self._aggregator:
+                self._aggregator.start()
+
             # Randomly select a room ID if multiple are provided
             room_id = random.choice(self._room_ids)
 
@@ -0,0 +1,247 @@
+import asyncio
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from loguru import logger
+
+from ..config_manager.live import DanmakuAggregationConfig
+
+# Score added per unit of paid weight (e.g. one yuan of super chat)
+PAID_WEIGHT_FACTOR = 1.0
+# Characters repeated more than this many times are collapsed when comparing
+# messages, so "hahahaha" and "hahaha" count as the same message
+MAX_REPEATED_CHARS = 3
+
+_REPEATED_CHARS_PATTERN = re.compile(r"(.)\1{%d,}" % MAX_REPEATED_CHARS)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_danmaku(text: str) -> str:
+    """
+    Normalize a danmaku for deduplication.
+
+    Args:
+        text: Danmaku text
+
+    Returns:
+        str: Lowercased text with collapsed whitespace and character runs
+    """
+    text = _WHITESPACE_PATTERN.sub(" ", text.strip().lower())
+    return _REPEATED_CHARS_PATTERN.sub(lambda m: m.group(1) * MAX_REPEATED_CHARS, text)
+
+
+@dataclass
+class AggregatedDanmaku:
+    """A danmaku and all its duplicates received in the current window."""
+
+    text: str
+    users: List[str] = field(default_factory=list)
+    count: int = 0
+    paid_weight: float = 0.0
+    first_received_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def score(self) -> float:
+        """Ranking score: how many viewers said it, plus what they paid."""
+        return (
+            len(self.users) + self.count * 0.1 + self.paid_weight * PAID_WEIGHT_FACTOR
+        )
+
+
+class DanmakuAggregator:
+    """
+    Batches danmaku into digest turns so a busy room cannot flood the VTuber.
+
+    Danmaku received during a window are deduplicated and ranked by how many
+    viewers sent them and how much they paid (super chats, gifts). Only the
+    top ranked ones are sent, as a single text input, and the next digest is
+    only sent once the VTuber finished answering the previous one. Danmaku
+    that are left over when a digest is sent are stale and dropped, and the
+    number of distinct pending danmaku is capped.
+    """
+
+    def __init__(
+        self,
+        send_func: Callable[[str], Awaitable[bool]],
+        config: Optional[DanmakuAggregationConfig] = None,
+    ):
+        """
+        Initialize the aggregator.
+
+        Args:
+            send_func: Sends a text input to the VTuber, returns success
+            config: Aggregation settings
+        """
+        self._send_func = send_func
+        self.config = config or DanmakuAggregationConfig()
+
+        # Normalized text -> aggregated danmaku, in arrival order
+        self._pending: OrderedDict[str, AggregatedDanmaku] = OrderedDict()
+        # Gift value per user in the current window, applied to their danmaku
+        self._user_gifts: Dict[str, float] = {}
+        self._has_pending = asyncio.Event()
+        self._turn_free = asyncio.Event()
+        self._turn_free.set()
+        self._turn_started_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.received = 0
+        self.merged = 0
+        self.dropped_overflow = 0
+        self.dropped_stale = 0
+        self.digests_sent = 0
+        self.danmaku_sent = 0
+
+    def start(self) -> None:
+        """Start sending digests in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sending digests and log the metrics."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        logger.info(f"Danmaku aggregation stats: {self.get_stats()}")
+
+    def add_danmaku(self, text: str, user: str = "", paid_weight: float = 0.0) -> None:
+        """
+        Add a danmaku to the current window.
+
+        Args:
+            text: Danmaku text
+            user: Name of the viewer who sent it
+            paid_weight: Value the viewer paid with it, e.g. super chat price
+        """
+        if not text or not text.strip():
+            return
+        self.received += 1
+
+        key = normalize_danmaku(text)
+        entry = self._pending.get(key)
+        if entry is not None:
+            self.merged += 1
+        else:
+            if len(self._pending) >= self.config.max_pending:
+                if self.config.drop_policy == "newest":
+                    self.dropped_overflow += 1
+                    return
+                self._pending.popitem(last=False)
+                self.dropped_overflow += 1
+            entry = AggregatedDanmaku(text=text.strip())
+            self._pending[key] = entry
+
+        entry.count += 1
+        if user and user not in entry.users:
+            entry.users.append(user)
+            entry.paid_weight += self._user_gifts.get(user, 0.0)
+        entry.paid_weight += paid_weight
+        self._has_pending.set()
+
+    def add_gift(self, user: str, value: float) -> None:
+        """
+        Record a gift, boosting the danmaku of the viewer in this window.
+
+        Args:
+            user: Name of the viewer who sent the gift
+            value: Value of the gift
+        """
+        if not user or value <= 0:
+            return
+        self._user_gifts[user] = self._user_gifts.get(user, 0.0) + value
+        for entry in self._pending.values():
+            if user in entry.users:
+                entry.paid_weight += value
+
+    def mark_turn_complete(self) -> None:
+        """Signal that the VTuber finished a conversation turn."""
+        self._turn_free.set()
+
+    def _take_digest(self) -> List[AggregatedDanmaku]:
+        """Take the top ranked danmaku and drop the rest of the window."""
+        ranked = sorted(
+            self._pending.values(),
+            key=lambda entry: (-entry.score, entry.first_received_at),
+        )
+        selected = ranked[: self.config.max_items_per_turn]
+        self.dropped_stale += sum(entry.count for entry in ranked[len(selected) :])
+        self._pending.clear()
+        self._user_gifts.clear()
+        self._has_pending.clear()
+        return selected
+
+    @staticmethod
+    def format_digest(entries: List[AggregatedDanmaku]) -> str:
+        """
+        Format danmaku as a single text input.
+
+        A lone danmaku sent by a single viewer is passed on unchanged.
+        """
+        if len(entries) == 1 and entries[0].count == 1:
+            return entries[0].text
+
+        lines = []
+        for entry in entries:
+            line = f"{entry.users[0]}: {entry.text}" if entry.users else entry.text
+            if len(entry.users) > 1:
+                line += f" (x{len(entry.users)})"
+            elif entry.count > 1:
+                line += f" (x{entry.count})"
+            lines.append(line)
+        return "\n".join(lines)
+
+    async def _wait_for_turn(self) -> None:
+        """Wait until the previous digest was answered, or it timed out."""
+        if self._turn_free.is_set():
+            return
+        remaining = self.config.turn_timeout - (
+            time.monotonic() - self._turn_started_at
+        )
+        try:
+            await asyncio.wait_for(self._turn_free.wait(), timeout=max(remaining, 0))
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"No conversation end after {self.config.turn_timeout}s, "
+                "sending the next danmaku digest"
+            )
+
+    async def _run(self) -> None:
+        """Send one digest per window, never more than one turn at a time."""
+        while True:
+            await self._has_pending.wait()
+            # Collect danmaku for the rest of the window
+            await asyncio.sleep(self.config.window_seconds)
+            await self._wait_for_turn()
+
+            entries = self._take_digest()
+            if not entries:
+                continue
+
+            self._turn_free.clear()
+            self._turn_started_at = time.monotonic()
+            if await self._send_func(self.format_digest(entries)):
+                self.digests_sent += 1
+                self.danmaku_sent += sum(entry.count for entry in entries)
+            else:
+                self._turn_free.set()
+            logger.debug(f"Danmaku aggregation stats: {self.get_stats()}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get aggregation metrics."""
+        return {
+            "received": self.received,
+            "merged": self.merged,
+            "dropped_overflow": self.dropped_overflow,
+            "dropped_stale": self.dropped_stale,
+            "digests_sent": self.digests_sent,
+            "danmaku_sent": self.danmaku_sent,
+            "pending": len(self._pending),
+        }
@@ -1,6 +1,187 @@
 from abc import ABC, abstractmethod
 import asyncio
-from typing import Callable, Dict, Any
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+
+from loguru import logger
+
+MessageHandler = Callable[[Dict[str, Any]], Union[None, Awaitable[None]]]
+
+# Threads shared by all synchronous handlers of a platform
+DEFAULT_HANDLER_WORKERS = 2
+# Messages waiting per handler before the oldest ones are dropped
+DEFAULT_HANDLER_QUEUE_SIZE = 100
+# Handler calls slower than this are logged
+SLOW_HANDLER_SECONDS = 0.5
+
+
+class _RegisteredHandler:
+    """A handler with its message filter, queue, worker task and metrics."""
+
+    def __init__(
+        self,
+        handler: MessageHandler,
+        message_types: Optional[Iterable[str]],
+        queue_size: int,
+    ):
+        self.handler = handler
+        self.name = getattr(handler, "__qualname__", repr(handler))
+        self.message_types = frozenset(message_types) if message_types else None
+        self.is_async = inspect.iscoroutinefunction(handler)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.task: Optional[asyncio.Task] = None
+
+        self.calls = 0
+        self.errors = 0
+        self.dropped = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def accepts(self, message_type: Optional[str]) -> bool:
+        return self.message_types is None or message_type in self.message_types
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "dropped": self.dropped,
+            "pending": self.queue.qsize(),
+            "avg_ms": self.total_time / self.calls * 1000 if self.calls else 0.0,
+            "max_ms": self.max_time * 1000,
+        }
+
+
+class MessageHandlerDispatcher:
+    """
+    Dispatches messages from the VTuber to the registered handlers.
+
+    Each handler only receives the message types it registered for and has
+    its own bounded queue and worker, so handlers get messages in order but
+    a slow handler never blocks the receive loop or the other handlers.
+    Async handlers run on the event loop; sync handlers run on a small
+    thread pool shared by the platform.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_HANDLER_WORKERS,
+        queue_size: int = DEFAULT_HANDLER_QUEUE_SIZE,
+    ):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            max_workers: Threads for synchronous handlers
+            queue_size: Messages waiting per handler before the oldest ones
+                are dropped
+        """
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self._handlers: List[_RegisteredHandler] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def register(
+        self,
+        handler: MessageHandler,
+        message_types: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Register a handler.
+
+        Args:
+            handler: Sync or async function taking a message dict
+            message_types: Message types the handler wants, or None for all
+        """
+        self._handlers.append(
+            _RegisteredHandler(handler, message_types, self.queue_size)
+        )
+
+    def unregister(self, handler: MessageHandler) -> None:
+        """Remove a handler and stop its worker."""
+        for registered in [h for h in self._handlers if h.handler is handler]:
+            self._handlers.remove(registered)
+            if registered.task:
+                registered.task.cancel()
+
+    def wants(self, message_type: Optional[str]) -> bool:
+        """Check whether any handler wants messages of the given type."""
+        return any(h.accepts(message_type) for h in self._handlers)
+
+    def dispatch(self, message: Dict[str, Any]) -> None:
+        """
+        Queue a message for every handler that wants its type.
+
+        Returns immediately; handlers run in their own workers.
+        """
+        message_type = message.get("type")
+        for registered in self._handlers:
+            if not registered.accepts(message_type):
+                continue
+            if registered.queue.full():
+                registered.queue.get_nowait()
+                registered.dropped += 1
+                logger.warning(
+                    f"Live message handler {registered.name} is falling behind, "
+                    "dropped its oldest message"
+                )
+            registered.queue.put_nowait(message)
+            if registered.task is None or registered.task.done():
+                registered.task = asyncio.create_task(self._run_handler(registered))
+
+    async def _run_handler(self, registered: _RegisteredHandler) -> None:
+        """Feed queued messages to a handler one at a time."""
+        while True:
+            message = await registered.queue.get()
+            start = time.perf_counter()
+            try:
+                if registered.is_async:
+                    await registered.handler(message)
+                else:
+                    await asyncio.get_running_loop().run_in_executor(
+                        self._get_executor(), registered.handler, message
+                    )
+            except Exception as e:
+                registered.errors += 1
+                logger.error(f"Error in message handler {registered.name}: {e}")
+            finally:
+                elapsed = time.perf_counter() - start
+                registered.calls += 1
+                registered.total_time += elapsed
+                registered.max_time = max(registered.max_time, elapsed)
+                if elapsed > SLOW_HANDLER_SECONDS:
+                    logger.warning(
+                        f"Live message handler {registered.name} took "
+                        f"{elapsed * 1000:.0f} ms for a '{message.get('type')}' message"
+                    )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="live-handler"
+            )
+        return self._executor
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the latency and drop metrics of every handler."""
+        return {h.name: h.get_stats() for h in self._handlers}
+
+    async def aclose(self) -> None:
+        """Stop all handler workers and the thread pool."""
+        for registered in self._handlers:
+            if registered.task and not registered.task.done():
+                registered.task.cancel()
+                try:
+                    await registered.task
+                except asyncio.CancelledError:
+                    pass
+            registered.task = None
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._handlers:
+            logger.info(f"Live message handler stats: {self.get_stats()}")
 
 
 class LivePlatformInterface(ABC):
@@ -9,8 +190,21 @@ class LivePlatformInterface(ABC):
     This interface defines the methods that any live platform implementation must provide.
     It handles connecting to the VTuber server via proxy, sending messages from the live platform,
     and receiving responses.
+
+    Responses are delivered to registered handlers through `dispatcher`, which
+    filters them by message type and runs the handlers without blocking the
+    receive loop.
     """
 
+    _dispatcher: Optional[MessageHandlerDispatcher] = None
+
+    @property
+    def dispatcher(self) -> MessageHandlerDispatcher:
+        """Dispatcher of the handlers registered for messages from the VTuber."""
+        if self._dispatcher is None:
+            self._dispatcher = MessageHandlerDispatcher()
+        return self._dispatcher
+
     @abstractmethod
     async def connect(self, proxy_url: str) -> bool:
         """
@@ -46,13 +240,17 @@ class LivePlatformInterface(ABC):
 
     @abstractmethod
     async def register_message_handler(
-        self, handler: Callable[[Dict[str, Any]], None]
+        self,
+        handler: MessageHandler,
+        message_types: Optional[Iterable[str]] = None,
     ) -> None:
         """
         Register a callback function to handle response messages from the VTuber.
 
         Args:
-            handler: Callback function that takes a message dict as parameter
+            handler: Sync or async callback function that takes a message dict
+                as parameter
+            message_types: Message types the handler wants, or None for all
         """
         pass
 
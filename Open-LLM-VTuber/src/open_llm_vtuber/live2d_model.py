@@ -1,4 +1,5 @@
 import json
+import re
 import sys
 import chardet
 from pathlib import Path
@@ -40,6 +41,7 @@ class Live2dModel:
     model_info: dict
     emo_map: dict
     emo_str: str
+    _emo_pattern: re.Pattern | None
 
     def __init__(
         self, live2d_model_name: str, model_dict_path: str | None = None
@@ -56,7 +58,7 @@ class Live2dModel:
 
     def set_model(self, model_name: str) -> None:
         """
-        Set the model with its name and load the model information. This method will initialize the `self.model_info`, `self.emo_map`, and `self.emo_str` attributes.
+        Set the model with its name and load the model information. This method will initialize the `self.model_info`, `self.emo_map`, and `self.emo_str` attributes, and compile the emotion tag matcher.
         This method is called in the constructor.
 
         Parameters:
@@ -74,6 +76,18 @@ class Live2dModel:
         # emo_str is a string of the keys in the emoMap dictionary. The keys are enclosed in square brackets.
         # example: `"[fear], [anger], [disgust], [sadness], [joy], [neutral], [surprise]"`
 
+        # A single alternation of every `[key]` tag, so sentences are scanned once
+        # regardless of how many expressions the model has.
+        # Longer keys first, so the longest tag wins when one tag is a prefix of another.
+        sorted_keys = sorted(self.emo_map.keys(), key=len, reverse=True)
+        self._emo_pattern = (
+            re.compile(
+                "|".join(re.escape(f"[{key}]") for key in sorted_keys), re.IGNORECASE
+            )
+            if sorted_keys
+            else None
+        )
+
     def _load_file_content(self, file_path: str) -> str:
         """Load the content of a file with robust encoding handling."""
         # Try common encodings first
@@ -176,22 +190,12 @@ class Live2dModel:
             list: A list of values of the emotions found in the string. An empty list is returned if no emotions are found.
         """
 
-        expression_list = []
-        str_to_check = str_to_check.lower()
-
-        i = 0
-        while i < len(str_to_check):
-            if str_to_check[i] != "[":
-                i += 1
-                continue
-            for key in self.emo_map.keys():
-                emo_tag = f"[{key}]"
-                if str_to_check[i : i + len(emo_tag)] == emo_tag:
-                    expression_list.append(self.emo_map[key])
-                    i += len(emo_tag) - 1
-                    break
-            i += 1
-        return expression_list
+        if self._emo_pattern is None:
+            return []
+        return [
+            self.emo_map[match.group(0)[1:-1].lower()]
+            for match in self._emo_pattern.finditer(str_to_check)
+        ]
 
     def remove_emotion_keywords(self, target_str: str) -> str:
         """
@@ -204,13 +208,29 @@ class Live2dModel:
             str: The cleaned string with the emotion keywords removed.
         """
 
-        lower_str = target_str.lower()
+        if self._emo_pattern is None:
+            return target_str
+        return self._emo_pattern.sub("", target_str)
+
+    def extract_and_remove_emotion(self, target_str: str) -> tuple[list, str]:
+        """
+        Extract the expression indices and remove the emotion keywords in a single pass.
+
+        Parameters:
+            target_str (str): The string to check for emotions.
+
+        Returns:
+            tuple[list, str]: The values of the emotions found in the string, in order of appearance, and the cleaned string with the emotion keywords removed.
+        """
+
+        if self._emo_pattern is None:
+            return [], target_str
+
+        expression_list = []
+
+        def _collect(match: re.Match) -> str:
+            expression_list.append(self.emo_map[match.group(0)[1:-1].lower()])
+            return ""
 
-        for key in self.emo_map.keys():
-            lower_key = f"[{key}]".lower()
-            while lower_key in lower_str:
-                start_index = lower_str.find(lower_key)
-                end_index = start_index + len(lower_key)
-                target_str = target_str[:start_index] + target_str[end_index:]
-                lower_str = lower_str[:start_index] + lower_str[end_index:]
-        return target_str
+        cleaned_str = self._emo_pattern.sub(_collect, target_str)
+        return expression_list, cleaned_str
@@ -1,16 +1,60 @@
 import json
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Set
 from loguru import logger
 
 
+class _JSONCandidate:
+    """An object candidate (a `{` and, once closed, its matching `}`) in the buffer."""
+
+    __slots__ = ("start", "end", "children")
+
+    def __init__(self, start: int):
+        self.start = start
+        self.end = -1
+        self.children: List["_JSONCandidate"] = []
+
+
+# Parser states of an open object or array
+_KEY_OR_END = "key_or_end"  # After `{`: a key or `}`
+_KEY = "key"  # After `,` in an object: a key
+_COLON = "colon"  # After a key: `:`
+_VALUE = "value"  # After `:` or `,` in an array: a value
+_VALUE_OR_END = "value_or_end"  # After `[`: a value or `]`
+_COMMA_OR_END = "comma_or_end"  # After a value: `,` or the closing bracket
+
+
+def _is_literal_char(char: str) -> bool:
+    """Whether a character can be part of a number, `true`, `false` or `null`."""
+    return char.isalnum() or char in "+-."
+
+
 class StreamJSONDetector:
-    """Detector for real-time JSON detection in streaming text."""
+    """Detector for real-time JSON detection in streaming text.
+
+    Works as a streaming state machine over the characters of the stream: it
+    tracks object nesting, string/escape state and the expected next token
+    incrementally, so every character is scanned once. A candidate object is
+    parsed only when its outermost `}` arrives. As soon as a character shows
+    that the open candidates cannot be JSON (e.g. a stray `{` in plain text),
+    they are dropped and the text after the first of them is scanned again,
+    so a stray brace never hides a later object. The dropped candidates are
+    skipped by that rescan: a candidate nested in a failed one fails at the
+    same character, so scanning it again would only repeat the work. Text
+    that can no longer be part of a JSON object is dropped from the buffer.
+    """
 
     def __init__(self):
         self.buffer = ""  # Store text that has not been fully processed
-        self.potential_jsons = []  # Store possible JSON starting positions
         self.completed_jsons = []  # Store completed JSON objects
-        self.processed_ranges = []  # Store processed intervals [start, end]
+        self._scan_pos = 0  # Position in buffer up to which text has been scanned
+        self._open_candidates: List[_JSONCandidate] = []  # Unclosed objects
+        # Buffer positions of `{` known not to start a JSON object
+        self._failed_starts: Set[int] = set()
+        # Kind (`{` or `[`) and parser state of each open object or array
+        self._containers: List[List[str]] = []
+        self._in_string = False
+        self._escape = False
+        self._in_literal = False
 
     def process_chunk(self, chunk: str) -> List[Dict[str, Any]]:
         """Process a single text chunk, return a list of complete JSON objects found in this chunk.
@@ -21,104 +65,188 @@ class StreamJSONDetector:
         Returns:
             List[Dict[str, Any]]: List of complete JSON objects parsed from the current chunk
         """
-        # Add new chunk to buffer
-        old_length = len(self.buffer)
         self.buffer += chunk
+        new_jsons = []
 
-        # Update potential JSON starting positions
-        self._find_potential_starts(old_length)
+        i = self._scan_pos
+        while i < len(self.buffer):
+            char = self.buffer[i]
+
+            if not self._open_candidates:
+                # Outside of any object, only `{` is interesting
+                next_start = self.buffer.find("{", i)
+                while next_start in self._failed_starts:
+                    next_start = self.buffer.find("{", next_start + 1)
+                if next_start == -1:
+                    i = len(self.buffer)
+                    break
+                self._open_candidates.append(_JSONCandidate(next_start))
+                self._containers.append(["{", _KEY_OR_END])
+                i = next_start + 1
+                continue
 
-        # Try to parse potential JSON objects
-        new_jsons = self._try_parse_jsons()
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                i += 1
+                continue
 
-        return new_jsons
+            if self._in_literal:
+                if _is_literal_char(char):
+                    i += 1
+                    continue
+                self._in_literal = False
 
-    def _find_potential_starts(self, start_from: int) -> None:
-        """Find new potential JSON starting positions in the buffer.
+            if char.isspace():
+                i += 1
+                continue
 
-        Args:
-            start_from (int): Position to start searching from
-        """
-        for i in range(start_from, len(self.buffer)):
-            if self.buffer[i] == "{" and not self._is_in_processed_range(i):
-                self.potential_jsons.append(i)
+            if not self._accept(char, i, new_jsons):
+                # The open candidates cannot be JSON, so their `{` belong to
+                # plain text. Drop them and rescan after the first one. The
+                # innermost object is the same wherever the scan started, so
+                # each of them would fail here again: skip them in the rescan.
+                logger.debug(
+                    f"Discarding non-JSON brace: {self.buffer[self._open_candidates[0].start : i + 1][:50]}"
+                )
+                self._failed_starts.update(c.start for c in self._open_candidates)
+                i = self._open_candidates[0].start + 1
+                self._reset_scan_state()
+                continue
+            i += 1
 
-    def _is_in_processed_range(self, pos: int) -> bool:
-        """Check if a specified position is within a processed range.
+        self._scan_pos = i
+        self._drop_processed_text()
 
-        Args:
-            pos (int): Position to check
+        self.completed_jsons.extend(new_jsons)
+        return new_jsons
 
-        Returns:
-            bool: True if position is within a processed range, otherwise False
-        """
-        for start, end in self.processed_ranges:
-            if start <= pos <= end:
-                return True
-        return False
+    def _accept(self, char: str, i: int, new_jsons: List[Dict[str, Any]]) -> bool:
+        """Advance the parser state by a significant character.
 
-    def _try_parse_jsons(self) -> List[Dict[str, Any]]:
-        """Try to parse JSON objects from the current buffer.
+        Args:
+            char (str): Character outside of strings, literals and whitespace
+            i (int): Position of the character in the buffer
+            new_jsons (List[Dict[str, Any]]): Receives the objects completed here
 
         Returns:
-            List[Dict[str, Any]]: List of newly parsed JSON objects
+            bool: False if the character is not valid JSON at this position
         """
-        new_jsons = []
-        remaining_potential = []
-
-        # Sort by starting position, process outermost JSON first
-        self.potential_jsons.sort()
-
-        for start_idx in self.potential_jsons:
-            # Skip if this position is already within a processed range
-            if self._is_in_processed_range(start_idx):
-                continue
-
-            result, end_idx = self._extract_json(start_idx)
-            if result is not None:
-                new_jsons.append(result)
-                # Mark this range as processed
-                self.processed_ranges.append((start_idx, end_idx))
-                self.completed_jsons.append(result)
+        container = self._containers[-1]
+        kind, state = container
+        expects_value = state == _VALUE or state == _VALUE_OR_END
+
+        if char == '"':
+            if state == _KEY_OR_END or state == _KEY:
+                container[1] = _COLON
+            elif expects_value:
+                container[1] = _COMMA_OR_END
             else:
-                # This JSON may not be complete yet, keep it
-                remaining_potential.append(start_idx)
-
-        self.potential_jsons = remaining_potential
-        return new_jsons
-
-    def _extract_json(self, start_idx: int) -> Tuple[Optional[Dict[str, Any]], int]:
-        """Try to extract a complete JSON object from the given position.
+                return False
+            self._in_string = True
+        elif char == "{" or char == "[":
+            if not expects_value:
+                return False
+            container[1] = _COMMA_OR_END
+            if char == "{":
+                self._open_candidates.append(_JSONCandidate(i))
+                self._containers.append(["{", _KEY_OR_END])
+            else:
+                self._containers.append(["[", _VALUE_OR_END])
+        elif char == "}":
+            if kind != "{" or state not in (_KEY_OR_END, _COMMA_OR_END):
+                return False
+            self._containers.pop()
+            candidate = self._open_candidates.pop()
+            candidate.end = i
+            if self._open_candidates:
+                self._open_candidates[-1].children.append(candidate)
+            else:
+                new_jsons.extend(self._resolve_candidate(candidate))
+        elif char == "]":
+            if kind != "[" or state not in (_VALUE_OR_END, _COMMA_OR_END):
+                return False
+            self._containers.pop()
+        elif char == ",":
+            if state != _COMMA_OR_END:
+                return False
+            container[1] = _KEY if kind == "{" else _VALUE
+        elif char == ":":
+            if state != _COLON:
+                return False
+            container[1] = _VALUE
+        elif expects_value and _is_literal_char(char):
+            container[1] = _COMMA_OR_END
+            self._in_literal = True
+        else:
+            return False
+        return True
+
+    def _resolve_candidate(self, candidate: _JSONCandidate) -> List[Dict[str, Any]]:
+        """Parse a closed outermost candidate.
+
+        Nested objects are only parsed if the enclosing object is not valid JSON.
 
         Args:
-            start_idx (int): Potential starting position of JSON
+            candidate (_JSONCandidate): Closed candidate to parse
 
         Returns:
-            Tuple[Optional[Dict[str, Any]], int]: Parsed JSON object and ending position,
-                                               or (None, -1) if incomplete
+            List[Dict[str, Any]]: The parsed object, or the parsable nested objects
         """
-        stack = 1
-        i = start_idx + 1
-
-        while i < len(self.buffer) and stack > 0:
-            if self.buffer[i] == "{":
-                stack += 1
-            elif self.buffer[i] == "}":
-                stack -= 1
-            i += 1
+        json_str = self.buffer[candidate.start : candidate.end + 1]
+        try:
+            return [json.loads(json_str)]
+        except json.JSONDecodeError:
+            logger.warning(
+                f"JSON structure found but parsing failed: {json_str[:50]}..."
+            )
+
+        results = []
+        for child in candidate.children:
+            results.extend(self._resolve_candidate(child))
+        return results
+
+    def _drop_processed_text(self) -> None:
+        """Drop text before the oldest unclosed candidate from the buffer."""
+        if self._open_candidates:
+            offset = self._open_candidates[0].start
+            if offset == 0:
+                return
+            self.buffer = self.buffer[offset:]
+            self._scan_pos -= offset
+            self._shift_candidates(self._open_candidates, offset)
+            self._failed_starts = {
+                start - offset for start in self._failed_starts if start >= offset
+            }
+        else:
+            self.buffer = ""
+            self._scan_pos = 0
+            self._failed_starts.clear()
+
+    def _shift_candidates(self, candidates: List[_JSONCandidate], offset: int) -> None:
+        """Shift candidate positions after text was dropped from the buffer.
 
-        # If complete JSON is found
-        if stack == 0:
-            json_str = self.buffer[start_idx:i]
-            try:
-                json_data = json.loads(json_str)
-                return json_data, i - 1
-            except json.JSONDecodeError:
-                logger.warning(
-                    f"JSON structure found but parsing failed: {json_str[:50]}..."
-                )
-
-        return None, -1
+        Args:
+            candidates (List[_JSONCandidate]): Candidates to shift, including children
+            offset (int): Number of characters dropped from the front of the buffer
+        """
+        for candidate in candidates:
+            candidate.start -= offset
+            if candidate.end != -1:
+                candidate.end -= offset
+            self._shift_candidates(candidate.children, offset)
+
+    def _reset_scan_state(self) -> None:
+        """Forget all open candidates and string state."""
+        self._open_candidates = []
+        self._containers = []
+        self._in_string = False
+        self._escape = False
+        self._in_literal = False
 
     def get_all_jsons(self) -> List[Dict[str, Any]]:
         """Get all JSON objects parsed so far.
@@ -131,9 +259,10 @@ class StreamJSONDetector:
     def reset(self) -> None:
         """Reset detector state, prepare to process a new stream."""
         self.buffer = ""
-        self.potential_jsons = []
         self.completed_jsons = []
-        self.processed_ranges = []
+        self._scan_pos = 0
+        self._failed_starts.clear()
+        self._reset_scan_state()
 
 
 # Usage example
@@ -1,5 +1,6 @@
 """MCP Client for Open-LLM-Vtuber."""
 
+import asyncio
 from contextlib import AsyncExitStack
 from typing import Dict, Any, List, Callable
 from loguru import logger
@@ -10,6 +11,7 @@ from mcp.types import Tool
 from mcp.client.stdio import stdio_client
 
 from .server_registry import ServerRegistry
+from .session_pool import MCPSessionPool
 
 DEFAULT_TIMEOUT = timedelta(seconds=30)
 
@@ -24,13 +26,21 @@ class MCPClient:
         server_registery: ServerRegistry,
         send_text: Callable = None,
         client_uid: str = None,
+        session_pool: MCPSessionPool | None = None,
     ) -> None:
-        """Initialize the MCP Client."""
+        """Initialize the MCP Client.
+
+        If a session pool is given, server sessions are borrowed from it and
+        shared with other clients instead of being started per client.
+        """
         self.exit_stack: AsyncExitStack = AsyncExitStack()
         self.active_sessions: Dict[str, ClientSession] = {}
         self._list_tools_cache: Dict[str, List[Tool]] = {}  # Cache for list_tools
+        # Serializes server startup so concurrent tool calls share one session
+        self._session_locks: Dict[str, asyncio.Lock] = {}
         self._send_text: Callable = send_text
         self._client_uid: str = client_uid
+        self._session_pool: MCPSessionPool | None = session_pool
 
         if isinstance(server_registery, ServerRegistry):
             self.server_registery = server_registery
@@ -44,9 +54,21 @@ class MCPClient:
         self, server_name: str
     ) -> ClientSession:
         """Gets the existing session or creates a new one."""
+        if self._session_pool:
+            return await self._session_pool.get_session(server_name)
+
         if server_name in self.active_sessions:
             return self.active_sessions[server_name]
 
+        lock = self._session_locks.setdefault(server_name, asyncio.Lock())
+        async with lock:
+            # Another call may have started the server while we were waiting
+            if server_name in self.active_sessions:
+                return self.active_sessions[server_name]
+            return await self._start_server_session(server_name)
+
+    async def _start_server_session(self, server_name: str) -> ClientSession:
+        """Starts the server process and opens a session to it."""
         logger.info(f"MCPC: Starting and connecting to server '{server_name}'...")
         server = self.server_registery.get_server(server_name)
         if not server:
@@ -82,6 +104,9 @@ class MCPClient:
 
     async def list_tools(self, server_name: str) -> List[Tool]:
         """List all available tools on the specified server."""
+        if self._session_pool:
+            return await self._session_pool.list_tools(server_name)
+
         # Check cache first
         if server_name in self._list_tools_cache:
             logger.debug(f"MCPC: Cache hit for list_tools on server '{server_name}'.")
@@ -106,9 +131,14 @@ class MCPClient:
         Returns:
             Dict containing the metadata and content_items from the tool response.
         """
-        session = await self._ensure_server_running_and_get_session(server_name)
         logger.info(f"MCPC: Calling tool '{tool_name}' on server '{server_name}'...")
-        response = await session.call_tool(tool_name, tool_args)
+        if self._session_pool:
+            response = await self._session_pool.call_tool(
+                server_name, tool_name, tool_args
+            )
+        else:
+            session = await self._ensure_server_running_and_get_session(server_name)
+            response = await session.call_tool(tool_name, tool_args)
 
         if response.isError:
             error_text = (
@@ -155,7 +185,10 @@ class MCPClient:
         return result
 
     async def aclose(self) -> None:
-        """Closes all active server connections."""
+        """Closes all active server connections.
+
+        Pooled sessions are owned by the session pool and stay open.
+        """
         logger.info(
             f"MCPC: Closing client instance and {len(self.active_sessions)} active connections..."
         )
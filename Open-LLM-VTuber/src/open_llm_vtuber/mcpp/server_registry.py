@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Dict, Optional, Union, Any
 from loguru import logger
 
-from .types import MCPServer
+from .types import MCPServer, ToolCacheConfig
 from .utils.path import validate_file
 
 
@@ -129,9 +129,36 @@ class ServerRegistry:
                 env=server_details.get("env", None),
                 cwd=server_details.get("cwd", None),
                 timeout=server_details.get("timeout", None),
+                max_concurrency=max(1, int(server_details.get("max_concurrency", 4))),
+                cached_tools=self._parse_cached_tools(
+                    server_name, server_details.get("cached_tools", {})
+                ),
             )
             logger.debug(f"MCPSR: Loaded server: '{server_name}'.")
 
+    def _parse_cached_tools(
+        self, server_name: str, cached_tools: Dict[str, Any]
+    ) -> Dict[str, ToolCacheConfig]:
+        """Parse the `cached_tools` section of a server.
+
+        Example:
+            "cached_tools": {"get_current_time": {"ttl": 30, "max_entries": 64}}
+        """
+        configs: Dict[str, ToolCacheConfig] = {}
+        for tool_name, settings in cached_tools.items():
+            try:
+                configs[tool_name] = ToolCacheConfig(
+                    ttl=float(settings.get("ttl", ToolCacheConfig.ttl)),
+                    max_entries=int(
+                        settings.get("max_entries", ToolCacheConfig.max_entries)
+                    ),
+                )
+            except (AttributeError, TypeError, ValueError):
+                logger.warning(
+                    f"MCPSR: Invalid cache settings for tool '{tool_name}' of server '{server_name}'. Ignoring."
+                )
+        return configs
+
     def remove_server(self, server_name: str) -> None:
         """Remove a server from the available servers."""
         try:
@@ -0,0 +1,302 @@
+"""Process-wide pool of MCP server sessions shared by all clients."""
+
+import asyncio
+from contextlib import AsyncExitStack
+from datetime import timedelta
+from typing import Dict, Any, List, Optional
+
+import anyio
+from loguru import logger
+from mcp import ClientSession, StdioServerParameters
+from mcp.types import Tool, CallToolResult
+from mcp.client.stdio import stdio_client
+
+from .server_registry import ServerRegistry
+
+DEFAULT_TIMEOUT = timedelta(seconds=30)
+DEFAULT_HEALTH_CHECK_INTERVAL = 30.0
+PING_TIMEOUT = 10.0
+
+# Errors that mean the server process or its transport is gone
+CONNECTION_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    ConnectionError,
+)
+
+
+class _PooledServer:
+    """A running MCP server process and its session, owned by a single task."""
+
+    def __init__(self, name: str, max_concurrency: int):
+        self.name = name
+        self.session: Optional[ClientSession] = None
+        self.task: Optional[asyncio.Task] = None
+        self.ready = asyncio.Event()
+        self.stop = asyncio.Event()
+        self.error: Optional[BaseException] = None
+        self.lock = asyncio.Lock()
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.restarts = 0
+
+    @property
+    def is_running(self) -> bool:
+        return (
+            self.session is not None and self.task is not None and not self.task.done()
+        )
+
+
+class MCPSessionPool:
+    """Keeps one session per MCP server and shares it across all client sessions.
+
+    MCP sessions multiplex concurrent requests over a single transport, so one
+    server process can serve every connected client. Each server process is
+    owned by a dedicated task (the stdio transport must be opened and closed in
+    the same task), started on first use or pre-warmed at startup, health
+    checked with pings and restarted when it dies.
+    """
+
+    def __init__(
+        self,
+        server_registery: ServerRegistry,
+        health_check_interval: float | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            server_registery: Registry with the server definitions.
+            health_check_interval: Seconds between pings to running servers.
+                Defaults to `health_check_interval` in mcp_servers.json, or 30.
+                0 disables health checks.
+        """
+        self.server_registery = server_registery
+        if health_check_interval is None:
+            health_check_interval = server_registery.config.get(
+                "health_check_interval", DEFAULT_HEALTH_CHECK_INTERVAL
+            )
+        self.health_check_interval = float(health_check_interval)
+
+        self._servers: Dict[str, _PooledServer] = {}
+        self._list_tools_cache: Dict[str, List[Tool]] = {}
+        self._health_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _bind_to_running_loop(self) -> None:
+        """Forget servers started on another (finished) event loop.
+
+        Startup runs in its own event loop before the web server loop starts;
+        the tasks owning those servers are cancelled when that loop ends.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        if self._loop is not None:
+            logger.debug("MCPSP: Event loop changed, servers will be restarted.")
+        self._loop = loop
+        self._servers = {}
+        self._health_task = None
+
+    def _get_entry(self, server_name: str) -> _PooledServer:
+        """Get the pool entry for a server, creating it if needed."""
+        self._bind_to_running_loop()
+        entry = self._servers.get(server_name)
+        if entry is None:
+            server = self.server_registery.get_server(server_name)
+            if not server:
+                raise ValueError(
+                    f"MCPSP: Server '{server_name}' not found in available servers."
+                )
+            entry = _PooledServer(server_name, server.max_concurrency)
+            self._servers[server_name] = entry
+        return entry
+
+    async def _own_server(self, entry: _PooledServer) -> None:
+        """Start the server, publish its session and keep it open until stopped."""
+        server = self.server_registery.get_server(entry.name)
+        timeout = server.timeout if server.timeout else DEFAULT_TIMEOUT
+        server_params = StdioServerParameters(
+            command=server.command, args=server.args, env=server.env, cwd=server.cwd
+        )
+        try:
+            async with AsyncExitStack() as stack:
+                read, write = await stack.enter_async_context(
+                    stdio_client(server_params)
+                )
+                session = await stack.enter_async_context(
+                    ClientSession(read, write, read_timeout_seconds=timeout)
+                )
+                await session.initialize()
+                entry.session = session
+                entry.ready.set()
+                await entry.stop.wait()
+        except Exception as e:
+            entry.error = e
+        finally:
+            entry.session = None
+            entry.ready.set()
+
+    async def get_session(self, server_name: str) -> ClientSession:
+        """Get the shared session of a server, starting the server if needed."""
+        entry = self._get_entry(server_name)
+        if entry.is_running:
+            return entry.session
+
+        async with entry.lock:
+            if entry.is_running:
+                return entry.session
+            await self._start(entry)
+            return entry.session
+
+    async def _start(self, entry: _PooledServer) -> None:
+        """Start the server owned by the entry. Caller must hold `entry.lock`."""
+        logger.info(f"MCPSP: Starting and connecting to server '{entry.name}'...")
+        entry.ready = asyncio.Event()
+        entry.stop = asyncio.Event()
+        entry.error = None
+        entry.task = asyncio.create_task(self._own_server(entry))
+        await entry.ready.wait()
+
+        if entry.session is None:
+            logger.error(
+                f"MCPSP: Failed to connect to server '{entry.name}': {entry.error}"
+            )
+            raise RuntimeError(
+                f"MCPSP: Failed to connect to server '{entry.name}'."
+            ) from entry.error
+
+        logger.info(f"MCPSP: Successfully connected to server '{entry.name}'.")
+        self._ensure_health_check()
+
+    async def _stop(self, entry: _PooledServer) -> None:
+        """Stop the server owned by the entry. Caller must hold `entry.lock`."""
+        if entry.task is None:
+            return
+        entry.stop.set()
+        try:
+            await entry.task
+        except asyncio.CancelledError:
+            pass
+        entry.task = None
+
+    async def restart(
+        self, server_name: str, failed_session: Optional[ClientSession] = None
+    ) -> None:
+        """Restart a server, e.g. after it stopped responding.
+
+        Args:
+            server_name: Name of the server to restart.
+            failed_session: The session that failed. If another caller already
+                replaced it with a running one, the server is not restarted again.
+        """
+        entry = self._get_entry(server_name)
+        async with entry.lock:
+            if (
+                failed_session is not None
+                and entry.is_running
+                and entry.session is not failed_session
+            ):
+                return
+            logger.warning(f"MCPSP: Restarting server '{server_name}'...")
+            await self._stop(entry)
+            entry.restarts += 1
+            self._list_tools_cache.pop(server_name, None)
+            await self._start(entry)
+
+    async def prewarm(self, server_names: List[str]) -> None:
+        """Start the given servers concurrently so the first tool call is fast."""
+        known_servers = [
+            name for name in server_names if self.server_registery.get_server(name)
+        ]
+        if not known_servers:
+            return
+        logger.info(f"MCPSP: Pre-warming MCP servers: {known_servers}")
+        results = await asyncio.gather(
+            *(self.get_session(name) for name in known_servers),
+            return_exceptions=True,
+        )
+        for name, result in zip(known_servers, results):
+            if isinstance(result, Exception):
+                logger.error(f"MCPSP: Failed to pre-warm server '{name}': {result}")
+
+    async def list_tools(self, server_name: str) -> List[Tool]:
+        """List all available tools on the specified server (cached)."""
+        if server_name in self._list_tools_cache:
+            logger.debug(f"MCPSP: Cache hit for list_tools on server '{server_name}'.")
+            return self._list_tools_cache[server_name]
+
+        session = await self.get_session(server_name)
+        response = await session.list_tools()
+        self._list_tools_cache[server_name] = response.tools
+        return response.tools
+
+    async def call_tool(
+        self, server_name: str, tool_name: str, tool_args: Dict[str, Any]
+    ) -> CallToolResult:
+        """Call a tool on the shared session of a server.
+
+        Concurrent calls to the same server are capped by its `max_concurrency`.
+        If the server process died, it is restarted and the call retried once.
+        """
+        entry = self._get_entry(server_name)
+        async with entry.semaphore:
+            session = await self.get_session(server_name)
+            try:
+                return await session.call_tool(tool_name, tool_args)
+            except CONNECTION_ERRORS as e:
+                logger.warning(
+                    f"MCPSP: Lost connection to server '{server_name}' ({e!r}), retrying once."
+                )
+                await self.restart(server_name, failed_session=session)
+                session = await self.get_session(server_name)
+                return await session.call_tool(tool_name, tool_args)
+
+    def _ensure_health_check(self) -> None:
+        """Start the health check task if enabled and not running."""
+        if self.health_check_interval <= 0:
+            return
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.create_task(self._health_check_loop())
+
+    async def _health_check_loop(self) -> None:
+        """Ping running servers periodically and restart those that fail."""
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            for name, entry in list(self._servers.items()):
+                if entry.task is None:
+                    continue  # Never started or stopped on purpose
+                if entry.is_running:
+                    try:
+                        await asyncio.wait_for(
+                            entry.session.send_ping(), timeout=PING_TIMEOUT
+                        )
+                        continue
+                    except Exception as e:
+                        logger.warning(
+                            f"MCPSP: Health check failed for server '{name}': {e!r}"
+                        )
+                try:
+                    await self.restart(name, failed_session=entry.session)
+                except Exception as e:
+                    logger.error(f"MCPSP: Failed to restart server '{name}': {e}")
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the state of every pooled server."""
+        return {
+            name: {"running": entry.is_running, "restarts": entry.restarts}
+            for name, entry in self._servers.items()
+        }
+
+    async def aclose(self) -> None:
+        """Stop the health check and all server processes."""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        logger.info(f"MCPSP: Closing {len(self._servers)} pooled MCP servers...")
+        if self._health_task:
+            self._health_task.cancel()
+            self._health_task = None
+        for entry in self._servers.values():
+            async with entry.lock:
+                await self._stop(entry)
+        self._servers.clear()
+        self._list_tools_cache.clear()
@@ -6,14 +6,20 @@ from loguru import logger
 from .types import FormattedTool
 from .mcp_client import MCPClient
 from .server_registry import ServerRegistry
+from .session_pool import MCPSessionPool
 
 
 class ToolAdapter:
     """Dynamically fetches tool information from enabled MCP servers and formats it."""
 
-    def __init__(self, server_registery: Optional[ServerRegistry] = None) -> None:
-        """Initialize with an ServerRegistry."""
+    def __init__(
+        self,
+        server_registery: Optional[ServerRegistry] = None,
+        session_pool: Optional[MCPSessionPool] = None,
+    ) -> None:
+        """Initialize with an ServerRegistry and an optional shared session pool."""
         self.server_registery = server_registery or ServerRegistry()
+        self.session_pool = session_pool
 
     async def get_server_and_tool_info(
         self, enabled_servers: List[str]
@@ -31,7 +37,9 @@ class ToolAdapter:
         logger.debug(f"MC: Fetching tool info for enabled servers: {enabled_servers}")
 
         # Use a single client instance for efficiency
-        async with MCPClient(self.server_registery) as client:
+        async with MCPClient(
+            self.server_registery, session_pool=self.session_pool
+        ) as client:
             for server_name in enabled_servers:
                 if server_name not in self.server_registery.servers:
                     logger.warning(
@@ -0,0 +1,85 @@
+"""Result cache for idempotent MCP tools."""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+from .types import ToolCacheConfig
+
+# (is_error, text_content, metadata, content_items), as returned by run_single_tool
+ToolResult = Tuple[bool, str, Dict[str, Any], list]
+
+
+def make_cache_key(tool_name: str, tool_args: Any) -> str:
+    """Build a canonical key for a tool call.
+
+    Arguments are serialized with sorted keys and without whitespace, so calls
+    that only differ in key order or formatting share the same entry.
+    """
+    canonical_args = json.dumps(
+        tool_args or {},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return f"{tool_name}:{canonical_args}"
+
+
+class ToolResultCache:
+    """Per-tool LRU caches of successful tool results with a time to live.
+
+    Only tools declared with a cache config are cached; every other tool
+    always misses.
+    """
+
+    def __init__(self) -> None:
+        # tool name -> cache key -> (expires_at, result)
+        self._entries: Dict[str, OrderedDict[str, Tuple[float, ToolResult]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, tool_name: str, tool_args: Any) -> Optional[ToolResult]:
+        """Get a cached result, or None if missing or expired."""
+        entries = self._entries.get(tool_name)
+        key = make_cache_key(tool_name, tool_args)
+        cached = entries.get(key) if entries else None
+        if cached is None:
+            self.misses += 1
+            return None
+
+        expires_at, result = cached
+        if expires_at <= time.monotonic():
+            del entries[key]
+            self.misses += 1
+            return None
+
+        entries.move_to_end(key)
+        self.hits += 1
+        logger.debug(f"MCPTC: Cache hit for tool '{tool_name}'.")
+        return result
+
+    def put(
+        self,
+        config: ToolCacheConfig,
+        tool_name: str,
+        tool_args: Any,
+        result: ToolResult,
+    ) -> None:
+        """Store a successful result, evicting the least recently used entry."""
+        if result[0] or config.ttl <= 0 or config.max_entries <= 0:
+            return  # Never cache errors
+
+        entries = self._entries.setdefault(tool_name, OrderedDict())
+        key = make_cache_key(tool_name, tool_args)
+        entries[key] = (time.monotonic() + config.ttl, result)
+        entries.move_to_end(key)
+        while len(entries) > config.max_entries:
+            entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
@@ -1,4 +1,6 @@
 import json
+import time
+import asyncio
 import datetime
 from loguru import logger
 from typing import (
@@ -10,9 +12,12 @@ from typing import (
     AsyncIterator,
 )
 
-from .types import ToolCallObject
+from .types import ToolCallObject, MCPServer, ToolCacheConfig
 from .mcp_client import MCPClient
 from .tool_manager import ToolManager
+from .tool_cache import ToolResultCache, make_cache_key
+
+DEFAULT_MAX_CONCURRENCY = MCPServer.max_concurrency
 
 
 class ToolExecutor:
@@ -23,6 +28,12 @@ class ToolExecutor:
     ):
         self._mcp_client = mcp_client
         self._tool_manager = tool_manager
+        # Bounds the number of concurrent tool calls per MCP server
+        self._server_semaphores: Dict[str, asyncio.Semaphore] = {}
+        # Results of tools declared idempotent in mcp_servers.json
+        self._result_cache = ToolResultCache()
+        # Cached-tool calls in flight, so identical concurrent calls run once
+        self._pending_cached_calls: Dict[str, asyncio.Task] = {}
 
     def parse_tool_call(self, call: Union[Dict[str, Any], ToolCallObject]) -> tuple:
         """Parse tool call from different formats.
@@ -157,148 +168,295 @@ class ToolExecutor:
         tool_calls: Union[List[Dict[str, Any]], List[ToolCallObject]],
         caller_mode: Literal["Claude", "OpenAI", "Prompt"],
     ) -> AsyncIterator[Dict[str, Any]]:
-        """Execute tools and yield status updates."""
+        """Execute tools concurrently and yield status updates.
+
+        Independent tool calls run at the same time, bounded per MCP server.
+        Status updates and the final results are still yielded in the order
+        of `tool_calls`.
+        """
         tool_results_for_llm = []
+        running_tasks: Dict[int, asyncio.Task] = {}
+        parsed_calls = []
 
         logger.info(f"Executing {len(tool_calls)} tool(s) for {caller_mode} caller.")
-        for call in tool_calls:
-            (
-                tool_name,
-                tool_id,
-                tool_input,
-                is_error,
-                result_content,
-                parse_error,
-            ) = self.parse_tool_call(call)
-
-            logger.info(f"Executing tool: {call}")
-
-            if parse_error:
-                logger.warning(
-                    f"Skipping tool call due to parsing error: {result_content}"
-                )
-                status_update = {
+        try:
+            for index, call in enumerate(tool_calls):
+                (
+                    tool_name,
+                    tool_id,
+                    tool_input,
+                    is_error,
+                    result_content,
+                    parse_error,
+                ) = self.parse_tool_call(call)
+                parsed_calls.append((tool_name, tool_id, result_content, parse_error))
+
+                logger.info(f"Executing tool: {call}")
+
+                if parse_error:
+                    continue
+
+                # Yield 'running' status before execution
+                yield {
                     "type": "tool_call_status",
-                    "tool_id": tool_id
-                    or f"parse_error_{datetime.datetime.now(datetime.timezone.utc).isoformat()}",
-                    "tool_name": tool_name or "Unknown Tool",
-                    "status": "error",
-                    "content": result_content,
+                    "tool_id": tool_id,
+                    "tool_name": tool_name,
+                    "status": "running",
+                    "content": f"Input: {json.dumps(tool_input)}",
                     "timestamp": datetime.datetime.now(
                         datetime.timezone.utc
                     ).isoformat()
                     + "Z",
                 }
-                yield status_update
-                # Even on parse error, we might need to format a result for the LLM
-                # Use dummy values or the error message
-                formatted_result = self.format_tool_result(
+
+                # Start the tool right away, the next call does not wait for it
+                running_tasks[index] = asyncio.create_task(
+                    self._run_tool_bounded(tool_name, tool_id, tool_input)
+                )
+
+            for index, (tool_name, tool_id, result_content, parse_error) in enumerate(
+                parsed_calls
+            ):
+                if parse_error:
+                    logger.warning(
+                        f"Skipping tool call due to parsing error: {result_content}"
+                    )
+                    status_update = {
+                        "type": "tool_call_status",
+                        "tool_id": tool_id
+                        or f"parse_error_{datetime.datetime.now(datetime.timezone.utc).isoformat()}",
+                        "tool_name": tool_name or "Unknown Tool",
+                        "status": "error",
+                        "content": result_content,
+                        "timestamp": datetime.datetime.now(
+                            datetime.timezone.utc
+                        ).isoformat()
+                        + "Z",
+                    }
+                    yield status_update
+                    # Even on parse error, we might need to format a result for the LLM
+                    # Use dummy values or the error message
+                    formatted_result = self.format_tool_result(
+                        caller_mode,
+                        tool_id
+                        or f"parse_error_{datetime.datetime.now(datetime.timezone.utc).isoformat()}",
+                        result_content,
+                        True,  # is_error
+                    )
+                    if formatted_result:
+                        tool_results_for_llm.append(formatted_result)
+                    continue  # Skip execution logic for this call
+
+                (
+                    (
+                        is_error,
+                        text_content,
+                        metadata,
+                        content_items,
+                    ),
+                    duration_ms,
+                    cached,
+                ) = await running_tasks[index]
+
+                status_update, formatted_result = self._build_tool_outcome(
                     caller_mode,
-                    tool_id
-                    or f"parse_error_{datetime.datetime.now(datetime.timezone.utc).isoformat()}",
-                    result_content,
-                    True,  # is_error
+                    tool_name,
+                    tool_id,
+                    is_error,
+                    text_content,
+                    metadata,
+                    content_items,
                 )
+                status_update["duration_ms"] = duration_ms
+                status_update["cached"] = cached
+                yield status_update
+
                 if formatted_result:
                     tool_results_for_llm.append(formatted_result)
-                continue  # Skip execution logic for this call
+        finally:
+            # The consumer may stop early (e.g. on interrupt); don't leak tool calls
+            for task in running_tasks.values():
+                if not task.done():
+                    task.cancel()
 
-            # Yield 'running' status before execution
-            yield {
-                "type": "tool_call_status",
-                "tool_id": tool_id,
-                "tool_name": tool_name,
-                "status": "running",
-                "content": f"Input: {json.dumps(tool_input)}",
-                "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat()
-                + "Z",
-            }
+        logger.info(
+            f"Finished executing tools with {len(tool_results_for_llm)} results."
+        )
+        yield {"type": "final_tool_results", "results": tool_results_for_llm}
 
-            # Execute the tool
-            (
-                is_error,
-                text_content,
-                metadata,
-                content_items,
-            ) = await self.run_single_tool(tool_name, tool_id, tool_input)
-
-            # Determine content for status update and LLM result format
-            status_content = text_content  # Default to text content
-            llm_formatted_content = text_content  # Default to text content for LLM
-
-            if content_items:
-                image_items = [
-                    item for item in content_items if item.get("type") == "image"
-                ]
-                if image_items:
-                    num_images = len(image_items)
-                    status_content = (
-                        f"{text_content}\n[Tool returned {num_images} image(s)]".strip()
-                    )
+    def _build_tool_outcome(
+        self,
+        caller_mode: Literal["Claude", "OpenAI", "Prompt"],
+        tool_name: str,
+        tool_id: str,
+        is_error: bool,
+        text_content: str,
+        metadata: Dict[str, Any],
+        content_items: List[Dict[str, Any]],
+    ) -> tuple[Dict[str, Any], Dict[str, Any] | None]:
+        """Build the status update and the LLM-formatted result of a tool run.
 
-                    if caller_mode == "Claude":
-                        # Format for Claude: list of blocks
-                        claude_blocks = []
-                        if text_content:
-                            claude_blocks.append({"type": "text", "text": text_content})
-                        for item in content_items:
-                            if (
-                                item.get("type") == "image"
-                                and "data" in item
-                                and "mimeType" in item
-                            ):
-                                claude_blocks.append(
-                                    {
-                                        "type": "image",
-                                        "source": {
-                                            "type": "base64",
-                                            "media_type": item["mimeType"],
-                                            "data": item["data"],
-                                        },
-                                    }
-                                )
-                            # Add other non-text types here
-                        llm_formatted_content = (
-                            claude_blocks if claude_blocks else ""
-                        )  # Use blocks or empty string
-                    elif caller_mode in ["OpenAI", "Prompt"]:
-                        llm_formatted_content = status_content
-
-            # Prepare and yield tool call status update
-            status_update = {
-                "type": "tool_call_status",
-                "tool_id": tool_id,
-                "tool_name": tool_name,
-                "status": "error" if is_error else "completed",
-                "content": status_content
-                if not is_error
-                else f"Error: {text_content}",  # Use descriptive content or error message
-                "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat()
-                + "Z",
-            }
+        Returns:
+            tuple: (status_update, formatted_result)
+        """
+        # Determine content for status update and LLM result format
+        status_content = text_content  # Default to text content
+        llm_formatted_content = text_content  # Default to text content for LLM
+
+        if content_items:
+            image_items = [
+                item for item in content_items if item.get("type") == "image"
+            ]
+            if image_items:
+                num_images = len(image_items)
+                status_content = (
+                    f"{text_content}\n[Tool returned {num_images} image(s)]".strip()
+                )
 
-            # For stagehand_navigate tool, include browser view links if available
-            if tool_name == "stagehand_navigate" and not is_error:
-                live_view_data = metadata.get("liveViewData", {})
-                if live_view_data:
-                    logger.info(
-                        f"Found live view data for stagehand_navigate: {live_view_data}"
-                    )
-                    status_update["browser_view"] = live_view_data
+                if caller_mode == "Claude":
+                    # Format for Claude: list of blocks
+                    claude_blocks = []
+                    if text_content:
+                        claude_blocks.append({"type": "text", "text": text_content})
+                    for item in content_items:
+                        if (
+                            item.get("type") == "image"
+                            and "data" in item
+                            and "mimeType" in item
+                        ):
+                            claude_blocks.append(
+                                {
+                                    "type": "image",
+                                    "source": {
+                                        "type": "base64",
+                                        "media_type": item["mimeType"],
+                                        "data": item["data"],
+                                    },
+                                }
+                            )
+                        # Add other non-text types here
+                    llm_formatted_content = (
+                        claude_blocks if claude_blocks else ""
+                    )  # Use blocks or empty string
+                elif caller_mode in ["OpenAI", "Prompt"]:
+                    llm_formatted_content = status_content
+
+        # Prepare tool call status update
+        status_update = {
+            "type": "tool_call_status",
+            "tool_id": tool_id,
+            "tool_name": tool_name,
+            "status": "error" if is_error else "completed",
+            "content": status_content
+            if not is_error
+            else f"Error: {text_content}",  # Use descriptive content or error message
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat() + "Z",
+        }
+
+        # For stagehand_navigate tool, include browser view links if available
+        if tool_name == "stagehand_navigate" and not is_error:
+            live_view_data = metadata.get("liveViewData", {})
+            if live_view_data:
+                logger.info(
+                    f"Found live view data for stagehand_navigate: {live_view_data}"
+                )
+                status_update["browser_view"] = live_view_data
 
-            yield status_update
+        # Format result for LLM
+        formatted_result = self.format_tool_result(
+            caller_mode, tool_id, llm_formatted_content, is_error
+        )
+        return status_update, formatted_result
 
-            # Format result for LLM and add to list
-            formatted_result = self.format_tool_result(
-                caller_mode, tool_id, llm_formatted_content, is_error
+    def _get_server_semaphore(self, tool_name: str) -> asyncio.Semaphore | None:
+        """Get the semaphore bounding concurrent calls to the tool's MCP server."""
+        tool_info = self._tool_manager.get_tool(tool_name)
+        if not tool_info or not tool_info.related_server:
+            return None
+
+        server_name = tool_info.related_server
+        if server_name not in self._server_semaphores:
+            server = self._mcp_client.server_registery.get_server(server_name)
+            max_concurrency = (
+                server.max_concurrency if server else DEFAULT_MAX_CONCURRENCY
             )
-            if formatted_result:
-                tool_results_for_llm.append(formatted_result)
+            self._server_semaphores[server_name] = asyncio.Semaphore(max_concurrency)
+        return self._server_semaphores[server_name]
 
-        logger.info(
-            f"Finished executing tools with {len(tool_results_for_llm)} results."
-        )
-        yield {"type": "final_tool_results", "results": tool_results_for_llm}
+    def _get_cache_config(self, tool_name: str) -> ToolCacheConfig | None:
+        """Get the result cache settings of a tool, or None if it is not cached."""
+        tool_info = self._tool_manager.get_tool(tool_name)
+        if not tool_info or not tool_info.related_server:
+            return None
+        server = self._mcp_client.server_registery.get_server(tool_info.related_server)
+        return server.cached_tools.get(tool_name) if server else None
+
+    async def _run_tool_bounded(
+        self, tool_name: str, tool_id: str, tool_input: Any
+    ) -> tuple[tuple[bool, str, Dict[str, Any], List[Dict[str, Any]]], int, bool]:
+        """Run a single tool, serving idempotent tools from the result cache.
+
+        Returns:
+            tuple: (run_single_tool result, duration in milliseconds, whether
+            the result came from the cache or from an identical call in flight)
+        """
+        cache_config = self._get_cache_config(tool_name)
+        if cache_config is None:
+            result, duration_ms = await self._run_tool_timed(
+                tool_name, tool_id, tool_input
+            )
+            return result, duration_ms, False
+
+        cached_result = self._result_cache.get(tool_name, tool_input)
+        if cached_result is not None:
+            logger.info(f"Tool '{tool_name}' (ID: {tool_id}) served from cache.")
+            return cached_result, 0, True
+
+        key = make_cache_key(tool_name, tool_input)
+        task = self._pending_cached_calls.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.create_task(
+                self._run_tool_cached(cache_config, tool_name, tool_id, tool_input)
+            )
+            self._pending_cached_calls[key] = task
+            task.add_done_callback(lambda _: self._pending_cached_calls.pop(key, None))
+        # Shielded so that one cancelled caller doesn't fail the others
+        result, duration_ms = await asyncio.shield(task)
+        return result, duration_ms, shared
+
+    async def _run_tool_cached(
+        self,
+        cache_config: ToolCacheConfig,
+        tool_name: str,
+        tool_id: str,
+        tool_input: Any,
+    ) -> tuple[tuple[bool, str, Dict[str, Any], List[Dict[str, Any]]], int]:
+        """Run a cacheable tool and store its result if it succeeded."""
+        result, duration_ms = await self._run_tool_timed(tool_name, tool_id, tool_input)
+        self._result_cache.put(cache_config, tool_name, tool_input, result)
+        return result, duration_ms
+
+    async def _run_tool_timed(
+        self, tool_name: str, tool_id: str, tool_input: Any
+    ) -> tuple[tuple[bool, str, Dict[str, Any], List[Dict[str, Any]]], int]:
+        """Run a single tool within its server's concurrency limit.
+
+        Returns:
+            tuple: (run_single_tool result, duration in milliseconds)
+        """
+        semaphore = self._get_server_semaphore(tool_name)
+        if semaphore is None:
+            start = time.perf_counter()
+            result = await self.run_single_tool(tool_name, tool_id, tool_input)
+        else:
+            async with semaphore:
+                start = time.perf_counter()
+                result = await self.run_single_tool(tool_name, tool_id, tool_input)
+
+        duration_ms = round((time.perf_counter() - start) * 1000)
+        logger.info(f"Tool '{tool_name}' (ID: {tool_id}) took {duration_ms} ms.")
+        return result, duration_ms
 
     async def run_single_tool(
         self, tool_name: str, tool_id: str, tool_input: Any
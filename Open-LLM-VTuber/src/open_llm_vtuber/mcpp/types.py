@@ -14,6 +14,8 @@ class MCPServer:
         env (Optional[dict[str, str]], optional): Environment variables for the command. Defaults to None.
         cwd (Optional[str], optional): Working directory for the command. Defaults to None.
         timeout (Optional[timedelta], optional): Timeout for the command. Defaults to 10 seconds.
+        max_concurrency (int, optional): Maximum number of tool calls run on the server at the same time. Defaults to 4.
+        cached_tools (dict[str, ToolCacheConfig], optional): Idempotent tools whose results may be cached, by tool name. Defaults to an empty dict.
     """
 
     name: str
@@ -23,6 +25,21 @@ class MCPServer:
     cwd: str | None = None
     timeout: Optional[timedelta] = timedelta(seconds=30)
     description: str = "No description available."
+    max_concurrency: int = 4
+    cached_tools: dict[str, "ToolCacheConfig"] = field(default_factory=dict)
+
+
+@dataclass
+class ToolCacheConfig:
+    """Class representing the result cache settings of an idempotent tool
+
+    Args:
+        ttl (float, optional): Seconds a cached result stays valid. Defaults to 60.
+        max_entries (int, optional): Maximum number of cached argument combinations. Defaults to 128.
+    """
+
+    ttl: float = 60.0
+    max_entries: int = 128
 
 
 @dataclass
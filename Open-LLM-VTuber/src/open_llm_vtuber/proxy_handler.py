@@ -1,13 +1,16 @@
 import asyncio
-import json
 import uuid
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Union
 from fastapi import WebSocket
 from loguru import logger
 import aiohttp
 from starlette.websockets import WebSocketDisconnect
 
 from .proxy_message_queue import ProxyMessageQueue
+from .utils import json_codec
+
+# Number of characters of a relayed frame shown in debug logs
+LOG_PREVIEW_CHARS = 200
 
 
 class ProxyHandler:
@@ -74,7 +77,9 @@ class ProxyHandler:
             try:
                 if self.connected and self.server_ws and not self.server_ws.closed:
                     # Send heartbeat
-                    await self.server_ws.send_json({"type": "heartbeat"})
+                    await self.server_ws.send_json(
+                        {"type": "heartbeat"}, dumps=json_codec.dumps
+                    )
                     await asyncio.sleep(30)  # Heartbeat interval
                 else:
                     # Try to reconnect
@@ -119,7 +124,7 @@ class ProxyHandler:
         try:
             # Handle messages from this client
             while True:
-                message = await websocket.receive_json()
+                message = await json_codec.receive(websocket)
 
                 # Process text-input messages through the queue
                 if message.get("type") == "text-input":
@@ -201,7 +206,7 @@ class ProxyHandler:
             await self.connect_to_server()
 
         if self.server_ws and not self.server_ws.closed:
-            await self.server_ws.send_json(message)
+            await self.server_ws.send_json(message, dumps=json_codec.dumps)
 
     async def forward_server_messages(self):
         """Forward messages from server to all connected clients"""
@@ -211,28 +216,39 @@ class ProxyHandler:
                     msg = await self.server_ws.receive()
 
                     if msg.type == aiohttp.WSMsgType.TEXT:
-                        try:
-                            # Parse the message
-                            if not msg.data:  # Check if data is empty
-                                continue
+                        if not msg.data:  # Check if data is empty
+                            continue
 
-                            data = json.loads(msg.data)
-                            if not data:  # Check if parsed data is empty
+                        # Only look at the fields needed for routing; the
+                        # frame itself is relayed without being re-encoded
+                        header = json_codec.peek_header(msg.data)
+                        if (
+                            not header
+                            and len(msg.data) <= json_codec.PEEK_DECODE_MAX_CHARS
+                        ):
+                            # No type or text: only drop the frame if it is
+                            # not JSON at all, other messages are relayed
+                            try:
+                                json_codec.loads(msg.data)
+                            except ValueError:
+                                logger.error(
+                                    f"Failed to parse message data: {msg.data}"
+                                )
                                 continue
 
-                            # Check for conversation end signal
-                            if (
-                                data.get("type") == "control"
-                                and data.get("text") == "conversation-chain-end"
-                            ):
-                                logger.info("Received conversation end signal")
-                                self.message_queue.conversation_active = False
-
-                            # Broadcast the message to all clients
-                            await self.broadcast_to_clients(data)
-                        except json.JSONDecodeError as e:
-                            logger.error(f"Failed to parse message data: {e}")
-                            continue
+                        # Check for conversation end signal
+                        if (
+                            header.get("type") == "control"
+                            and header.get("text") == "conversation-chain-end"
+                        ):
+                            logger.info("Received conversation end signal")
+                            # Wakes the queue to forward the next message
+                            self.message_queue.end_conversation()
+
+                        # Broadcast the frame to all clients
+                        await self.broadcast_to_clients(msg.data, header=header)
+                    elif msg.type == aiohttp.WSMsgType.BINARY:
+                        await self.broadcast_to_clients(msg.data)
                     elif msg.type == aiohttp.WSMsgType.ERROR:
                         logger.error(f"WebSocket error: {self.server_ws.exception()}")
                         break
@@ -249,49 +265,64 @@ class ProxyHandler:
             logger.info("Server message forwarding ended")
 
     async def broadcast_to_clients(
-        self, message: dict, exclude_client: Optional[str] = None
+        self,
+        message: Union[Dict[str, Any], str, bytes],
+        exclude_client: Optional[str] = None,
+        header: Optional[Dict[str, Any]] = None,
     ):
         """
-        Broadcast a message to all connected clients.
+        Broadcast a message to all connected clients concurrently.
 
         Args:
-            message: The message to broadcast
+            message: The message to broadcast. Already encoded text frames are
+                sent verbatim and bytes are relayed as binary frames.
             exclude_client: Optional client ID to exclude from broadcast
+            header: The `type` and `text` fields of an encoded message, if
+                already known
         """
         if not message:  # Add null check
             return
 
-        disconnected_clients = []
-
-        # Log message, but handle audio data specially to avoid huge logs
-        log_msg = (
-            message.copy()
-            if "audio" not in message
-            else {
-                **{k: v for k, v in message.items() if k != "audio"},
-                "audio": f"[Audio data, {len(message.get('audio', ''))} bytes truncated]",
-            }
-        )
-
-        if "volumes" in log_msg and len(log_msg.get("volumes", [])) > 10:
-            log_msg["volumes"] = f"[{len(message.get('volumes', []))} volume values]"
-
-        logger.debug(f"Broadcasting to clients (excluding {exclude_client}): {log_msg}")
+        recipients = [
+            (client_id, websocket)
+            for client_id, websocket in self.clients.items()
+            if not (exclude_client and client_id == exclude_client)
+        ]
+        if not recipients:
+            return
 
-        for client_id, websocket in self.clients.items():
-            # Skip the excluded client
-            if exclude_client and client_id == exclude_client:
-                continue
-
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.error(f"Error sending to client {client_id}: {e}")
-                disconnected_clients.append(client_id)
+        if isinstance(message, bytes):
+            logger.debug(
+                f"Relaying {len(message)} byte binary frame to {len(recipients)} clients"
+            )
+            sends = [websocket.send_bytes(message) for _, websocket in recipients]
+        else:
+            if isinstance(message, dict):
+                header = message
+            elif header is None:
+                header = json_codec.peek_header(message)
+            # Encode once for all clients
+            text = json_codec.encode(message)
+
+            if header.get("type") == "audio":
+                # Audio fast path: never format or copy the payload for logs
+                logger.debug(
+                    f"Relaying audio frame ({len(text)} chars) to {len(recipients)} clients"
+                )
+            else:
+                logger.debug(
+                    f"Broadcasting to clients (excluding {exclude_client}): "
+                    f"{text[:LOG_PREVIEW_CHARS]}"
+                )
+            sends = [websocket.send_text(text) for _, websocket in recipients]
+
+        results = await asyncio.gather(*sends, return_exceptions=True)
 
         # Clean up disconnected clients
-        for client_id in disconnected_clients:
-            await self.handle_client_disconnect(client_id)
+        for (client_id, _), result in zip(recipients, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending to client {client_id}: {result}")
+                await self.handle_client_disconnect(client_id)
 
     async def forward_with_broadcast(
         self, message: dict, sender_id: Optional[str] = None
@@ -1,20 +1,61 @@
 import asyncio
+import time
 from typing import Dict, Optional, Deque, Any, Callable
-from collections import deque
+from collections import deque, OrderedDict
 from loguru import logger
 
+# Priority classes, lower is forwarded first
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+PRIORITY_NAMES = {"high": PRIORITY_HIGH, "normal": PRIORITY_NORMAL, "low": PRIORITY_LOW}
+
+# Release the queue if the server never signals the end of a conversation
+DEFAULT_CONVERSATION_TIMEOUT = 300.0
+
+
+def get_message_priority(message: Dict) -> int:
+    """
+    Get the priority class of a message from its optional `priority` field
+    ("high", "normal" or "low"), defaulting to normal.
+    """
+    return PRIORITY_NAMES.get(message.get("priority"), PRIORITY_NORMAL)
+
 
 class ProxyMessageQueue:
     """
     Manages message queuing and consumption for the proxy handler.
     Implements a producer-consumer pattern with conversation state awareness.
+
+    The consumer sleeps on an event and wakes up as soon as a message is queued
+    or the active conversation ends, so a queued message is forwarded the
+    moment the server is free. Messages are taken from the highest priority
+    class first; within a class, senders take turns so one busy sender cannot
+    starve the others.
     """
 
-    def __init__(self):
-        """Initialize the message queue manager"""
-        self.message_queue: Deque[Dict] = deque()
+    def __init__(
+        self, conversation_timeout: float = DEFAULT_CONVERSATION_TIMEOUT
+    ) -> None:
+        """
+        Initialize the message queue manager
+
+        Args:
+            conversation_timeout: Seconds after which an active conversation is
+                considered over if the server never signalled its end.
+                0 waits forever.
+        """
+        self.conversation_timeout = conversation_timeout
+        # priority -> sender id -> messages of that sender, senders in turn order
+        self._queues: Dict[int, OrderedDict[Optional[str], Deque[Dict]]] = {
+            priority: OrderedDict() for priority in PRIORITY_NAMES.values()
+        }
+        self._pending = 0
         self._conversation_active = False
-        self.lock = asyncio.Lock()
+        self._conversation_started_at = 0.0
+        # Set whenever something the consumer waits for changes
+        self._wakeup = asyncio.Event()
         self._consumer_task = None
         self._forward_func = None
         self._running = False
@@ -29,20 +70,36 @@ class ProxyMessageQueue:
         self._forward_func = forward_func
         logger.debug("Message queue initialized with forward function")
 
-    def queue_message(self, message: Dict, sender_id: Optional[str] = None) -> None:
+    def queue_message(
+        self,
+        message: Dict,
+        sender_id: Optional[str] = None,
+        priority: Optional[int] = None,
+    ) -> None:
         """
         Add a message to the queue.
 
         Args:
             message: The message to queue
             sender_id: Optional ID of the client that sent the message
+            priority: Priority class of the message. Defaults to the priority
+                named in the message, or normal.
         """
+        if priority is None:
+            priority = get_message_priority(message)
+
         # Store the message along with its sender ID
-        queue_item = {"message": message, "sender_id": sender_id}
+        queue_item = {
+            "message": message,
+            "sender_id": sender_id,
+            "queued_at": time.monotonic(),
+        }
         logger.info(
             f"Queuing message: {message.get('text', '')} (active conversation: {self._conversation_active})"
         )
-        self.message_queue.append(queue_item)
+        self._queues[priority].setdefault(sender_id, deque()).append(queue_item)
+        self._pending += 1
+        self._wakeup.set()
 
         # Start consumer if needed
         self._ensure_consumer_running()
@@ -63,10 +120,15 @@ class ProxyMessageQueue:
         if self._conversation_active != active:
             logger.debug(f"Setting conversation active state to: {active}")
             self._conversation_active = active
+            if active:
+                self._conversation_started_at = time.monotonic()
+            else:
+                # Wake the consumer to forward the next queued message
+                self._wakeup.set()
 
-            # If conversation becomes inactive, make sure consumer is running to process any queued messages
-            if not active and self.has_pending_messages():
-                self._ensure_consumer_running()
+    def end_conversation(self) -> None:
+        """Signal that the server finished the active conversation."""
+        self.conversation_active = False
 
     def has_pending_messages(self) -> bool:
         """
@@ -75,7 +137,28 @@ class ProxyMessageQueue:
         Returns:
             bool: True if there are messages to process, False otherwise
         """
-        return len(self.message_queue) > 0
+        return self._pending > 0
+
+    @property
+    def pending_count(self) -> int:
+        """Number of queued messages"""
+        return self._pending
+
+    def _pop_next(self) -> Dict:
+        """Take the next message: highest priority first, senders in turn."""
+        for senders in self._queues.values():
+            if not senders:
+                continue
+            sender_id, messages = next(iter(senders.items()))
+            queue_item = messages.popleft()
+            if messages:
+                # Let the other senders of this class go first next time
+                senders.move_to_end(sender_id)
+            else:
+                del senders[sender_id]
+            self._pending -= 1
+            return queue_item
+        raise IndexError("pop from an empty message queue")
 
     def _ensure_consumer_running(self):
         """Ensure the consumer task is running if needed"""
@@ -88,42 +171,49 @@ class ProxyMessageQueue:
             self._consumer_task = asyncio.create_task(self._consume_loop())
             logger.debug("Started message consumer task")
 
+    async def _wait_for_wakeup(self) -> None:
+        """Wait until the queue or conversation state changes."""
+        self._wakeup.clear()
+        if not self._conversation_active or self.conversation_timeout <= 0:
+            await self._wakeup.wait()
+            return
+
+        remaining = self.conversation_timeout - (
+            time.monotonic() - self._conversation_started_at
+        )
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=max(remaining, 0))
+        except asyncio.TimeoutError:
+            if self._conversation_active:
+                logger.warning(
+                    f"No conversation end signal after {self.conversation_timeout}s, "
+                    "releasing the queue"
+                )
+                self.conversation_active = False
+
     async def _consume_loop(self):
-        """Background task that consumes messages based on conversation state"""
+        """Background task that forwards messages whenever the server is free"""
         try:
             while self._running:
-                # Wait a short time to prevent CPU hogging
-                await asyncio.sleep(0.1)
-
-                # Try to consume a message if appropriate
-                async with self.lock:
-                    if not self._conversation_active and self.has_pending_messages():
-                        # Get next message
-                        queue_item = self.message_queue.popleft()
-                        message = queue_item["message"]
-                        sender_id = queue_item["sender_id"]
-
-                        logger.info(
-                            f"Consumer processing message: {message.get('text', '')}"
-                        )
-
-                        # Set active before forwarding to prevent race conditions
-                        self._conversation_active = True
-
-                        # Forward the message outside the lock to prevent deadlocks
-                        asyncio.create_task(self._forward_message(message, sender_id))
-
-                # If queue is empty and we've been idle for a while, we can pause the consumer
-                if not self.has_pending_messages() and not self._conversation_active:
-                    await asyncio.sleep(1)  # Wait a bit longer before deciding to stop
-                    if (
-                        not self.has_pending_messages()
-                        and not self._conversation_active
-                    ):
-                        logger.debug(
-                            "No more pending messages and no active conversation, pausing consumer"
-                        )
-                        break
+                if self._conversation_active or not self.has_pending_messages():
+                    await self._wait_for_wakeup()
+                    continue
+
+                queue_item = self._pop_next()
+                message = queue_item["message"]
+                sender_id = queue_item["sender_id"]
+                waited = time.monotonic() - queue_item["queued_at"]
+
+                logger.info(
+                    f"Consumer processing message: {message.get('text', '')} "
+                    f"(queued for {waited:.2f}s, {self._pending} pending)"
+                )
+
+                # Set active before forwarding to prevent race conditions
+                self.conversation_active = True
+
+                # Forward in a separate task so the consumer keeps listening
+                asyncio.create_task(self._forward_message(message, sender_id))
 
         except Exception as e:
             logger.error(f"Error in message consumer loop: {e}")
@@ -150,15 +240,18 @@ class ProxyMessageQueue:
         except Exception as e:
             logger.error(f"Error forwarding message: {e}")
             # If forwarding fails, mark conversation as inactive to allow next message
-            self._conversation_active = False
+            self.conversation_active = False
 
     def stop(self):
         """Stop the consumer task"""
         self._running = False
+        self._wakeup.set()
         if self._consumer_task and not self._consumer_task.done():
             self._consumer_task.cancel()
 
     def clear(self):
         """Clear all pending messages"""
-        self.message_queue.clear()
+        for senders in self._queues.values():
+            senders.clear()
+        self._pending = 0
         logger.info("Message queue cleared")
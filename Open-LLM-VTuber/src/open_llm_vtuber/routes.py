@@ -14,6 +14,7 @@ from ruamel.yaml import YAML
 from .service_context import ServiceContext
 from .websocket_handler import WebSocketHandler
 from .proxy_handler import ProxyHandler
+from .utils import json_codec
 
 
 def _get_base_dir() -> Path:
@@ -469,7 +470,7 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
 
         try:
             while True:
-                data = await websocket.receive_json()
+                data = await json_codec.receive(websocket)
                 text = data.get("text")
                 if not text:
                     continue
@@ -493,7 +494,8 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
                             f"Generated audio for sentence: {sentence} at: {audio_path}"
                         )
 
-                        await websocket.send_json(
+                        await json_codec.send(
+                            websocket,
                             {
                                 "status": "partial",
                                 "audioPath": audio_path,
@@ -502,11 +504,13 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
                         )
 
                     # Send completion signal
-                    await websocket.send_json({"status": "complete"})
+                    await json_codec.send(websocket, {"status": "complete"})
 
                 except Exception as e:
                     logger.error(f"Error generating TTS: {e}")
-                    await websocket.send_json({"status": "error", "message": str(e)})
+                    await json_codec.send(
+                        websocket, {"status": "error", "message": str(e)}
+                    )
 
         except WebSocketDisconnect:
             logger.info("TTS WebSocket client disconnected")
@@ -8,6 +8,8 @@ It uses FastAPI for the server and Starlette for static file serving.
 
 import os
 import shutil
+import asyncio
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
@@ -77,7 +79,9 @@ class WebSocketServer:
         default_context_cache: ServiceContext = None,
         base_dir: str | None = None,
     ):
-        self.app = FastAPI(title="Open-LLM-VTuber Server")  # Added title for clarity
+        self.app = FastAPI(
+            title="Open-LLM-VTuber Server", lifespan=self._lifespan
+        )  # Added title for clarity
         self.config = config
         self.default_context_cache = (
             default_context_cache or ServiceContext()
@@ -177,6 +181,18 @@ class WebSocketServer:
                 name="frontend",
             )
 
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI):
+        """Start shared background services in the server's event loop."""
+        # Pre-warm MCP servers in the background so startup is not delayed
+        prewarm_task = asyncio.create_task(
+            self.default_context_cache.prewarm_mcp_servers()
+        )
+        yield
+        prewarm_task.cancel()
+        if self.default_context_cache.mcp_session_pool:
+            await self.default_context_cache.mcp_session_pool.aclose()
+
     async def initialize(self):
         """Asynchronously load the service context from config.
         Calling this function is needed if default_context_cache was not provided to the constructor."""
@@ -1,5 +1,8 @@
 import os
 import json
+import asyncio
+import weakref
+from functools import partial
 from typing import Callable
 from loguru import logger
 from fastapi import WebSocket
@@ -17,9 +20,10 @@ from .mcpp.tool_manager import ToolManager
 from .mcpp.mcp_client import MCPClient
 from .mcpp.tool_executor import ToolExecutor
 from .mcpp.tool_adapter import ToolAdapter
+from .mcpp.session_pool import MCPSessionPool
 
-from .asr.asr_factory import ASRFactory
-from .tts.tts_factory import TTSFactory
+from .asr.asr_factory import ASRFactory, LOCAL_ASR_SYSTEMS
+from .tts.tts_factory import TTSFactory, LOCAL_TTS_ENGINES
 from .vad.vad_factory import VADFactory
 from .agent.agent_factory import AgentFactory
 from .translate.translate_factory import TranslateFactory
@@ -36,6 +40,13 @@ from .config_manager import (
     read_yaml,
     validate_config,
 )
+from .utils import json_codec
+from .startup_report import StartupReport
+from .engine_registry import engine_registry
+from .engine_host import ProcessASR, ProcessTTS
+
+# Engines that already ran their warm-up, shared by all service contexts
+_warmed_up_engines: "weakref.WeakSet" = weakref.WeakSet()
 
 
 class ServiceContext:
@@ -57,6 +68,8 @@ class ServiceContext:
 
         self.mcp_server_registery: ServerRegistry | None = None
         self.tool_adapter: ToolAdapter | None = None
+        # Process-wide MCP server sessions, shared by reference across contexts
+        self.mcp_session_pool: MCPSessionPool | None = None
         self.tool_manager: ToolManager | None = None
         self.mcp_client: MCPClient | None = None
         self.tool_executor: ToolExecutor | None = None
@@ -72,6 +85,9 @@ class ServiceContext:
         self.send_text: Callable = None
         self.client_uid: str = None
 
+        # Component timings of the last load_from_config call
+        self.startup_report: StartupReport | None = None
+
     def __str__(self):
         return (
             f"ServiceContext:\n"
@@ -157,7 +173,10 @@ class ServiceContext:
             # 4. Initialize MCPClient
             if self.mcp_server_registery:
                 self.mcp_client = MCPClient(
-                    self.mcp_server_registery, self.send_text, self.client_uid
+                    self.mcp_server_registery,
+                    self.send_text,
+                    self.client_uid,
+                    session_pool=self.mcp_session_pool,
                 )
                 logger.info("MCPClient initialized for this session.")
             else:
@@ -187,6 +206,17 @@ class ServiceContext:
                 "MCP components not initialized (use_mcpp is False or no enabled servers)."
             )
 
+    async def prewarm_mcp_servers(self) -> None:
+        """Start the enabled MCP servers in the shared pool ahead of first use."""
+        if not self.mcp_session_pool or not self.character_config:
+            return
+        basic_memory_agent = (
+            self.character_config.agent_config.agent_settings.basic_memory_agent
+        )
+        if not basic_memory_agent or not basic_memory_agent.use_mcpp:
+            return
+        await self.mcp_session_pool.prewarm(basic_memory_agent.mcp_enabled_servers)
+
     async def close(self):
         """Clean up resources, especially the MCPClient."""
         logger.info("Closing ServiceContext resources...")
@@ -211,12 +241,14 @@ class ServiceContext:
         translate_engine: TranslateInterface | None,
         mcp_server_registery: ServerRegistry | None = None,
         tool_adapter: ToolAdapter | None = None,
+        mcp_session_pool: MCPSessionPool | None = None,
         send_text: Callable = None,
         client_uid: str = None,
     ) -> None:
         """
         Load the ServiceContext with the reference of the provided instances.
-        Pass by reference so no reinitialization will be done.
+        Pass by reference so no reinitialization will be done. The agent is
+        replaced by a session agent with its own memory, sharing the LLM client.
         """
         if not character_config:
             raise ValueError("character_config cannot be None")
@@ -235,6 +267,7 @@ class ServiceContext:
         # Load potentially shared components by reference
         self.mcp_server_registery = mcp_server_registery
         self.tool_adapter = tool_adapter
+        self.mcp_session_pool = mcp_session_pool
         self.send_text = send_text
         self.client_uid = client_uid
 
@@ -244,6 +277,12 @@ class ServiceContext:
             self.character_config.agent_config.agent_settings.basic_memory_agent.mcp_enabled_servers,
         )
 
+        # Give the session its own memory, sharing the LLM client
+        if agent_engine is not None:
+            self.agent_engine = agent_engine.create_session(
+                tool_executor=self.tool_executor
+            )
+
         logger.debug(f"Loaded service context with cache: {character_config}")
 
     async def load_from_config(self, config: Config) -> None:
@@ -251,6 +290,12 @@ class ServiceContext:
         Load the ServiceContext with the config.
         Reinitialize the instances if the config is different.
 
+        ASR, TTS, VAD and the translator are loaded in worker threads while
+        the agent is built, unless `concurrent_engine_init` is disabled.
+        Newly loaded local engines are then warmed up, unless
+        `warm_up_engines` is disabled. The timing of each component and
+        warm-up is stored in `startup_report`.
+
         Parameters:
         - config (Dict): The configuration dictionary.
         """
@@ -264,47 +309,138 @@ class ServiceContext:
             self.character_config = config.character_config
 
         # update all sub-configs
+        character_config = config.character_config
+        basic_memory_agent = (
+            character_config.agent_config.agent_settings.basic_memory_agent
+        )
+        concurrent = config.system_config.concurrent_engine_init
+        warm_up = config.system_config.warm_up_engines
+        engine_registry.configure(config.system_config.engine_cache)
+        report = StartupReport(concurrent=concurrent)
+        self.startup_report = report
+
+        async def run_blocking(init: Callable, *args) -> None:
+            """Run a blocking initializer, in a worker thread if concurrent."""
+            if concurrent:
+                await asyncio.to_thread(init, *args)
+            else:
+                init(*args)
+
+        async def timed_blocking(
+            component: str,
+            detail: str,
+            init: Callable,
+            engine_config,
+            engine_attr: str | None = None,
+        ) -> None:
+            await report.timed(component, run_blocking(init, engine_config), detail)
+            engine = getattr(self, engine_attr) if engine_attr else None
+            if warm_up and self.needs_warm_up(component, detail, engine):
+                await report.timed(
+                    f"{component} warm-up",
+                    run_blocking(self.warm_up_engine, component, detail, engine),
+                    detail,
+                )
 
-        # init live2d from character config
-        self.init_live2d(config.character_config.live2d_model_name)
-
-        # init asr from character config
-        self.init_asr(config.character_config.asr_config)
-
-        # init tts from character config
-        self.init_tts(config.character_config.tts_config)
-
-        # init vad from character config
-        self.init_vad(config.character_config.vad_config)
+        async def init_agent_chain() -> None:
+            """Live2D and MCP tools are part of the agent's system prompt."""
+            # init live2d from character config
+            await report.timed(
+                "Live2D",
+                run_blocking(self.init_live2d, character_config.live2d_model_name),
+                character_config.live2d_model_name,
+            )
 
-        # Initialize shared ToolAdapter if it doesn't exist yet
-        if (
-            not self.tool_adapter
-            and config.character_config.agent_config.agent_settings.basic_memory_agent.use_mcpp
-        ):
-            if not self.mcp_server_registery:
-                logger.info(
-                    "Initializing shared ServerRegistry within load_from_config."
+            # Initialize shared ToolAdapter if it doesn't exist yet
+            if not self.tool_adapter and basic_memory_agent.use_mcpp:
+                if not self.mcp_server_registery:
+                    logger.info(
+                        "Initializing shared ServerRegistry within load_from_config."
+                    )
+                    self.mcp_server_registery = ServerRegistry()
+                if not self.mcp_session_pool:
+                    logger.info(
+                        "Initializing shared MCPSessionPool within load_from_config."
+                    )
+                    self.mcp_session_pool = MCPSessionPool(self.mcp_server_registery)
+                logger.info("Initializing shared ToolAdapter within load_from_config.")
+                self.tool_adapter = ToolAdapter(
+                    server_registery=self.mcp_server_registery,
+                    session_pool=self.mcp_session_pool,
                 )
-                self.mcp_server_registery = ServerRegistry()
-            logger.info("Initializing shared ToolAdapter within load_from_config.")
-            self.tool_adapter = ToolAdapter(server_registery=self.mcp_server_registery)
 
-        # Initialize MCP Components before initializing Agent
-        await self._init_mcp_components(
-            config.character_config.agent_config.agent_settings.basic_memory_agent.use_mcpp,
-            config.character_config.agent_config.agent_settings.basic_memory_agent.mcp_enabled_servers,
-        )
+            # Initialize MCP Components before initializing Agent
+            await report.timed(
+                "MCP",
+                self._init_mcp_components(
+                    basic_memory_agent.use_mcpp,
+                    basic_memory_agent.mcp_enabled_servers,
+                ),
+                "enabled" if basic_memory_agent.use_mcpp else "disabled",
+            )
 
-        # init agent from character config
-        await self.init_agent(
-            config.character_config.agent_config,
-            config.character_config.persona_prompt,
-        )
+            # init agent from character config
+            await report.timed(
+                "Agent",
+                self.init_agent(
+                    character_config.agent_config,
+                    character_config.persona_prompt,
+                ),
+                character_config.agent_config.conversation_agent_choice,
+            )
 
-        self.init_translate(
-            config.character_config.tts_preprocessor_config.translator_config
-        )
+        # The engines do not depend on each other, so they are loaded
+        # concurrently with the agent
+        translator_config = character_config.tts_preprocessor_config.translator_config
+        steps = [
+            partial(
+                timed_blocking,
+                "ASR",
+                character_config.asr_config.asr_model,
+                self.init_asr,
+                character_config.asr_config,
+                "asr_engine",
+            ),
+            partial(
+                timed_blocking,
+                "TTS",
+                character_config.tts_config.tts_model,
+                self.init_tts,
+                character_config.tts_config,
+                "tts_engine",
+            ),
+            partial(
+                timed_blocking,
+                "VAD",
+                character_config.vad_config.vad_model or "disabled",
+                self.init_vad,
+                character_config.vad_config,
+                "vad_engine",
+            ),
+            init_agent_chain,
+            partial(
+                timed_blocking,
+                "Translator",
+                translator_config.translate_provider
+                if translator_config.translate_audio
+                else "disabled",
+                self.init_translate,
+                translator_config,
+            ),
+        ]
+        try:
+            if concurrent:
+                results = await asyncio.gather(
+                    *(step() for step in steps), return_exceptions=True
+                )
+                errors = [r for r in results if isinstance(r, BaseException)]
+                if errors:
+                    raise errors[0]
+            else:
+                for step in steps:
+                    await step()
+        finally:
+            report.finish()
 
         # store typed config references
         self.config = config
@@ -323,9 +459,19 @@ class ServiceContext:
     def init_asr(self, asr_config: ASRConfig) -> None:
         if not self.asr_engine or (self.character_config.asr_config != asr_config):
             logger.info(f"Initializing ASR: {asr_config.asr_model}")
-            self.asr_engine = ASRFactory.get_asr_system(
+            asr_settings = getattr(asr_config, asr_config.asr_model).model_dump()
+            processes = self.get_engine_processes(
+                asr_config.asr_model, LOCAL_ASR_SYSTEMS
+            )
+            self.asr_engine = engine_registry.get_or_create(
+                "asr",
                 asr_config.asr_model,
-                **getattr(asr_config, asr_config.asr_model).model_dump(),
+                {**asr_settings, "processes": processes},
+                lambda: (
+                    ProcessASR(asr_config.asr_model, asr_settings, processes)
+                    if processes
+                    else ASRFactory.get_asr_system(asr_config.asr_model, **asr_settings)
+                ),
             )
             # saving config should be done after successful initialization
             self.character_config.asr_config = asr_config
@@ -335,9 +481,21 @@ class ServiceContext:
     def init_tts(self, tts_config: TTSConfig) -> None:
         if not self.tts_engine or (self.character_config.tts_config != tts_config):
             logger.info(f"Initializing TTS: {tts_config.tts_model}")
-            self.tts_engine = TTSFactory.get_tts_engine(
+            tts_settings = getattr(
+                tts_config, tts_config.tts_model.lower()
+            ).model_dump()
+            processes = self.get_engine_processes(
+                tts_config.tts_model, LOCAL_TTS_ENGINES
+            )
+            self.tts_engine = engine_registry.get_or_create(
+                "tts",
                 tts_config.tts_model,
-                **getattr(tts_config, tts_config.tts_model.lower()).model_dump(),
+                {**tts_settings, "processes": processes},
+                lambda: (
+                    ProcessTTS(tts_config.tts_model, tts_settings, processes)
+                    if processes
+                    else TTSFactory.get_tts_engine(tts_config.tts_model, **tts_settings)
+                ),
             )
             # saving config should be done after successful initialization
             self.character_config.tts_config = tts_config
@@ -352,15 +510,63 @@ class ServiceContext:
 
         if not self.vad_engine or (self.character_config.vad_config != vad_config):
             logger.info(f"Initializing VAD: {vad_config.vad_model}")
-            self.vad_engine = VADFactory.get_vad_engine(
+            vad_settings = getattr(
+                vad_config, vad_config.vad_model.lower()
+            ).model_dump()
+            self.vad_engine = engine_registry.get_or_create(
+                "vad",
                 vad_config.vad_model,
-                **getattr(vad_config, vad_config.vad_model.lower()).model_dump(),
+                vad_settings,
+                lambda: VADFactory.get_vad_engine(vad_config.vad_model, **vad_settings),
             )
             # saving config should be done after successful initialization
             self.character_config.vad_config = vad_config
         else:
             logger.info("VAD already initialized with the same config.")
 
+    def get_engine_processes(self, name: str, local_engines: frozenset) -> int:
+        """
+        Get the number of worker processes configured for an engine.
+
+        Returns:
+            int: Worker processes, 0 to run the engine in the server process
+        """
+        processes = self.system_config.engine_processes.get(name, 0)
+        if processes > 0 and name not in local_engines:
+            logger.warning(
+                f"{name} does not run locally, ignoring its engine_processes setting"
+            )
+            return 0
+        return max(processes, 0)
+
+    @staticmethod
+    def needs_warm_up(component: str, name: str, engine) -> bool:
+        """
+        Check whether an engine should be warmed up: it runs locally and
+        was not warmed up yet. Cloud engines are skipped, a warm-up would
+        only spend API quota.
+        """
+        if engine is None or engine in _warmed_up_engines:
+            return False
+        if component == "ASR":
+            return name in LOCAL_ASR_SYSTEMS
+        if component == "TTS":
+            return name in LOCAL_TTS_ENGINES
+        return component == "VAD"
+
+    def warm_up_engine(self, component: str, name: str, engine) -> None:
+        """
+        Run a short synthetic input through an engine so the first real
+        utterance does not pay for its lazy initialization.
+        """
+        logger.info(f"Warming up {component}: {name}")
+        try:
+            engine.warm_up()
+        except Exception as e:
+            # The engine still works, the first utterance will just be slower
+            logger.warning(f"{component} warm-up failed for {name}: {e}")
+        _warmed_up_engines.add(engine)
+
     async def init_agent(self, agent_config: AgentConfig, persona_prompt: str) -> None:
         """Initialize or update the LLM engine based on agent configuration."""
         logger.info(f"Initializing Agent: {agent_config.conversation_agent_choice}")
@@ -513,6 +719,7 @@ class ServiceContext:
                 }
                 new_config = validate_config(new_config)
                 await self.load_from_config(new_config)  # Await the async load
+                logger.info(self.startup_report.format())
                 logger.debug(f"New config: {self}")
                 logger.debug(
                     f"New character config: {self.character_config.model_dump()}"
@@ -520,7 +727,7 @@ class ServiceContext:
 
                 # Send responses to client
                 await websocket.send_text(
-                    json.dumps(
+                    json_codec.dumps(
                         {
                             "type": "set-model-and-conf",
                             "model_info": self.live2d_model.model_info,
@@ -531,7 +738,7 @@ class ServiceContext:
                 )
 
                 await websocket.send_text(
-                    json.dumps(
+                    json_codec.dumps(
                         {
                             "type": "config-switched",
                             "message": f"Switched to config: {config_file_name}",
@@ -549,7 +756,7 @@ class ServiceContext:
             logger.error(f"Error switching configuration: {e}")
             logger.debug(self)
             await websocket.send_text(
-                json.dumps(
+                json_codec.dumps(
                     {
                         "type": "error",
                         "message": f"Error switching configuration: {str(e)}",
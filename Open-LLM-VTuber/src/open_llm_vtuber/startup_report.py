@@ -0,0 +1,94 @@
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Awaitable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class ComponentTiming:
+    """Time it took to initialize one component."""
+
+    component: str
+    detail: str
+    seconds: float
+    failed: bool = False
+
+
+class StartupReport:
+    """
+    Collects per-component initialization timings of a service context.
+
+    Components that are initialized concurrently overlap, so the wall time of
+    the whole load is reported next to the sum of the component timings.
+    """
+
+    def __init__(self, concurrent: bool = True):
+        """
+        Initialize the report.
+
+        Args:
+            concurrent: Whether the components are initialized concurrently
+        """
+        self.concurrent = concurrent
+        self.timings: List[ComponentTiming] = []
+        self._started_at = time.perf_counter()
+        self._finished_at: Optional[float] = None
+
+    @contextmanager
+    def measure(self, component: str, detail: str = "") -> Iterator[None]:
+        """
+        Time the initialization of a component.
+
+        Args:
+            component: Component name, e.g. "ASR"
+            detail: Engine or model name shown next to the component
+        """
+        start = time.perf_counter()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            self.timings.append(
+                ComponentTiming(
+                    component, detail or "", time.perf_counter() - start, failed
+                )
+            )
+
+    async def timed(
+        self, component: str, awaitable: Awaitable[T], detail: str = ""
+    ) -> T:
+        """Await an initialization step and record how long it took."""
+        with self.measure(component, detail):
+            return await awaitable
+
+    def finish(self) -> None:
+        """Mark the end of the load."""
+        self._finished_at = time.perf_counter()
+
+    @property
+    def total_seconds(self) -> float:
+        """Wall time of the whole load."""
+        return (self._finished_at or time.perf_counter()) - self._started_at
+
+    def format(self) -> str:
+        """Format the report as a table, slowest component first."""
+        width = max(
+            (len(f"{t.component} ({t.detail})") for t in self.timings), default=0
+        )
+        lines = [
+            f"Startup report: loaded in {self.total_seconds:.2f}s "
+            f"({'concurrent' if self.concurrent else 'sequential'} initialization, "
+            f"{sum(t.seconds for t in self.timings):.2f}s of component time)"
+        ]
+        for timing in sorted(self.timings, key=lambda t: -t.seconds):
+            name = (
+                f"{timing.component} ({timing.detail})"
+                if timing.detail
+                else timing.component
+            )
+            status = "  FAILED" if timing.failed else ""
+            lines.append(f"  {name:<{width}}  {timing.seconds:>7.2f}s{status}")
+        return "\n".join(lines)
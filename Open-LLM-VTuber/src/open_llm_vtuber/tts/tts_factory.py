@@ -1,6 +1,18 @@
 from typing import Type
 from .tts_interface import TTSInterface
 
+# TTS engines running in this process, which benefit from a warm-up at startup
+LOCAL_TTS_ENGINES = frozenset(
+    {
+        "bark_tts",
+        "coqui_tts",
+        "melo_tts",
+        "piper_tts",
+        "pyttsx3_tts",
+        "sherpa_onnx_tts",
+    }
+)
+
 
 class TTSFactory:
     @staticmethod
@@ -1,11 +1,15 @@
 import abc
 import os
+import uuid
 import asyncio
 
 from loguru import logger
 
 
 class TTSInterface(metaclass=abc.ABCMeta):
+    # Text synthesized by warm_up
+    WARM_UP_TEXT = "Hello."
+
     async def async_generate_audio(self, text: str, file_name_no_ext=None) -> str:
         """
         Asynchronously generate speech audio file using TTS.
@@ -39,6 +43,18 @@ class TTSInterface(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    def warm_up(self) -> None:
+        """
+        Synthesize a short sentence to load everything the engine sets up
+        lazily (graphs, CUDA kernels, tokenizers) before the first real
+        sentence. The generated file is removed.
+        """
+        file_path = self.generate_audio(
+            self.WARM_UP_TEXT, f"warm_up_{uuid.uuid4().hex[:8]}"
+        )
+        if file_path and os.path.exists(file_path):
+            self.remove_file(file_path, verbose=False)
+
     def remove_file(self, filepath: str, verbose: bool = True) -> None:
         """
         Remove a file from the file system.
@@ -0,0 +1,150 @@
+"""
+JSON codec for WebSocket traffic.
+
+Every message sent to or received from a WebSocket goes through this module.
+It uses orjson when it is installed (`pip install orjson`), which is several
+times faster on large audio payloads, and falls back to the standard library
+otherwise. Another codec can be plugged in with `set_codec`.
+
+Messages that are already encoded (`str` or `bytes`) are passed through
+without being parsed and encoded again.
+"""
+
+import json
+import re
+from typing import Any, Dict, Union
+
+from loguru import logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError is a subclass of it, so callers can catch this one
+JSONDecodeError = json.JSONDecodeError
+
+Message = Union[dict, list, str, bytes]
+
+# Messages up to this size are fully decoded by `peek_header`
+PEEK_DECODE_MAX_CHARS = 4096
+# Larger messages only have their leading characters checked for the type
+PEEK_HEAD_CHARS = 256
+_LEADING_TYPE_PATTERN = re.compile(r'\s*\{\s*"type"\s*:\s*"([^"\\]*)"')
+
+
+class JSONCodec:
+    """JSON codec based on the standard library."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> str:
+        """Encode an object to a JSON string."""
+        return json.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decode a JSON string or UTF-8 bytes."""
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec based on orjson."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=self._options).decode("utf-8")
+        except TypeError:
+            # Types orjson does not support, e.g. integers above 64 bits
+            return json.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+
+_codec: JSONCodec = OrjsonCodec() if orjson is not None else JSONCodec()
+
+
+def get_codec() -> JSONCodec:
+    """Get the codec in use."""
+    return _codec
+
+
+def set_codec(codec: JSONCodec) -> None:
+    """Replace the codec used for all WebSocket traffic."""
+    global _codec
+    _codec = codec
+    logger.info(f"Using {codec.name} for WebSocket messages")
+
+
+def dumps(obj: Any) -> str:
+    """Encode an object to a JSON string."""
+    return _codec.dumps(obj)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON string or UTF-8 bytes."""
+    return _codec.loads(data)
+
+
+def encode(message: Message) -> str:
+    """
+    Encode a message for a WebSocket text frame.
+
+    Args:
+        message: A message object, or an already encoded message (`str` or
+            UTF-8 `bytes`) which is passed through without re-encoding
+
+    Returns:
+        str: The encoded message
+    """
+    if isinstance(message, str):
+        return message
+    if isinstance(message, (bytes, bytearray, memoryview)):
+        return bytes(message).decode("utf-8")
+    return _codec.dumps(message)
+
+
+def peek_header(data: Union[str, bytes]) -> Dict[str, Any]:
+    """
+    Read the `type` and `text` fields of an encoded message cheaply.
+
+    Small messages are decoded. For large ones (e.g. audio) the type is only
+    read if it is the first field, which is how the server builds its
+    messages, so the payload itself is never parsed.
+
+    Args:
+        data: Encoded message
+
+    Returns:
+        Dict[str, Any]: The `type` and `text` fields that were found. Empty
+        if the message is not a JSON object or its type could not be found.
+    """
+    if len(data) <= PEEK_DECODE_MAX_CHARS:
+        try:
+            message = _codec.loads(data)
+        except ValueError:
+            return {}
+        if not isinstance(message, dict):
+            return {}
+        return {key: message[key] for key in ("type", "text") if key in message}
+
+    head = data[:PEEK_HEAD_CHARS]
+    if isinstance(head, bytes):
+        head = head.decode("utf-8", errors="ignore")
+    match = _LEADING_TYPE_PATTERN.match(head)
+    return {"type": match.group(1)} if match else {}
+
+
+async def send(websocket: Any, message: Message) -> None:
+    """Send a message over a FastAPI WebSocket as a text frame."""
+    await websocket.send_text(encode(message))
+
+
+async def receive(websocket: Any) -> Any:
+    """Receive and decode a JSON text frame from a FastAPI WebSocket."""
+    return _codec.loads(await websocket.receive_text())
@@ -1,4 +1,6 @@
 import re
+import time
+from functools import lru_cache
 from typing import List, Tuple, AsyncIterator, Optional, Union, Dict, Any
 import pysbd
 from loguru import logger
@@ -45,6 +47,17 @@ ABBREVIATIONS = [
     "Dr.",
 ]
 
+# Every comma and end punctuation above is (or consists of) a single character,
+# so a character class is enough to find the next boundary candidate.
+COMMA_PATTERN = re.compile("[" + re.escape("".join(COMMAS)) + "]")
+END_PUNCTUATION_PATTERN = re.compile(
+    "[" + re.escape("".join(sorted(set("".join(END_PUNCTUATIONS))))) + "]"
+)
+
+# Minimum amount of text before the detected language is cached for a stream.
+# langdetect is unreliable on very short snippets.
+LANGUAGE_DETECTION_MIN_CHARS = 20
+
 # Set of languages directly supported by pysbd
 SUPPORTED_LANGUAGES = {
     "am",
@@ -141,6 +154,40 @@ def comma_splitter(text: str) -> Tuple[str, str]:
     return text, ""
 
 
+def word_boundary_splitter(text: str) -> Tuple[str, str]:
+    """
+    Split text at the last word boundary so that a trailing, possibly
+    incomplete word stays in the buffer.
+
+    Text without whitespace is only split when it ends with a character from a
+    script that does not separate words with spaces (e.g. Chinese, Japanese),
+    in which case the whole text is returned.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Tuple[str, str]: (fragment up to the boundary, remaining text).
+        The fragment is empty if no safe boundary was found.
+    """
+    stripped = text.rstrip()
+    if not stripped:
+        return "", text
+
+    # Text ending in whitespace is already at a boundary
+    if len(stripped) < len(text):
+        return stripped.strip(), ""
+
+    boundary = max(stripped.rfind(" "), stripped.rfind("\n"), stripped.rfind("\t"))
+    if boundary > 0 and stripped[:boundary].strip():
+        return stripped[:boundary].strip(), stripped[boundary:].lstrip()
+
+    if ord(stripped[-1]) >= 0x2E80:
+        return stripped.strip(), ""
+
+    return "", text
+
+
 def has_punctuation(text: str) -> bool:
     """
     Check if the text is a punctuation mark.
@@ -210,13 +257,30 @@ def segment_text_by_regex(text: str) -> Tuple[List[str], str]:
     return complete_sentences, remaining_text
 
 
-def segment_text_by_pysbd(text: str) -> Tuple[List[str], str]:
+@lru_cache(maxsize=None)
+def get_pysbd_segmenter(language: str) -> pysbd.Segmenter:
     """
-    Segment text into complete sentences and remaining text.
+    Get a cached pysbd segmenter for a language.
+
+    Args:
+        language: Language code supported by pysbd
+
+    Returns:
+        pysbd.Segmenter: Segmenter for the language
+    """
+    return pysbd.Segmenter(language=language, clean=False)
+
+
+def segment_text_by_language(
+    text: str, language: Optional[str]
+) -> Tuple[List[str], str]:
+    """
+    Segment text into complete sentences with an already detected language.
     Uses pysbd for supported languages, falls back to regex for others.
 
     Args:
         text: Text to segment into sentences
+        language: Language code supported by pysbd, or None to use regex
 
     Returns:
         Tuple[List[str], str]: (list of complete sentences, remaining incomplete text)
@@ -224,36 +288,29 @@ def segment_text_by_pysbd(text: str) -> Tuple[List[str], str]:
     if not text:
         return [], ""
 
-    try:
-        # Detect language
-        lang = detect_language(text)
-
-        if lang is not None:
-            # Use pysbd for supported languages
-            segmenter = pysbd.Segmenter(language=lang, clean=False)
-            sentences = segmenter.segment(text)
-
-            if not sentences:
-                return [], text
-
-            # Process all but the last sentence
-            complete_sentences = []
-            for sent in sentences[:-1]:
-                sent = sent.strip()
-                if sent:
-                    complete_sentences.append(sent)
-
-            # Handle the last sentence
-            last_sent = sentences[-1].strip()
-            if is_complete_sentence(last_sent):
-                complete_sentences.append(last_sent)
-                remaining = ""
-            else:
-                remaining = last_sent
+    if language is None:
+        return segment_text_by_regex(text)
 
+    try:
+        sentences = get_pysbd_segmenter(language).segment(text)
+
+        if not sentences:
+            return [], text
+
+        # Process all but the last sentence
+        complete_sentences = []
+        for sent in sentences[:-1]:
+            sent = sent.strip()
+            if sent:
+                complete_sentences.append(sent)
+
+        # Handle the last sentence
+        last_sent = sentences[-1].strip()
+        if is_complete_sentence(last_sent):
+            complete_sentences.append(last_sent)
+            remaining = ""
         else:
-            # Use regex for unsupported languages
-            return segment_text_by_regex(text)
+            remaining = last_sent
 
         logger.debug(
             f"Processed sentences: {complete_sentences}, Remaining: {remaining}"
@@ -266,6 +323,23 @@ def segment_text_by_pysbd(text: str) -> Tuple[List[str], str]:
         return segment_text_by_regex(text)
 
 
+def segment_text_by_pysbd(text: str) -> Tuple[List[str], str]:
+    """
+    Segment text into complete sentences and remaining text.
+    Uses pysbd for supported languages, falls back to regex for others.
+
+    Args:
+        text: Text to segment into sentences
+
+    Returns:
+        Tuple[List[str], str]: (list of complete sentences, remaining incomplete text)
+    """
+    if not text:
+        return [], ""
+
+    return segment_text_by_language(text, detect_language(text))
+
+
 class TagState(Enum):
     """State of a tag in text"""
 
@@ -299,11 +373,22 @@ class SentenceWithTags:
 
 
 class SentenceDivider:
+    """
+    Incrementally divide a token stream into sentences and tags.
+
+    The divider remembers how far the buffer has already been scanned, so each
+    new token only costs a scan of the newly appended text instead of the whole
+    buffer. Sentence segmentation only runs when new end punctuation arrives,
+    and the detected language is cached for the rest of the stream.
+    """
+
     def __init__(
         self,
         faster_first_response: bool = True,
         segment_method: str = "pysbd",
         valid_tags: List[str] = None,
+        first_chunk_max_chars: int = 60,
+        first_chunk_max_wait: float = 1.0,
     ):
         """
         Initialize the SentenceDivider.
@@ -312,14 +397,40 @@ class SentenceDivider:
             faster_first_response: Whether to split first sentence at commas
             segment_method: Method for segmenting sentences
             valid_tags: List of valid tag names to detect
+            first_chunk_max_chars: When faster_first_response is enabled, emit
+                the first fragment at a word boundary once this many characters
+                are buffered without punctuation. 0 disables the limit.
+            first_chunk_max_wait: When faster_first_response is enabled, emit
+                the first fragment at a word boundary once speakable text has
+                been buffered for this many seconds. Checked whenever a new
+                chunk arrives. 0 disables the limit.
         """
         self.faster_first_response = faster_first_response
         self.segment_method = segment_method
         self.valid_tags = valid_tags or ["think"]
+        self.first_chunk_max_chars = first_chunk_max_chars
+        self.first_chunk_max_wait = first_chunk_max_wait
+
+        # One pattern for every opening, closing and self-closing tag
+        tag_names = "|".join(re.escape(tag) for tag in self.valid_tags)
+        self._tag_pattern = re.compile(
+            rf"</(?P<end>{tag_names})>|<(?P<start>{tag_names})(?P<self_closing>/)?>"
+        )
+        # Longest possible tag, used to rescan tags split across chunks
+        self._max_tag_len = max(len(f"</{tag}>") for tag in self.valid_tags)
+
         self._is_first_sentence = True
         self._buffer = ""
         # Replace active_tags dict with a stack to handle nesting
         self._tag_stack = []
+        # Time at which speakable text of the first sentence started buffering
+        self._first_chunk_started_at: Optional[float] = None
+        # Buffer offsets up to which no tag / no punctuation has been found
+        self._tag_scan_pos = 0
+        self._punctuation_scan_pos = 0
+        # Language detected for the current stream
+        self._language: Optional[str] = None
+        self._language_detected = False
 
     def _get_current_tags(self) -> List[TagInfo]:
         """
@@ -339,68 +450,111 @@ class SentenceDivider:
         """
         return self._tag_stack[-1] if self._tag_stack else None
 
-    def _extract_tag(self, text: str) -> Tuple[Optional[TagInfo], str]:
+    def _first_chunk_budget_exceeded(self) -> bool:
+        """
+        Check whether the buffered first sentence exceeded its size or time budget.
+
+        Only applies to speakable text, i.e. while no tag is open.
+
+        Returns:
+            bool: Whether the first fragment should be emitted without waiting
+            for punctuation
+        """
+        if (
+            not self._is_first_sentence
+            or not self.faster_first_response
+            or self._tag_stack
+        ):
+            return False
+
+        now = time.monotonic()
+        if self._first_chunk_started_at is None:
+            self._first_chunk_started_at = now
+
+        if 0 < self.first_chunk_max_chars <= len(self._buffer.strip()):
+            return True
+        return 0 < self.first_chunk_max_wait <= now - self._first_chunk_started_at
+
+    def _consume(self, length: int) -> None:
+        """
+        Drop the first `length` characters (and following whitespace) from the
+        buffer, keeping the scan offsets aligned with the remaining text.
+
+        Args:
+            length: Number of characters to drop
+        """
+        remaining = self._buffer[length:].lstrip()
+        removed = len(self._buffer) - len(remaining)
+        self._buffer = remaining
+        self._tag_scan_pos = max(0, self._tag_scan_pos - removed)
+        self._punctuation_scan_pos = max(0, self._punctuation_scan_pos - removed)
+
+    def _replace_buffer(self, text: str) -> None:
+        """
+        Replace the buffer with text that is not a plain suffix of it,
+        e.g. the remainder returned by sentence segmentation.
+
+        Args:
+            text: New buffer content
+        """
+        self._buffer = text
+        self._tag_scan_pos = 0
+        self._punctuation_scan_pos = 0
+
+    def _find_next_tag(self) -> Optional[re.Match]:
+        """
+        Find the next tag in the buffer, scanning only text that could not be
+        ruled out before.
+
+        Returns:
+            The match of the first tag, or None if the buffer has no tag
+        """
+        match = self._tag_pattern.search(self._buffer, self._tag_scan_pos)
+        if match:
+            self._tag_scan_pos = match.start()
+        else:
+            # A tag may still be completed by the next chunk
+            self._tag_scan_pos = max(0, len(self._buffer) - self._max_tag_len + 1)
+        return match
+
+    def _find_boundary_punctuation(self, pattern: re.Pattern) -> bool:
+        """
+        Check whether the unscanned part of the buffer contains punctuation.
+
+        Args:
+            pattern: Compiled punctuation pattern to search for
+
+        Returns:
+            bool: Whether punctuation was found after the scan offset
+        """
+        return pattern.search(self._buffer, self._punctuation_scan_pos) is not None
+
+    def _apply_tag(self, match: re.Match) -> TagInfo:
         """
-        Extract the first tag from text if present.
-        Handles nested tags by maintaining a tag stack.
+        Update the tag stack for a matched tag.
 
         Args:
-            text: Text to check for tags
+            match: Match produced by the tag pattern
 
         Returns:
-            Tuple of (TagInfo if tag found else None, remaining text)
+            TagInfo: Information about the matched tag
         """
-        # Find the first occurrence of any tag
-        first_tag = None
-        first_pos = len(text)
-        tag_type = None
-        matched_tag = None
-
-        # Check for self-closing tags
-        for tag in self.valid_tags:
-            pattern = f"<{tag}/>"
-            match = re.search(pattern, text)
-            if match and match.start() < first_pos:
-                first_pos = match.start()
-                first_tag = match
-                tag_type = TagState.SELF_CLOSING
-                matched_tag = tag
-
-        # Check for opening tags
-        for tag in self.valid_tags:
-            pattern = f"<{tag}>"
-            match = re.search(pattern, text)
-            if match and match.start() < first_pos:
-                first_pos = match.start()
-                first_tag = match
-                tag_type = TagState.START
-                matched_tag = tag
-
-        # Check for closing tags
-        for tag in self.valid_tags:
-            pattern = f"</{tag}>"
-            match = re.search(pattern, text)
-            if match and match.start() < first_pos:
-                first_pos = match.start()
-                first_tag = match
-                tag_type = TagState.END
-                matched_tag = tag
-
-        if not first_tag:
-            return None, text
-
-        # Handle the found tag
-        if tag_type == TagState.START:
-            # Push new tag onto stack
-            self._tag_stack.append(TagInfo(matched_tag, TagState.START))
-        elif tag_type == TagState.END:
+        if match.group("end"):
+            tag_name = match.group("end")
             # Verify matching tags
-            if not self._tag_stack or self._tag_stack[-1].name != matched_tag:
-                logger.warning(f"Mismatched closing tag: {matched_tag}")
+            if not self._tag_stack or self._tag_stack[-1].name != tag_name:
+                logger.warning(f"Mismatched closing tag: {tag_name}")
             else:
                 self._tag_stack.pop()
+            return TagInfo(tag_name, TagState.END)
 
-        return (TagInfo(matched_tag, tag_type), text[first_tag.end() :].lstrip())
+        tag_name = match.group("start")
+        if match.group("self_closing"):
+            return TagInfo(tag_name, TagState.SELF_CLOSING)
+
+        # Push new tag onto stack
+        self._tag_stack.append(TagInfo(tag_name, TagState.START))
+        return TagInfo(tag_name, TagState.START)
 
     async def _process_buffer(self) -> AsyncIterator[SentenceWithTags]:
         """
@@ -408,122 +562,76 @@ class SentenceDivider:
         This is now an async generator.
         It consumes processed parts from self._buffer.
         """
-        processed_something = True  # Flag to loop until no more processing can be done
-        while processed_something:
-            processed_something = False
-            original_buffer_len = len(self._buffer)
-
-            if not self._buffer.strip():
-                break
-
-            # Find the next tag position
-            next_tag_pos = len(self._buffer)
-            tag_pattern_found = None
-            for tag in self.valid_tags:
-                patterns = [f"<{tag}>", f"</{tag}>", f"<{tag}/>"]
-                for pattern in patterns:
-                    pos = self._buffer.find(pattern)
-                    if pos != -1 and pos < next_tag_pos:
-                        next_tag_pos = pos
-                        tag_pattern_found = pattern  # Store the found pattern
-
-            if next_tag_pos == 0:
-                # Tag is at the start of buffer
-                tag_info, remaining = self._extract_tag(self._buffer)
-                if tag_info:
-                    processed_text = self._buffer[
-                        : len(self._buffer) - len(remaining)
-                    ].strip()
-                    # Yield the tag itself, represented as a SentenceWithTags
-                    yield SentenceWithTags(text=processed_text, tags=[tag_info])
-                    self._buffer = remaining
-                    processed_something = True
-                    continue  # Restart processing loop for the remaining buffer
-
-            elif next_tag_pos < len(self._buffer):
-                # Tag is in the middle - process text before tag first
-                text_before_tag = self._buffer[:next_tag_pos]
-                current_tags = self._get_current_tags()
-                processed_segment = ""
-
-                # Process complete sentences in text before tag
-                if contains_end_punctuation(text_before_tag):
-                    sentences, remaining_before = self._segment_text(text_before_tag)
+        while self._buffer.strip():
+            current_tags = self._get_current_tags() or [TagInfo("", TagState.NONE)]
+
+            tag_match = self._find_next_tag()
+            if tag_match:
+                text_before_tag = self._buffer[: tag_match.start()]
+                if text_before_tag.strip():
+                    # The tag is a boundary, so everything before it can be yielded
+                    if END_PUNCTUATION_PATTERN.search(text_before_tag):
+                        sentences, remaining = self._segment_text(text_before_tag)
+                        if remaining:
+                            sentences.append(remaining)
+                    else:
+                        sentences = [text_before_tag]
+                    for sentence in sentences:
+                        if sentence.strip():
+                            yield SentenceWithTags(
+                                text=sentence.strip(), tags=current_tags
+                            )
+                    self._consume(tag_match.start())
+                    continue
+
+                # Tag is at the start of buffer: yield the tag itself
+                tag_info = self._apply_tag(tag_match)
+                yield SentenceWithTags(text=tag_match.group(0), tags=[tag_info])
+                self._consume(tag_match.end())
+                continue
+
+            # Handle first sentence with comma if enabled
+            if (
+                self._is_first_sentence
+                and self.faster_first_response
+                and self._find_boundary_punctuation(COMMA_PATTERN)
+            ):
+                sentence, remaining = comma_splitter(self._buffer)
+                if sentence.strip():
+                    yield SentenceWithTags(text=sentence.strip(), tags=current_tags)
+                    self._replace_buffer(remaining)
+                    self._is_first_sentence = False
+                    continue
+
+            # Process normal sentences based on end punctuation
+            if self._find_boundary_punctuation(END_PUNCTUATION_PATTERN):
+                sentences, remaining = self._segment_text(self._buffer)
+                if sentences:  # Only process if segmentation yielded sentences
+                    self._replace_buffer(remaining)
+                    self._is_first_sentence = False
                     for sentence in sentences:
                         if sentence.strip():
                             yield SentenceWithTags(
-                                text=sentence.strip(),
-                                tags=current_tags or [TagInfo("", TagState.NONE)],
+                                text=sentence.strip(), tags=current_tags
                             )
-                    # The part consumed includes sentences + what's left before the tag
-                    processed_segment = text_before_tag
-                    self._buffer = self._buffer[len(processed_segment) :]
-                    processed_something = True
-                    continue  # Restart processing loop
-
-                elif text_before_tag.strip() and tag_pattern_found:
-                    # No sentence end, but content exists AND we found a tag pattern after it.
-                    # We can yield this segment because the tag provides a boundary.
-                    yield SentenceWithTags(
-                        text=text_before_tag.strip(),
-                        tags=current_tags or [TagInfo("", TagState.NONE)],
+                    continue
+
+            # Nothing in the buffer so far ends a sentence; only rescan new text
+            self._punctuation_scan_pos = len(self._buffer)
+
+            # Emit the first fragment at a word boundary if it is taking too long
+            if self._first_chunk_budget_exceeded():
+                fragment, remaining = word_boundary_splitter(self._buffer)
+                if fragment:
+                    logger.debug(
+                        f"First chunk budget exceeded, emitting fragment: '{fragment}'"
                     )
-                    self._buffer = self._buffer[len(text_before_tag) :]
-                    processed_something = True
-                    continue  # Restart processing loop
-                # --- If no tag found after text_before_tag, we wait for more input or end punctuation ---
-
-                # Process the tag itself if we haven't continued
-                tag_info, remaining_after_tag = self._extract_tag(self._buffer)
-                if tag_info:
-                    processed_tag_text = self._buffer[
-                        : len(self._buffer) - len(remaining_after_tag)
-                    ].strip()
-                    yield SentenceWithTags(text=processed_tag_text, tags=[tag_info])
-                    self._buffer = remaining_after_tag
-                    processed_something = True
-                    continue  # Restart processing loop
-
-            # No tags found or tag is not at the beginning/middle of processable segment
-            # Process normal text if buffer has changed or punctuation exists
-            if original_buffer_len > 0:
-                current_tags = self._get_current_tags()
-
-                # Handle first sentence with comma if enabled
-                if (
-                    self._is_first_sentence
-                    and self.faster_first_response
-                    and contains_comma(self._buffer)
-                ):
-                    sentence, remaining = comma_splitter(self._buffer)
-                    if sentence.strip():
-                        yield SentenceWithTags(
-                            text=sentence.strip(),
-                            tags=current_tags or [TagInfo("", TagState.NONE)],
-                        )
-                        self._buffer = remaining
-                        self._is_first_sentence = False
-                        processed_something = True
-                        continue  # Restart processing loop
-
-                # Process normal sentences based on end punctuation
-                if contains_end_punctuation(self._buffer):
-                    sentences, remaining = self._segment_text(self._buffer)
-                    if sentences:  # Only process if segmentation yielded sentences
-                        self._buffer = remaining
-                        self._is_first_sentence = False
-                        processed_something = True
-                        for sentence in sentences:
-                            if sentence.strip():
-                                yield SentenceWithTags(
-                                    text=sentence.strip(),
-                                    tags=current_tags or [TagInfo("", TagState.NONE)],
-                                )
-                        continue  # Restart processing loop
-
-            # If we reached here without processing anything, break the loop
-            if not processed_something:
-                break
+                    yield SentenceWithTags(text=fragment, tags=current_tags)
+                    self._replace_buffer(remaining)
+                    self._is_first_sentence = False
+                    continue
+
+            break
 
     async def _flush_buffer(self) -> AsyncIterator[SentenceWithTags]:
         """
@@ -544,7 +652,7 @@ class SentenceDivider:
                 text=self._buffer.strip(),
                 tags=current_tags or [TagInfo("", TagState.NONE)],
             )
-            self._buffer = ""  # Clear buffer after flushing
+            self._replace_buffer("")  # Clear buffer after flushing
 
     async def process_stream(
         self, segment_stream: AsyncIterator[Union[str, Dict[str, Any]]]
@@ -599,10 +707,22 @@ class SentenceDivider:
         """Segment text using the configured method"""
         if self.segment_method == "regex":
             return segment_text_by_regex(text)
-        return segment_text_by_pysbd(text)
+
+        if self._language_detected:
+            return segment_text_by_language(text, self._language)
+
+        language = detect_language(text)
+        if len(text.strip()) >= LANGUAGE_DETECTION_MIN_CHARS:
+            # Enough text for a reliable guess; reuse it for the rest of the stream
+            self._language = language
+            self._language_detected = True
+        return segment_text_by_language(text, language)
 
     def reset(self):
         """Reset the divider state for a new conversation"""
         self._is_first_sentence = True
-        self._buffer = ""
+        self._replace_buffer("")
         self._tag_stack = []
+        self._first_chunk_started_at = None
+        self._language = None
+        self._language_detected = False
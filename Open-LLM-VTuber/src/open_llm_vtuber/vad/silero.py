@@ -50,6 +50,11 @@ class VADEngine(VADInterface):
         logger.info("Loading Silero-VAD model...")
         return load_silero_vad()
 
+    def warm_up(self) -> None:
+        super().warm_up()
+        # Forget the silence seen during warm-up
+        self.state = StateMachine(self.config)
+
     def detect_speech(self, audio_data: list[float]):
         audio_np = np.array(audio_data, dtype=np.float32)
         for i in range(0, len(audio_np), self.window_size_samples):
@@ -10,3 +10,11 @@ class VADInterface(ABC):
         :return: Returns a sequence of audio bytes containing human voice if voice activity is detected
         """
         pass
+
+    def warm_up(self) -> None:
+        """
+        Run a second of silence through the model to load everything it sets
+        up lazily before the first real audio.
+        """
+        for _ in self.detect_speech([0.0] * 16000):
+            pass
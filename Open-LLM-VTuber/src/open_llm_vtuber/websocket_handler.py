@@ -1,7 +1,6 @@
 from typing import Dict, List, Optional, Callable, TypedDict
 from fastapi import WebSocket, WebSocketDisconnect
 import asyncio
-import json
 from enum import Enum
 import numpy as np
 from loguru import logger
@@ -13,6 +12,7 @@ from .chat_group import (
     handle_client_disconnect,
     broadcast_to_group,
 )
+from .client_outbox import ClientOutbox, QueuedWebSocket
 from .message_handler import message_handler
 from .utils.stream_audio import prepare_audio_payload
 from .chat_history_manager import (
@@ -27,6 +27,8 @@ from .conversations.conversation_handler import (
     handle_group_interrupt,
     handle_individual_interrupt,
 )
+from .conversations.conversation_scheduler import ConversationScheduler
+from .utils import json_codec
 
 
 class MessageType(Enum):
@@ -66,10 +68,12 @@ class WebSocketHandler:
         """Initialize the WebSocket handler with default context"""
         self.client_connections: Dict[str, WebSocket] = {}
         self.client_contexts: Dict[str, ServiceContext] = {}
+        self.client_outboxes: Dict[str, ClientOutbox] = {}
         self.chat_group_manager = ChatGroupManager()
         self.current_conversation_tasks: Dict[str, Optional[asyncio.Task]] = {}
         self.default_context_cache = default_context_cache
         self.received_data_buffers: Dict[str, np.ndarray] = {}
+        self._conversation_scheduler: Optional[ConversationScheduler] = None
 
         # Message handlers mapping
         self._message_handlers = self._init_message_handlers()
@@ -106,6 +110,9 @@ class WebSocketHandler:
         """
         Handle new WebSocket connection setup
 
+        All messages to the client are sent through its outbound queue,
+        drained by a dedicated writer task.
+
         Args:
             websocket: The WebSocket connection
             client_uid: Unique identifier for the client
@@ -114,6 +121,8 @@ class WebSocketHandler:
             Exception: If initialization fails
         """
         try:
+            websocket = self._create_queued_websocket(websocket, client_uid)
+
             session_service_context = await self._init_service_context(
                 websocket.send_text, client_uid
             )
@@ -149,6 +158,30 @@ class WebSocketHandler:
         self.chat_group_manager.client_group_map[client_uid] = ""
         await self.send_group_update(websocket, client_uid)
 
+    def _create_queued_websocket(
+        self, websocket: WebSocket, client_uid: str
+    ) -> QueuedWebSocket:
+        """Start the outbound queue of a client and wrap its WebSocket"""
+
+        async def close_slow_client() -> None:
+            try:
+                await asyncio.wait_for(
+                    websocket.close(code=1013, reason="Client too slow"),
+                    timeout=5.0,
+                )
+            except Exception as e:
+                logger.debug(f"Failed to close slow client {client_uid}: {e}")
+
+        outbox = ClientOutbox(
+            client_uid,
+            websocket.send_text,
+            config=self.default_context_cache.system_config.send_queue,
+            on_slow_client=close_slow_client,
+        )
+        outbox.start()
+        self.client_outboxes[client_uid] = outbox
+        return QueuedWebSocket(websocket, outbox)
+
     async def _send_initial_messages(
         self,
         websocket: WebSocket,
@@ -157,11 +190,11 @@ class WebSocketHandler:
     ):
         """Send initial connection messages to the client"""
         await websocket.send_text(
-            json.dumps({"type": "full-text", "text": "Connection established"})
+            json_codec.dumps({"type": "full-text", "text": "Connection established"})
         )
 
         await websocket.send_text(
-            json.dumps(
+            json_codec.dumps(
                 {
                     "type": "set-model-and-conf",
                     "model_info": session_service_context.live2d_model.model_info,
@@ -176,7 +209,9 @@ class WebSocketHandler:
         await self.send_group_update(websocket, client_uid)
 
         # Start microphone
-        await websocket.send_text(json.dumps({"type": "control", "text": "start-mic"}))
+        await websocket.send_text(
+            json_codec.dumps({"type": "control", "text": "start-mic"})
+        )
 
     async def _init_service_context(
         self, send_text: Callable, client_uid: str
@@ -199,6 +234,7 @@ class WebSocketHandler:
             translate_engine=self.default_context_cache.translate_engine,
             mcp_server_registery=self.default_context_cache.mcp_server_registery,
             tool_adapter=self.default_context_cache.tool_adapter,
+            mcp_session_pool=self.default_context_cache.mcp_session_pool,
             send_text=send_text,
             client_uid=client_uid,
         )
@@ -214,21 +250,23 @@ class WebSocketHandler:
             websocket: The WebSocket connection
             client_uid: Unique identifier for the client
         """
+        # Send through the client's outbound queue
+        websocket = self.client_connections.get(client_uid, websocket)
         try:
             while True:
                 try:
-                    data = await websocket.receive_json()
+                    data = await json_codec.receive(websocket)
                     message_handler.handle_message(client_uid, data)
                     await self._route_message(websocket, client_uid, data)
                 except WebSocketDisconnect:
                     raise
-                except json.JSONDecodeError:
+                except json_codec.JSONDecodeError:
                     logger.error("Invalid JSON received")
                     continue
                 except Exception as e:
                     logger.error(f"Error processing message: {e}")
                     await websocket.send_text(
-                        json.dumps({"type": "error", "message": str(e)})
+                        json_codec.dumps({"type": "error", "message": str(e)})
                     )
                     continue
 
@@ -291,6 +329,7 @@ class WebSocketHandler:
                 chat_group_manager=self.chat_group_manager,
                 client_contexts=self.client_contexts,
                 broadcast_to_group=self.broadcast_to_group,
+                client_outboxes=self.client_outboxes,
             )
 
         await handle_client_disconnect(
@@ -303,6 +342,7 @@ class WebSocketHandler:
         # Clean up other client data
         self.client_connections.pop(client_uid, None)
         self.client_contexts.pop(client_uid, None)
+        await self._close_outbox(client_uid)
         self.received_data_buffers.pop(client_uid, None)
         if client_uid in self.current_conversation_tasks:
             task = self.current_conversation_tasks[client_uid]
@@ -322,6 +362,7 @@ class WebSocketHandler:
         """Clean up failed connection data"""
         self.client_connections.pop(client_uid, None)
         self.client_contexts.pop(client_uid, None)
+        await self._close_outbox(client_uid)
         self.received_data_buffers.pop(client_uid, None)
         self.chat_group_manager.client_group_map.pop(client_uid, None)
 
@@ -333,15 +374,30 @@ class WebSocketHandler:
 
         message_handler.cleanup_client(client_uid)
 
+    async def _close_outbox(self, client_uid: str) -> None:
+        """Stop the outbound queue of a client and log its metrics"""
+        outbox = self.client_outboxes.pop(client_uid, None)
+        if outbox:
+            await outbox.aclose()
+            logger.info(f"Outbound queue stats for {client_uid}: {outbox.get_stats()}")
+
+    def get_outbound_queue_stats(self) -> Dict[str, dict]:
+        """Get the outbound queue metrics of every connected client"""
+        return {
+            client_uid: outbox.get_stats()
+            for client_uid, outbox in self.client_outboxes.items()
+        }
+
     async def broadcast_to_group(
         self, group_members: list[str], message: dict, exclude_uid: str = None
     ) -> None:
-        """Broadcasts a message to group members"""
+        """Broadcasts a message to group members through their outbound queues"""
         await broadcast_to_group(
             group_members=group_members,
             message=message,
             client_connections=self.client_connections,
             exclude_uid=exclude_uid,
+            client_outboxes=self.client_outboxes,
         )
 
     async def send_group_update(self, websocket: WebSocket, client_uid: str):
@@ -350,7 +406,7 @@ class WebSocketHandler:
         if group:
             current_members = self.chat_group_manager.get_group_members(client_uid)
             await websocket.send_text(
-                json.dumps(
+                json_codec.dumps(
                     {
                         "type": "group-update",
                         "members": current_members,
@@ -360,7 +416,7 @@ class WebSocketHandler:
             )
         else:
             await websocket.send_text(
-                json.dumps(
+                json_codec.dumps(
                     {
                         "type": "group-update",
                         "members": [],
@@ -385,6 +441,7 @@ class WebSocketHandler:
                 chat_group_manager=self.chat_group_manager,
                 client_contexts=self.client_contexts,
                 broadcast_to_group=self.broadcast_to_group,
+                client_outboxes=self.client_outboxes,
             )
         else:
             await handle_individual_interrupt(
@@ -392,6 +449,7 @@ class WebSocketHandler:
                 current_conversation_tasks=self.current_conversation_tasks,
                 context=context,
                 heard_response=heard_response,
+                client_outboxes=self.client_outboxes,
             )
 
     async def _handle_history_list_request(
@@ -401,7 +459,7 @@ class WebSocketHandler:
         context = self.client_contexts[client_uid]
         histories = get_history_list(context.character_config.conf_uid)
         await websocket.send_text(
-            json.dumps({"type": "history-list", "histories": histories})
+            json_codec.dumps({"type": "history-list", "histories": histories})
         )
 
     async def _handle_fetch_history(
@@ -429,7 +487,7 @@ class WebSocketHandler:
             if msg["role"] != "system"
         ]
         await websocket.send_text(
-            json.dumps({"type": "history-data", "messages": messages})
+            json_codec.dumps({"type": "history-data", "messages": messages})
         )
 
     async def _handle_create_history(
@@ -445,7 +503,7 @@ class WebSocketHandler:
                 history_uid=history_uid,
             )
             await websocket.send_text(
-                json.dumps(
+                json_codec.dumps(
                     {
                         "type": "new-history-created",
                         "history_uid": history_uid,
@@ -467,7 +525,7 @@ class WebSocketHandler:
             history_uid,
         )
         await websocket.send_text(
-            json.dumps(
+            json_codec.dumps(
                 {
                     "type": "history-deleted",
                     "success": success,
@@ -499,7 +557,7 @@ class WebSocketHandler:
             for audio_bytes in context.vad_engine.detect_speech(chunk):
                 if audio_bytes == b"<|PAUSE|>":
                     await websocket.send_text(
-                        json.dumps({"type": "control", "text": "interrupt"})
+                        json_codec.dumps({"type": "control", "text": "interrupt"})
                     )
                 elif audio_bytes == b"<|RESUME|>":
                     pass
@@ -510,7 +568,7 @@ class WebSocketHandler:
                         np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32),
                     )
                     await websocket.send_text(
-                        json.dumps({"type": "control", "text": "mic-audio-end"})
+                        json_codec.dumps({"type": "control", "text": "mic-audio-end"})
                     )
 
     async def _handle_conversation_trigger(
@@ -529,8 +587,19 @@ class WebSocketHandler:
             received_data_buffers=self.received_data_buffers,
             current_conversation_tasks=self.current_conversation_tasks,
             broadcast_to_group=self.broadcast_to_group,
+            conversation_scheduler=self.conversation_scheduler,
         )
 
+    @property
+    def conversation_scheduler(self) -> ConversationScheduler:
+        """Admission control shared by the conversations of all clients"""
+        if self._conversation_scheduler is None:
+            # Created on first use, once the system config has been loaded
+            self._conversation_scheduler = ConversationScheduler(
+                self.default_context_cache.system_config.conversation_scheduler
+            )
+        return self._conversation_scheduler
+
     async def _handle_fetch_configs(
         self, websocket: WebSocket, client_uid: str, data: WSMessage
     ) -> None:
@@ -538,7 +607,7 @@ class WebSocketHandler:
         context = self.client_contexts[client_uid]
         config_files = scan_config_alts_directory(context.system_config.config_alts_dir)
         await websocket.send_text(
-            json.dumps({"type": "config-files", "configs": config_files})
+            json_codec.dumps({"type": "config-files", "configs": config_files})
         )
 
     async def _handle_config_switch(
@@ -556,7 +625,7 @@ class WebSocketHandler:
         """Handle fetching available background images"""
         bg_files = scan_bg_directory()
         await websocket.send_text(
-            json.dumps({"type": "background-files", "files": bg_files})
+            json_codec.dumps({"type": "background-files", "files": bg_files})
         )
 
     async def _handle_audio_play_start(
@@ -594,7 +663,7 @@ class WebSocketHandler:
             context = self.default_context_cache
 
         await websocket.send_text(
-            json.dumps(
+            json_codec.dumps(
                 {
                     "type": "set-model-and-conf",
                     "model_info": context.live2d_model.model_info,
@@ -624,7 +693,7 @@ class WebSocketHandler:
         goal = data.get("goal", "")
         if not goal:
             await websocket.send_text(
-                json.dumps({
+                json_codec.dumps({
                     "type": "computer_use_error",
                     "error": "No goal provided for computer use session"
                 })
@@ -634,7 +703,7 @@ class WebSocketHandler:
         context = self.client_contexts.get(client_uid)
         if not context:
             await websocket.send_text(
-                json.dumps({
+                json_codec.dumps({
                     "type": "computer_use_error",
                     "error": "No service context found"
                 })
@@ -644,7 +713,7 @@ class WebSocketHandler:
         # Check if computer use is enabled in config
         if not context.config.computer_use_config.enabled:
             await websocket.send_text(
-                json.dumps({
+                json_codec.dumps({
                     "type": "computer_use_error",
                     "error": "Computer Use is not enabled. Enable it in settings first."
                 })
@@ -669,7 +738,7 @@ class WebSocketHandler:
 
             # Start the session
             await websocket.send_text(
-                json.dumps({
+                json_codec.dumps({
                     "type": "computer_use_start",
                     "goal": goal,
                     "message": "Computer use session started"
@@ -682,7 +751,7 @@ class WebSocketHandler:
         except ImportError as e:
             logger.warning(f"Computer use module not available: {e}")
             await websocket.send_text(
-                json.dumps({
+                json_codec.dumps({
                     "type": "computer_use_error",
                     "error": "Computer use module not available"
                 })
@@ -690,7 +759,7 @@ class WebSocketHandler:
         except Exception as e:
             logger.error(f"Error starting computer use session: {e}")
             await websocket.send_text(
-                json.dumps({
+                json_codec.dumps({
                     "type": "computer_use_error",
                     "error": str(e)
                 })
@@ -706,14 +775,14 @@ class WebSocketHandler:
             del self.computer_use_sessions[client_uid]
 
             await websocket.send_text(
-                json.dumps({
+                json_codec.dumps({
                     "type": "session_end",
                     "message": "Computer use session stopped by user"
                 })
             )
         else:
             await websocket.send_text(
-                json.dumps({
+                json_codec.dumps({
                     "type": "computer_use_error",
                     "error": "No active computer use session to stop"
                 })
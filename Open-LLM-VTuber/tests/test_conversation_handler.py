@@ -0,0 +1,89 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from open_llm_vtuber.config_manager.system import ConversationSchedulerConfig
+from open_llm_vtuber.conversations import conversation_handler
+from open_llm_vtuber.conversations.conversation_scheduler import (
+    ConversationScheduler,
+)
+
+
+class RecordingAgent:
+    def __init__(self):
+        self.interrupts = []
+
+    def handle_interrupt(self, heard_response: str) -> None:
+        self.interrupts.append(heard_response)
+
+
+def make_context() -> SimpleNamespace:
+    return SimpleNamespace(
+        agent_engine=RecordingAgent(),
+        history_uid="history",
+        character_config=SimpleNamespace(
+            conf_uid="conf", character_name="AI", avatar=None
+        ),
+    )
+
+
+async def noop_notify(message) -> None:
+    pass
+
+
+async def run_forever() -> None:
+    await asyncio.Event().wait()
+
+
+@pytest.fixture
+def stored_messages(monkeypatch):
+    stored = []
+    monkeypatch.setattr(
+        conversation_handler, "store_message", lambda **kwargs: stored.append(kwargs)
+    )
+    return stored
+
+
+@pytest.mark.parametrize("queued", [False, True])
+def test_interrupt_records_only_started_turns(stored_messages, queued):
+    context = make_context()
+
+    async def run():
+        scheduler = ConversationScheduler(
+            ConversationSchedulerConfig(max_concurrent_turns=1, max_queue_wait=0)
+        )
+        tasks = {}
+        if queued:
+            # Another client holds the only slot
+            tasks["other"] = asyncio.create_task(
+                conversation_handler._schedule_turn(
+                    scheduler, "other", run_forever, noop_notify
+                )
+            )
+        tasks["client"] = asyncio.create_task(
+            conversation_handler._schedule_turn(
+                scheduler, "client", run_forever, noop_notify
+            )
+        )
+        await asyncio.sleep(0)
+
+        await conversation_handler.handle_individual_interrupt(
+            "client", tasks, context, "heard"
+        )
+        assert tasks["client"].cancelled()
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    asyncio.run(run())
+
+    if queued:
+        assert context.agent_engine.interrupts == []
+        assert stored_messages == []
+    else:
+        assert context.agent_engine.interrupts == ["heard"]
+        assert [m["content"] for m in stored_messages] == [
+            "heard",
+            "[Interrupted by user]",
+        ]
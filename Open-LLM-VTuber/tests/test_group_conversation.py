@@ -0,0 +1,92 @@
+import asyncio
+from types import SimpleNamespace
+
+from open_llm_vtuber.agent.agents.agent_interface import AgentInterface
+from open_llm_vtuber.conversations import group_conversation
+from open_llm_vtuber.conversations.types import GroupConversationState
+
+
+class MemoryAgent(AgentInterface):
+    """Agent whose memory is a plain list of (role, content) pairs."""
+
+    def __init__(self):
+        self.memory = []
+
+    async def chat(self, input_data):
+        yield None
+
+    def handle_interrupt(self, heard_response: str) -> None:
+        pass
+
+    def set_memory_from_history(self, conf_uid: str, history_uid: str) -> None:
+        pass
+
+    def get_memory_checkpoint(self) -> int:
+        return len(self.memory)
+
+    def restore_memory_checkpoint(self, checkpoint: int) -> None:
+        del self.memory[checkpoint:]
+
+
+def make_context(name: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        agent_engine=MemoryAgent(),
+        asr_engine=None,
+        history_uid=None,
+        character_config=SimpleNamespace(
+            character_name=name, human_name="Human", conf_uid=name, avatar=None
+        ),
+    )
+
+
+async def noop_send(*args, **kwargs) -> None:
+    pass
+
+
+def test_interrupt_drops_prepared_turn(monkeypatch):
+    """A turn generated while the previous member is still speaking must not
+    stay in its member's memory when the conversation is interrupted."""
+    members = ["a", "b"]
+    contexts = {uid: make_context(uid.upper()) for uid in members}
+    connections = {uid: SimpleNamespace(send_text=noop_send) for uid in members}
+
+    async def respond(context, batch_input, **kwargs):
+        reply = f"reply from {context.character_config.character_name}"
+        context.agent_engine.memory.append(("user", batch_input.texts[0].content))
+        context.agent_engine.memory.append(("assistant", reply))
+        return reply
+
+    async def play_forever(**kwargs):
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(group_conversation, "process_member_response", respond)
+    monkeypatch.setattr(group_conversation, "finish_group_member_turn", play_forever)
+    monkeypatch.setattr(group_conversation, "store_message", lambda **kwargs: None)
+
+    async def run():
+        task = asyncio.create_task(
+            group_conversation.process_group_conversation(
+                client_contexts=contexts,
+                client_connections=connections,
+                broadcast_func=noop_send,
+                group_members=members,
+                initiator_client_uid="a",
+                user_input="hi",
+            )
+        )
+        # Let A start playing and B generate its response in the background
+        for _ in range(20):
+            await asyncio.sleep(0)
+        state = GroupConversationState.get_state("group_a")
+        assert contexts["b"].agent_engine.memory, "B should be prepared by now"
+        history = list(state.conversation_history)
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return history
+
+    history = asyncio.run(run())
+
+    assert history == ["Human: hi", "A: reply from A"]
+    assert contexts["a"].agent_engine.memory[-1] == ("assistant", "reply from A")
+    assert contexts["b"].agent_engine.memory == []
@@ -0,0 +1,57 @@
+import time
+
+import pytest
+
+from open_llm_vtuber.mcpp.json_detector import StreamJSONDetector
+
+
+def detect(text: str, chunk_size: int = 1):
+    detector = StreamJSONDetector()
+    found = []
+    for i in range(0, len(text), chunk_size):
+        found.extend(detector.process_chunk(text[i : i + chunk_size]))
+    return found
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        (
+            'Here: {"name": "x", "values": [1, 2.5, true, null]}',
+            [{"name": "x", "values": [1, 2.5, True, None]}],
+        ),
+        (
+            '{"tool": {"name": "x"}} and {"b": "}"}',
+            [
+                {"tool": {"name": "x"}},
+                {"b": "}"},
+            ],
+        ),
+        ('{ "name" : "spaced" }', [{"name": "spaced"}]),
+        # Stray braces in prose must not hide later objects
+        ('a { b {"name":"x"}', [{"name": "x"}]),
+        (
+            'Sure { I will call it: {"name": "search", "arguments": {}} done',
+            [{"name": "search", "arguments": {}}],
+        ),
+        ('{"a": 1, {"name": "x"}', [{"name": "x"}]),
+        ('{"a": {"name": "x"} oops {"b": 2}', [{"name": "x"}, {"b": 2}]),
+        ("set {x} then {}", [{}]),
+        # A brace in a string of an invalid object can still start one
+        ('{"note {"name": "x"}', [{"name": "x"}]),
+        ('{"a": {"b": {"c": 1}, x {"d": 2}', [{"c": 1}, {"d": 2}]),
+    ],
+)
+def test_detects_objects(text, expected, chunk_size):
+    assert detect(text, chunk_size) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1000])
+def test_deeply_nested_invalid_prefix_is_scanned_in_linear_time(chunk_size):
+    text = '{"a": ' * 4000 + 'x {"name": "x"}'
+
+    start = time.perf_counter()
+    assert detect(text, chunk_size) == [{"name": "x"}]
+    # Rescanning the prefix once per nesting level takes seconds
+    assert time.perf_counter() - start < 1.0
@@ -0,0 +1,79 @@
+import pytest
+
+from open_llm_vtuber.computer_use.types import ScreenCapture
+from open_llm_vtuber.computer_use.vision_engine import VisionEngine
+
+Image = pytest.importorskip("PIL.Image")
+ImageDraw = pytest.importorskip("PIL.ImageDraw")
+
+# Default screen_change_threshold of ComputerUseConfig
+SCREEN_CHANGE_THRESHOLD = 0.005
+SIZE = (1280, 720)
+
+
+def make_screen() -> "Image.Image":
+    """A light window with a text field holding some text."""
+    img = Image.new("RGB", SIZE, (240, 240, 240))
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((100, 100, 700, 130), fill=(255, 255, 255), outline=(120, 120, 120))
+    draw.text((106, 110), "Hello wor", fill=(0, 0, 0))
+    draw.rectangle((100, 200, 112, 212), outline=(60, 60, 60))
+    return img
+
+
+def capture(engine: VisionEngine, img) -> ScreenCapture:
+    return ScreenCapture(
+        image_base64="",
+        width=img.width,
+        height=img.height,
+        original_width=img.width,
+        original_height=img.height,
+        fingerprint=engine._compute_fingerprint(img),
+    )
+
+
+@pytest.fixture
+def engine():
+    return VisionEngine()
+
+
+def test_identical_screens_are_unchanged(engine):
+    change = engine.compare_captures(
+        capture(engine, make_screen()), capture(engine, make_screen())
+    )
+    assert change.changed_fraction == 0.0
+    assert change.region is None
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [
+        # One more typed character
+        lambda draw: draw.text((106, 110), "Hello worl", fill=(0, 0, 0)),
+        # A caret in the text field
+        lambda draw: draw.line((170, 108, 170, 122), fill=(0, 0, 0)),
+        # A ticked checkbox
+        lambda draw: draw.line((102, 206, 106, 210, 110, 202), fill=(0, 0, 0)),
+    ],
+    ids=["typed-character", "caret", "checkbox"],
+)
+def test_small_changes_are_detected(engine, edit):
+    before = make_screen()
+    after = make_screen()
+    edit(ImageDraw.Draw(after))
+
+    change = engine.compare_captures(capture(engine, before), capture(engine, after))
+
+    assert change.changed_fraction >= SCREEN_CHANGE_THRESHOLD
+    x, y, width, height = change.region
+    assert 60 <= x <= 180 and 80 <= y <= 230
+    assert width < 200 and height < 200
+
+
+def test_large_change_covers_most_of_the_screen(engine):
+    before = make_screen()
+    after = Image.new("RGB", SIZE, (20, 20, 20))
+
+    change = engine.compare_captures(capture(engine, before), capture(engine, after))
+
+    assert change.changed_fraction > 0.9